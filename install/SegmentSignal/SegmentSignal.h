@@ -59,6 +59,8 @@ namespace Algorithms
 			/// Segment a signal using the Maximum Likelihood Estimation of Radhakrishnan, et al, 1991.  Attempts to identify regions of the signal that are
 			/// considered "consistent."  Assumes a signal that has a state which changes only at segment boundaries.  The state change can be random and the
 			/// noise on top of the signal is modeled as Gaussian, but not necessarily stationary.
+			/// 
+			/// Uses a single thread.
 			/// </summary>
 			/// <param name="signal">Input signal to be segmented.</param>
 			/// <param name="signalLength">Input signal to be segmented.</param>
@@ -74,6 +76,26 @@ namespace Algorithms
 			/// <returns>A SegmentationResults instance which contains the algorithm output of binary events, segmented log, filtered log, et cetera.</returns>
 			static SegmentationResults* Segment(double signal[], int signalLength, double threshold, int jumpSequenceWindowSize, int noiseVarianceWindowSize, NoiseVarianceEstimateMethod noiseVarianceEstimateMethod, int maxSMLRIterations);
 
+			/// <summary>
+			/// Segment a signal using the Maximum Likelihood Estimation of Radhakrishnan, et al, 1991.  Attempts to identify regions of the signal that are
+			/// considered "consistent."  Assumes a signal that has a state which changes only at segment boundaries.  The state change can be random and the
+			/// noise on top of the signal is modeled as Gaussian, but not necessarily stationary.
+			/// </summary>
+			/// <param name="signal">Input signal to be segmented.</param>
+			/// <param name="signalLength">Input signal to be segmented.</param>
+			/// <param name="threshold">Segmentation threshold.</param>
+			/// <param name="jumpSequenceWindowSize">Length of the moving average window sized used for smoothing the input well log to arrive at an initial estimate of the jump sequence variance.</param>
+			/// <param name="noiseVarianceWindowSize">Length of the moving average window used for smoothing the noise variances.</param>
+			/// <param name="noiseVarianceEstimateMethod">
+			/// Noise variance estimate option.
+			//		rmode = 0 ==> Point estimate of noise variance.
+			//		rmode = 1 ==> Noise estimates smoothed within segments.
+			/// </param>
+			/// <param name="maxSMLRIterations">Upper bound on the number of Single Most Likelihood Replacement iterations.</param>
+			/// <param name="numberOfThreads">Number of OpenMP threads used for the passes over the signal.  Zero uses the OpenMP default (all cores).  The results do not depend on the number of threads.  The end to end speedup is small because the Kalman filter and smoother are sequential and dominate the run time.</param>
+			/// <returns>A SegmentationResults instance which contains the algorithm output of binary events, segmented log, filtered log, et cetera.</returns>
+			static SegmentationResults* Segment(double signal[], int signalLength, double threshold, int jumpSequenceWindowSize, int noiseVarianceWindowSize, NoiseVarianceEstimateMethod noiseVarianceEstimateMethod, int maxSMLRIterations, int numberOfThreads);
+
 			/// <summary>
 			/// Segment a signal using the Maximum Likelihood Estimation of Radhakrishnan, et al, 1991.  Attempts to identify regions of the signal that are
 			/// considered "consistent."  Assumes a signal that has a state which changes only at segment boundaries.  The state change can be random and the
@@ -116,6 +138,8 @@ namespace Algorithms
 			/// Segment a signal using the Maximum Likelihood Estimation of Radhakrishnan, et al, 1991.  Attempts to identify regions of the signal that are
 			/// considered "consistent."  Assumes a signal that has a state which changes only at segment boundaries.  The state change can be random and the
 			/// noise on top of the signal is modeled as Gaussian, but not necessarily stationary.
+			/// 
+			/// Uses a single thread.
 			/// </summary>
 			/// <param name="signal">Input signal to be segmented.</param>
 			/// <param name="threshold">Segmentation threshold.</param>
@@ -130,6 +154,25 @@ namespace Algorithms
 			/// <returns>A SegmentationResults instance which contains the algorithm output of binary events, segmented log, filtered log, et cetera.</returns>
 			static SegmentationResults* Segment(vector<double> signal, double threshold, int jumpSequenceWindowSize, int noiseVarianceWindowSize, NoiseVarianceEstimateMethod noiseVarianceEstimateMethod, int maxSMLRIterations);
 
+			/// <summary>
+			/// Segment a signal using the Maximum Likelihood Estimation of Radhakrishnan, et al, 1991.  Attempts to identify regions of the signal that are
+			/// considered "consistent."  Assumes a signal that has a state which changes only at segment boundaries.  The state change can be random and the
+			/// noise on top of the signal is modeled as Gaussian, but not necessarily stationary.
+			/// </summary>
+			/// <param name="signal">Input signal to be segmented.</param>
+			/// <param name="threshold">Segmentation threshold.</param>
+			/// <param name="jumpSequenceWindowSize">Length of the moving average window sized used for smoothing the input well log to arrive at an initial estimate of the jump sequence variance.</param>
+			/// <param name="noiseVarianceWindowSize">Length of the moving average window used for smoothing the noise variances.</param>
+			/// <param name="noiseVarianceEstimateMethod">
+			/// Noise variance estimate option.
+			//		rmode = 0 ==> Point estimate of noise variance.
+			//		rmode = 1 ==> Noise estimates smoothed within segments.
+			/// </param>
+			/// <param name="maxSMLRIterations">Upper bound on the number of Single Most Likelihood Replacement iterations.</param>
+			/// <param name="numberOfThreads">Number of OpenMP threads used for the passes over the signal.  Zero uses the OpenMP default (all cores).  The results do not depend on the number of threads.  The end to end speedup is small because the Kalman filter and smoother are sequential and dominate the run time.</param>
+			/// <returns>A SegmentationResults instance which contains the algorithm output of binary events, segmented log, filtered log, et cetera.</returns>
+			static SegmentationResults* Segment(vector<double> signal, double threshold, int jumpSequenceWindowSize, int noiseVarianceWindowSize, NoiseVarianceEstimateMethod noiseVarianceEstimateMethod, int maxSMLRIterations, int numberOfThreads);
+
 			/// <summary>
 			/// Creates a list of indexes which indicate where the "significant zones" are in the results of the segmentation.  A significant
 			/// zone is defined as a region between binary events (for example 1,0,0,0,1 is a region/zone of 3) that are longer than the
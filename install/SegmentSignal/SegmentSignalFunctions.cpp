@@ -4,8 +4,22 @@
 #include <windows.h>
 #include <malloc.h>
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+// The "simd" directive was added in OpenMP 4.0.  Older implementations (e.g., the OpenMP 2.0 of Visual C++) do not get the hint.
+#if defined(_OPENMP) && _OPENMP >= 201307
+#define OMP_SIMD _Pragma("omp simd")
+#else
+#define OMP_SIMD
+#endif
+
+// Number of samples in each block of the parallel loops.  The blocks do not depend on the number of threads, so neither do the results.
+const int BLOCKSIZE = 8192;
+
 // Original function name: LOGSEG
-void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, int RMODE, int NITER, double Q[], int& NQ, double FLTLOG[], double SEGLOG[], double R[], double& C, double& D, int& NACT, int& IER)
+void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, int RMODE, int NITER, double Q[], int& NQ, double FLTLOG[], double SEGLOG[], double R[], double& C, double& D, int& NACT, int& IER, int NTHREADS)
 {
 	// Function:
 	// Maximum Likelihood Segmentation
@@ -51,7 +65,21 @@ void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, in
 	//		IER > 0 ==> Logarithm argument became zero at sample number IER during the calculation of
 	//			likelihood ratios in SingleMostLikelihoodReplacement.  There may be more samples of this type which may give rise
 	//			to this problem.  Edit/rescale data values and rerun.
-	
+	//
+	// NTHREADS: Number of threads used by the parallel loops.
+	//		NTHREADS < 1 ==> The OpenMP default (all cores).
+
+	// The number of threads is passed to each parallel loop (the "num_threads" clause) instead of being set with
+	// "omp_set_num_threads", which would change the setting of the whole process for other callers.
+#ifdef _OPENMP
+	if (NTHREADS < 1)
+	{
+		NTHREADS = omp_get_max_threads();
+	}
+#else
+	NTHREADS = 1;
+#endif
+
 	// Intermediate work arrays.
 	double* WORK1 = (double*)malloc(NSAMPS * sizeof(double));
 	double* WORK2 = (double*)malloc(NSAMPS * sizeof(double));
@@ -80,19 +108,30 @@ void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, in
 	double UBOUND	= 0.98;
 
 	// Smooth input log using an HORDER point moving average (HORDER is number of points).
-	MovingAverage(LOG, NSAMPS, HORDER, SEGLOG);
+	MovingAverage(LOG, NSAMPS, HORDER, SEGLOG, NTHREADS);
 
 	// Initial estimate of c the variance of the jump sequence.
-	EstimateVarianceOfJumpSequence(SEGLOG, NSAMPS, WORK1, C);
+	EstimateVarianceOfJumpSequence(SEGLOG, NSAMPS, WORK1, C, NTHREADS);
 
 	// Estimate R, the variance of the noise.
-	for (int i = 0; i < NSAMPS; i++)
+	int NBLOCKS = NumberOfBlocks(NSAMPS);
+
+	#pragma omp parallel for num_threads(NTHREADS) if(NBLOCKS > 1)
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
 	{
-		SEGLOG[i] = (LOG[i]-SEGLOG[i]) * (LOG[i]-SEGLOG[i]);
+		int START;
+		int END;
+		GetBlock(BLOCK, NSAMPS, START, END);
+
+		OMP_SIMD
+		for (int i = START; i < END; i++)
+		{
+			SEGLOG[i] = (LOG[i]-SEGLOG[i]) * (LOG[i]-SEGLOG[i]);
+		}
 	}
 
 	// Smooth the variance of the noise using an NORDER point moving average.
-	MovingAverage(SEGLOG, NSAMPS, NORDER, R);
+	MovingAverage(SEGLOG, NSAMPS, NORDER, R, NTHREADS);
 
 	// Bootstrap event sequence.
 	for (int i = 0; i < 2; i++)
@@ -109,20 +148,20 @@ void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, in
 		FixedIntervalOptimalSmoother(Q, NSAMPS, C, SEGLOG, WORK1, WORK2);
 
 		// Re-estimate the variance of the jump sequence C.
-		CalculateMeanAndVariance(SEGLOG, NSAMPS, VMODE, MEAN, C);
+		CalculateMeanAndVariance(SEGLOG, NSAMPS, VMODE, MEAN, C, NTHREADS);
 		
-		// Invoke threshold detector and update the event sequence.
-		Threshold(SEGLOG, C, F, NSAMPS, Q, D);
+		// Invoke threshold detector and update the event sequence.  The events are counted as they are detected.
+		Threshold(SEGLOG, C, F, NSAMPS, Q, D, NQ, NTHREADS);
+
+		// Deglitch the event sequence Q.  The events removed are subtracted from the count.
+		Deglitch(NSAMPS, Q, NQ);
 
-		// Deglitch the event sequence Q.
-		Deglitch(NSAMPS, Q);
-		
 		// Update d, the event density.
-		EstimateEventDensity(Q, NSAMPS, D, NQ);
+		D = (double)NQ / (double)NSAMPS;
 		C = C / D;
 		
 		// Deglitch and re-estimate R, the variance of noise.
-		DeglitchAndEstimateNoiseVariance(LOG, Q, NSAMPS, RMODE, SEGLOG, R);
+		DeglitchAndEstimateNoiseVariance(LOG, Q, NSAMPS, RMODE, SEGLOG, R, NTHREADS);
 	}
 
 	// Trap event density if invalid.
@@ -143,11 +182,11 @@ void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, in
 
 			FixedIntervalOptimalSmoother(Q, NSAMPS, C, SEGLOG, WORK1, WORK2);
 
-			// Invoke Single Most Likelihood Replacement detector.
-			SingleMostLikelihoodReplacement(WORK2, WORK1, C, NSAMPS, D, Q, CONV, IER);
+			// Invoke Single Most Likelihood Replacement detector.  It updates the count of the event it replaces.
+			SingleMostLikelihoodReplacement(WORK2, WORK1, C, NSAMPS, D, Q, NQ, CONV, IER, NTHREADS);
 
 			// Update event density d.
-			EstimateEventDensity(Q, NSAMPS, D, NQ);
+			D = (double)NQ / (double)NSAMPS;
 
 		}
 		// Check for SingleMostLikelihoodReplacement termination.
@@ -170,7 +209,7 @@ void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, in
 }
 
 // Original function name: SMLR
-void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMPS, double D, double Q[], bool& CONV, int& IER)
+void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMPS, double D, double Q[], int& NQ, bool& CONV, int& IER, int NTHREADS)
 {
 	// Function:
 	// Single most likelihood replacement detector for updating an event sequence Q(k).
@@ -186,9 +225,13 @@ void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMP
 	//
 	// D: Segment density.
 	//
+	// NTHREADS: Number of threads used by the parallel loop.
+	//
 	// Input/output parameters:
 	// Q: Binary event sequence.  This sequence is updated by SingleMostLikelihoodReplacement.
 	//
+	// NQ: Number of binary events (number of "1"s in Q).  Updated for the replaced event.
+	//
 	// Output parameters:
 	// CONV: Convergence flag.
 	//		CONV = 0 => No convergence.
@@ -208,32 +251,77 @@ void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMP
 	int INDSTR		= 0;
 	double GLOBAL	= 0;
 
+	// Each block finds its own maximum and first error.  The blocks are combined in order, so the result is the first maximum
+	// (and the first error) of the whole sequence, the same as a single loop.
+	int NBLOCKS			= NumberOfBlocks(NSAMPS);
+	double* BLOCKGLOBAL	= (double*)malloc(NBLOCKS * sizeof(double));
+	int* BLOCKINDSTR	= (int*)malloc(NBLOCKS * sizeof(int));
+	int* BLOCKIER		= (int*)malloc(NBLOCKS * sizeof(int));
+
 	// Calculate log-likelihood ratios.
-	for (int i = 0; i < NSAMPS; i++)
+	#pragma omp parallel for reduction(+:INDKNT) num_threads(NTHREADS) if(NBLOCKS > 1)
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
 	{
-		double DHOLD	= 1.0 - 2.0 * Q[i];
-		double LOGARG	= 1.0 + C * DHOLD * S[i];
+		int START;
+		int END;
+		GetBlock(BLOCK, NSAMPS, START, END);
 
-		if (LOGARG <= 0)
-		{
-			IER = i;
-			return;
-		}
-		
-		double HOLD3 = -0.5 * log(LOGARG);
-		double HOLD1 = C * G[i] * G[i] * DHOLD / (2.0*LOGARG);
-		double STORE = HOLD1 + DHOLD * LNHOLD + HOLD3;
-		if (STORE > 0)
+		BLOCKGLOBAL[BLOCK]	= 0;
+		BLOCKINDSTR[BLOCK]	= 0;
+		BLOCKIER[BLOCK]		= -1;
+
+		for (int i = START; i < END; i++)
 		{
-			INDKNT++;
-			if (STORE > GLOBAL)
+			double DHOLD	= 1.0 - 2.0 * Q[i];
+			double LOGARG	= 1.0 + C * DHOLD * S[i];
+
+			if (LOGARG <= 0)
 			{
-				GLOBAL = STORE;
-				INDSTR = i;
+				BLOCKIER[BLOCK] = i;
+				break;
 			}
+
+			double HOLD3 = -0.5 * log(LOGARG);
+			double HOLD1 = C * G[i] * G[i] * DHOLD / (2.0*LOGARG);
+			double STORE = HOLD1 + DHOLD * LNHOLD + HOLD3;
+			if (STORE > 0)
+			{
+				INDKNT++;
+				if (STORE > BLOCKGLOBAL[BLOCK])
+				{
+					BLOCKGLOBAL[BLOCK] = STORE;
+					BLOCKINDSTR[BLOCK] = i;
+				}
+			}
+		}
+	}
+
+	bool LOGERROR = false;
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
+	{
+		if (BLOCKIER[BLOCK] >= 0)
+		{
+			IER			= BLOCKIER[BLOCK];
+			LOGERROR	= true;
+			break;
+		}
+
+		if (BLOCKGLOBAL[BLOCK] > GLOBAL)
+		{
+			GLOBAL = BLOCKGLOBAL[BLOCK];
+			INDSTR = BLOCKINDSTR[BLOCK];
 		}
 	}
 
+	free(BLOCKGLOBAL);
+	free(BLOCKINDSTR);
+	free(BLOCKIER);
+
+	if (LOGERROR)
+	{
+		return;
+	}
+
 	if (INDKNT < 1)
 	{
 		// In case of convergence, return.
@@ -245,19 +333,21 @@ void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMP
 		if (Q[INDSTR] > 0.01)
 		{
 			Q[INDSTR] = 0.0;
+			NQ--;
 		}
 		else
 		{
 			Q[INDSTR] = 1.0;
+			NQ++;
 		}
 	}
 }
 
 // Original function name: THOLD
-void Threshold(double JMPSEQ[], double C, double F, int NSAMPS, double Q[], double& D)
+void Threshold(double JMPSEQ[], double C, double F, int NSAMPS, double Q[], double& D, int& NQ, int NTHREADS)
 {
 	// Function:
-	// Threshold procedure to estimate an initial event sequence.
+	// Threshold procedure to estimate an initial event sequence.  The events are counted in the same pass.
 	//
 	// Input parameters:
 	// JMPSEQ: Jump sequence estimate obtained with the event sequence Q set to unity for all values.
@@ -268,31 +358,40 @@ void Threshold(double JMPSEQ[], double C, double F, int NSAMPS, double Q[], doub
 	//
 	// NSAMPS: Length of the array JMPSEQ.
 	//
+	// NTHREADS: Number of threads used by the parallel loop.
+	//
 	// Output parameters:
 	// Q: Estimated binary event sequence.
 	//
 	// D: Estimated segment density.
+	//
+	// NQ: Number of binary events found (number of "1"s in Q).
 
-	D = 0.0;
+	// The count is reduced into a local variable because OpenMP 2.0 (Visual C++) does not allow a reference in a reduction.
+	int NBLOCKS	= NumberOfBlocks(NSAMPS);
+	int COUNT	= 0;
 
-	for (int i = 0; i < NSAMPS; i++)
+	#pragma omp parallel for reduction(+:COUNT) num_threads(NTHREADS) if(NBLOCKS > 1)
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
 	{
- 		if (F*C <= JMPSEQ[i]*JMPSEQ[i])
-		{
-			Q[i]	= 1.0;
-			D		= D + 1.0;
-		}
-		else
+		int START;
+		int END;
+		GetBlock(BLOCK, NSAMPS, START, END);
+
+		for (int i = START; i < END; i++)
 		{
-			Q[i] = 0.0;
+			int EVENT	= F*C <= JMPSEQ[i]*JMPSEQ[i];
+			Q[i]		= EVENT;
+			COUNT		= COUNT + EVENT;
 		}
 	}
 
-	D	= D / (double)NSAMPS;
+	NQ	= COUNT;
+	D	= (double)NQ / (double)NSAMPS;
 }
 
 // Original function name: MOVAVG
-void MovingAverage(double ARR1[], int NSAMPS, int ORDER, double ARR2[])
+void MovingAverage(double ARR1[], int NSAMPS, int ORDER, double ARR2[], int NTHREADS)
 {
 	// Function:
 	// Centered moving average.
@@ -304,6 +403,8 @@ void MovingAverage(double ARR1[], int NSAMPS, int ORDER, double ARR2[])
 	//
 	// ORDER: One sided length of the moving average window.
 	//
+	// NTHREADS: Number of threads used by the parallel loop.
+	//
 	// Output parameters:
 	// ARR2: Averaged data array.
 
@@ -334,16 +435,37 @@ void MovingAverage(double ARR1[], int NSAMPS, int ORDER, double ARR2[])
 		ARR2[NSAMPS-1-i] = SUM1 / (jfront + 2);
 	}
 
-	// Average stable.
-	jfront	= jfront + 2;
-	jback	= 0;
+	// Average stable.  The running sum is started over at each block so the blocks can be averaged in parallel.  The first block
+	// continues the sum of the build.
+	int STABLESTART	= ORDER + 1;
+	int STABLELEN	= NSAMPS - ORDER - STABLESTART;
+	int NBLOCKS		= NumberOfBlocks(STABLELEN);
 
-	for (int i = ORDER+1; i < NSAMPS-ORDER; i++)
+	#pragma omp parallel for num_threads(NTHREADS) if(NBLOCKS > 1)
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
 	{
-		SUM = SUM + ARR1[jfront] - ARR1[jback];
-		ARR2[i] = SUM / (ORDER * 2 + 1);
-		jfront++;
-		jback++;
+		int START;
+		int END;
+		GetBlock(BLOCK, STABLELEN, START, END);
+		START	= START + STABLESTART;
+		END		= END + STABLESTART;
+
+		double BLOCKSUM = SUM;
+		if (BLOCK > 0)
+		{
+			// Sum of the window of the sample before the block.
+			BLOCKSUM = 0.0;
+			for (int j = START-ORDER-1; j < START+ORDER; j++)
+			{
+				BLOCKSUM = BLOCKSUM + ARR1[j];
+			}
+		}
+
+		for (int i = START; i < END; i++)
+		{
+			BLOCKSUM = BLOCKSUM + ARR1[i+ORDER] - ARR1[i-ORDER-1];
+			ARR2[i] = BLOCKSUM / (ORDER * 2 + 1);
+		}
 	}
 }
 
@@ -473,7 +595,7 @@ void AverageArraySegments(double ARR[], double Q[], int NSAMPS, double AVGOUT[])
 }
 
 // Original function name: UPDNSE
-void DeglitchAndEstimateNoiseVariance(double LOG[], double Q[], int NSAMPS, int RMODE, double WORK1[], double R[])
+void DeglitchAndEstimateNoiseVariance(double LOG[], double Q[], int NSAMPS, int RMODE, double WORK1[], double R[], int NTHREADS)
 {
 	// Function:
 	// Deglitch and re-estimate noise variance.
@@ -489,32 +611,43 @@ void DeglitchAndEstimateNoiseVariance(double LOG[], double Q[], int NSAMPS, int
 	//		RMODE = 0 ==> Point estimate of noise variance.
 	//		RMODE = 1 ==> Noise estimates smoothed within segments.
 	//
+	// NTHREADS: Number of threads used by the parallel loop.
+	//
 	// Output parameters:
 	// R: Estimated noise variance.
 
 	// Average the log within each segment implied by Q.
 	AverageArraySegments(LOG, Q, NSAMPS, WORK1);
 
-	// Calculate the noise variance R.
-	for (int i = 0; i < NSAMPS; i++)
+	// Calculate the noise variance R.  The point estimate is stored in the same pass.
+	int NBLOCKS = NumberOfBlocks(NSAMPS);
+
+	#pragma omp parallel for num_threads(NTHREADS) if(NBLOCKS > 1)
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
 	{
-		WORK1[i] = (LOG[i] - WORK1[i]) * (LOG[i] - WORK1[i]);
-		
-		if (WORK1[i] <= 0.0)
+		int START;
+		int END;
+		GetBlock(BLOCK, NSAMPS, START, END);
+
+		OMP_SIMD
+		for (int i = START; i < END; i++)
 		{
-			WORK1[i] = 1.0;
+			double RESIDUAL	= (LOG[i] - WORK1[i]) * (LOG[i] - WORK1[i]);
+			WORK1[i]		= RESIDUAL <= 0.0 ? 1.0 : RESIDUAL;
 		}
-	}
 
-	// Point estimate.
-	if (RMODE == 0)
-	{
-		for (int i = 0; i < NSAMPS; i++)
+		// Point estimate.
+		if (RMODE == 0)
 		{
-			R[i] = WORK1[i];
+			OMP_SIMD
+			for (int i = START; i < END; i++)
+			{
+				R[i] = WORK1[i];
+			}
 		}
 	}
-	else
+
+	if (RMODE != 0)
 	{
 		// Smooth the noise variance R within each segment.
 		int SEGSTR = 0;
@@ -532,7 +665,7 @@ void DeglitchAndEstimateNoiseVariance(double LOG[], double Q[], int NSAMPS, int
 			int IOR = SEGLEN/3;
 			if (IOR > 0)
 			{
-				MovingAverage(&(WORK1[SEGSTR]), SEGLEN, IOR, &(R[SEGSTR]));
+				MovingAverage(&(WORK1[SEGSTR]), SEGLEN, IOR, &(R[SEGSTR]), NTHREADS);
 			}
 			else
 			{
@@ -601,7 +734,7 @@ void GetSegment(double LOG[], double Q[], int NSAMPS, int SEGSTR, int& SEGEND, i
 }
 
 // Original function name: DEGLCH
-void Deglitch(int NSAMPS, double Q[])
+void Deglitch(int NSAMPS, double Q[], int& NQ)
 {
 	// Function:
 	// Deglitches all the spiky zones in the event sequence Q.
@@ -612,6 +745,8 @@ void Deglitch(int NSAMPS, double Q[])
 	// Input/output parameters:
 	// Q: Binary event sequence to be deglitched.  On return this contains the updated event
 	//		sequence.  It is of length "NSAMPS."
+	//
+	// NQ: Number of binary events (number of "1"s in Q).  On return the removed events have been subtracted.
 
 	int SEGSTR		= 0;
 	bool endofarray = false;
@@ -630,12 +765,14 @@ void Deglitch(int NSAMPS, double Q[])
 			if (SEGEND == SEGSTR+1)
 			{
 				Q[SEGSTR] = 0;
+				NQ--;
 			}
 			else
 			{
 				for (int i = SEGSTR+1; i < SEGEND; i++)
 				{
 					Q[i] = 0;
+					NQ--;
 				}
 			}
 			SEGSTR = SEGEND + 1;
@@ -694,35 +831,8 @@ void GetSpikeyZone(double Q[], int NSAMPS, int SEGSTR, int& SEGEND, bool& endofa
 	SEGEND--;
 }
 
-// Original function name: UPDDEN
-void EstimateEventDensity(double Q[], int NSAMPS, double& D, int& NQ)
-{
-	// Function:
-	// Estimates the event density for a given event sequence.
-	//
-	// Input parameters:
-	// Q: Binary event sequence for which the event density is to be estimated.
-	//
-	// NSAMPS: Length of the array Q.
-	//
-	// Output parameters:
-	// D: Estimated segment density.
-	//
-	// NQ: Number of binary events found (number of "1"s in Q).
-
-	D = 0;
-	for (int i = 0; i < NSAMPS; i++)
-	{
-		D = D + Q[i];
-	}
-
-	// Store the number of events found, the calculate the event density.
-	NQ	= (int)D;
-	D = D / (double)NSAMPS;
-}
-
 // Original function name: ESTSIG
-void EstimateVarianceOfJumpSequence(double LOG[], int NSAMPS, double WORK1[], double& C)
+void EstimateVarianceOfJumpSequence(double LOG[], int NSAMPS, double WORK1[], double& C, int NTHREADS)
 {
 	// Function:
 	// Estimates initially C, the variance of the jump sequence as the variance of unit-step
@@ -733,6 +843,8 @@ void EstimateVarianceOfJumpSequence(double LOG[], int NSAMPS, double WORK1[], do
 	//
 	// NSAMPS: Length of the array log.
 	//
+	// NTHREADS: Number of threads passed to CalculateMeanAndVariance.
+	//
 	// Output parameters:
 	// C: Estimated variance of the jump sequence.
 
@@ -745,11 +857,11 @@ void EstimateVarianceOfJumpSequence(double LOG[], int NSAMPS, double WORK1[], do
 
 	// Calculate the variance of the differ log (consider non zero values).
 	double MEAN;
-	CalculateMeanAndVariance(WORK1, NSAMPS, 1, MEAN, C);
+	CalculateMeanAndVariance(WORK1, NSAMPS, 1, MEAN, C, NTHREADS);
 }
 
 // Original function name: VARNCE
-void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN, double& VAR)
+void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN, double& VAR, int NTHREADS)
 {
 	// Function:
 	// Calculates mean and variance.
@@ -763,6 +875,8 @@ void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN
 	//		MODE == 0 = Consider all values.
 	//		MODE == 1 = Consider only non zero values.
 	//
+	// NTHREADS: Number of threads used by the parallel loop.
+	//
 	// Output parameters:
 	// MEAN: Calculated mean of the given data.
 	//
@@ -772,18 +886,48 @@ void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN
 	MEAN		= 0;
 	VAR			= 0;
 
-	// Calculate sum and sum of squares.
-	for (int i = 0; i < NSAMPS; i++)
-	{
+	// Calculate sum and sum of squares of each block.  The blocks are added in order, so the sums do not depend on the number of threads.
+	int NBLOCKS			= NumberOfBlocks(NSAMPS);
+	int* BLOCKKNT		= (int*)malloc(NBLOCKS * sizeof(int));
+	double* BLOCKSUM	= (double*)malloc(NBLOCKS * sizeof(double));
+	double* BLOCKSQR	= (double*)malloc(NBLOCKS * sizeof(double));
 
-		if (ARRAY[i] != 0)
+	#pragma omp parallel for num_threads(NTHREADS) if(NBLOCKS > 1)
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
+	{
+		int START;
+		int END;
+		GetBlock(BLOCK, NSAMPS, START, END);
+
+		int KNT		= 0;
+		double SUM	= 0;
+		double SQR	= 0;
+		for (int i = START; i < END; i++)
 		{
-			NZEKNT++;
-			MEAN	= MEAN + ARRAY[i];
-			VAR		= VAR + ARRAY[i]*ARRAY[i];
+			if (ARRAY[i] != 0)
+			{
+				KNT++;
+				SUM	= SUM + ARRAY[i];
+				SQR	= SQR + ARRAY[i]*ARRAY[i];
+			}
 		}
+
+		BLOCKKNT[BLOCK] = KNT;
+		BLOCKSUM[BLOCK] = SUM;
+		BLOCKSQR[BLOCK] = SQR;
+	}
+
+	for (int BLOCK = 0; BLOCK < NBLOCKS; BLOCK++)
+	{
+		NZEKNT	= NZEKNT + BLOCKKNT[BLOCK];
+		MEAN	= MEAN + BLOCKSUM[BLOCK];
+		VAR		= VAR + BLOCKSQR[BLOCK];
 	}
 
+	free(BLOCKKNT);
+	free(BLOCKSUM);
+	free(BLOCKSQR);
+
 	// Calculate mean and variance.
 	if (MODE == 0)
 	{
@@ -795,4 +939,44 @@ void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN
 		MEAN = MEAN / (double)NZEKNT;
 		VAR = VAR / (double)NZEKNT - MEAN*MEAN;
 	}
-}
\ No newline at end of file
+}
+
+int NumberOfBlocks(int NSAMPS)
+{
+	// Function:
+	// Number of blocks of BLOCKSIZE samples needed to cover an array.
+	//
+	// Input parameters:
+	// NSAMPS: Length of the array.
+
+	if (NSAMPS < 1)
+	{
+		return 0;
+	}
+
+	return (NSAMPS + BLOCKSIZE - 1) / BLOCKSIZE;
+}
+
+void GetBlock(int BLOCK, int NSAMPS, int& START, int& END)
+{
+	// Function:
+	// Range of samples in a block.
+	//
+	// Input parameters:
+	// BLOCK: Block number.
+	//
+	// NSAMPS: Length of the array.
+	//
+	// Output parameters:
+	// START: First sample of the block.
+	//
+	// END: One past the last sample of the block.
+
+	START	= BLOCK * BLOCKSIZE;
+	END		= START + BLOCKSIZE;
+
+	if (END > NSAMPS)
+	{
+		END = NSAMPS;
+	}
+}
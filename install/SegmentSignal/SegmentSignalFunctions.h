@@ -6,18 +6,18 @@
 */
 
 // MAIN FUNCTION
-//                 In                                                                               Out
-void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, int RMODE, int NITER, double Q[], int& NQ, double FLTLOG[], double SEGLOG[], double R[], double& C, double& D, int& NACT, int& IER);
+//                 In                                                                               Out                                                                                                  In
+void SegmentSignal(double LOG[], int NSAMPS, double F, int ORDER, int ORDER1, int RMODE, int NITER, double Q[], int& NQ, double FLTLOG[], double SEGLOG[], double R[], double& C, double& D, int& NACT, int& IER, int NTHREADS=1);
 
 // HELPER FUNCTIONS
-//                                   In                                                                  Out
-void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMPS, double D, double Q[], bool& CONV, int& IER);
+//                                   In                                                      In/Out               Out
+void SingleMostLikelihoodReplacement(double G[], double S[], double C, int NSAMPS, double D, double Q[], int& NQ, bool& CONV, int& IER, int NTHREADS);
 
 //             In                                               Out
-void Threshold(double JMPSEQ[], double C, double F, int NSAMPS, double Q[], double& D);
+void Threshold(double JMPSEQ[], double C, double F, int NSAMPS, double Q[], double& D, int& NQ, int NTHREADS);
 
 //                 In                                    Out
-void MovingAverage(double ARR1[], int NSAMPS, int ORDER, double ARR2[]);
+void MovingAverage(double ARR1[], int NSAMPS, int ORDER, double ARR2[], int NTHREADS);
 
 //                In                                                          Out
 void KalmanFilter(double LOG[], double Q[], double C, double R[], int NSAMPS, double GAIN[], double ZTLT[], double ETA[], double STATE[]);
@@ -29,24 +29,28 @@ void FixedIntervalOptimalSmoother(double Q[], int NSAMPS, double C, double ARR1[
 void AverageArraySegments(double ARR[], double Q[], int NSAMPS, double AVGOUT[]);
 
 //                                    In                                               Intermediate    Out
-void DeglitchAndEstimateNoiseVariance(double LOG[], double Q[], int NSAMPS, int RMODE, double WORK1[], double R[]);
+void DeglitchAndEstimateNoiseVariance(double LOG[], double Q[], int NSAMPS, int RMODE, double WORK1[], double R[], int NTHREADS);
 
 //              In												  Out
 void GetSegment(double LOG[], double Q[], int NSAMPS, int SEGSTR, int& SEGEND, int& SEGLEN, double& SEGAVG, bool& endofarray);
 
 //            In          In/Out
-void Deglitch(int NSAMPS, double Q[]);
+void Deglitch(int NSAMPS, double Q[], int& NQ);
 
 //                 In                                  Out
 void GetSpikeyZone(double Q[], int NSAMPS, int SEGSTR, int& SEGEND, bool& endofarray);
 
-//                        In                      Out
-void EstimateEventDensity(double Q[], int NSAMPS, double& D, int& NQ);
-
 //                                  In                        Intermediate    Out
-void EstimateVarianceOfJumpSequence(double LOG[], int NSAMPS, double WORK1[], double& C);
+void EstimateVarianceOfJumpSequence(double LOG[], int NSAMPS, double WORK1[], double& C, int NTHREADS);
 
 //                            In                                    Out
-void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN, double& VAR);
+void CalculateMeanAndVariance(double ARRAY[], int NSAMPS, int MODE, double& MEAN, double& VAR, int NTHREADS);
+
+// PARALLEL LOOP HELPERS
+//                 In
+int NumberOfBlocks(int NSAMPS);
+
+//            In                      Out
+void GetBlock(int BLOCK, int NSAMPS, int& START, int& END);
 
 #endif
\ No newline at end of file
@@ -14,7 +14,7 @@
 
 namespace py = pybind11;
 
-PythonAlgorithms::SegmentationResults* Segment(py::array_t<double> signalAsPyList, double threshold, int jumpSequenceWindowSize, int noiseVarianceWindowSize, int noiseVarianceEstimateMethod, int maxSMLRIterations)
+PythonAlgorithms::SegmentationResults* Segment(py::array_t<double> signalAsPyList, double threshold, int jumpSequenceWindowSize, int noiseVarianceWindowSize, int noiseVarianceEstimateMethod, int maxSMLRIterations, int numberOfThreads)
 {
 	// Gets the information about the object and a pointer to the actual data (buffer).
     py::buffer_info info		= signalAsPyList.request();
@@ -30,7 +30,7 @@ PythonAlgorithms::SegmentationResults* Segment(py::array_t<double> signalAsPyLis
 	int signalLength = static_cast<int>(info.shape[0]);
 
 	// Call the algorithm, then convert the results for returning to Python.
-    Algorithms::SegmentationResults*		cppResults		= Algorithms::SegmentSignal::Segment(signalDataPointer, signalLength, threshold, jumpSequenceWindowSize, noiseVarianceWindowSize, (NoiseVarianceEstimateMethod)noiseVarianceEstimateMethod, maxSMLRIterations);
+    Algorithms::SegmentationResults*		cppResults		= Algorithms::SegmentSignal::Segment(signalDataPointer, signalLength, threshold, jumpSequenceWindowSize, noiseVarianceWindowSize, (NoiseVarianceEstimateMethod)noiseVarianceEstimateMethod, maxSMLRIterations, numberOfThreads);
     PythonAlgorithms::SegmentationResults*	pythonResults	= new PythonAlgorithms::SegmentationResults(cppResults);
 	
 	// The C results are not longer needed.  Everything has been copied to the Python results.
@@ -85,7 +85,8 @@ py::array_t<int> FindSignificantZones(py::array_t<int> binaryEvents, py::array_t
 
 PYBIND11_MODULE(SegmentSignalPy, m)
 {
-    m.def("Segment", &Segment, "Segments a signal based on maximum likelihood estimation");
+    m.def("Segment", &Segment, "Segments a signal based on maximum likelihood estimation",
+		py::arg("signal"), py::arg("threshold"), py::arg("jumpSequenceWindowSize"), py::arg("noiseVarianceWindowSize"), py::arg("noiseVarianceEstimateMethod"), py::arg("maxSMLRIterations"), py::arg("numberOfThreads")=1);
 
 	m.def("FindSignificantZones", &FindSignificantZones, "Post processes a binary event sequence to find regions that are greater than the specified threashold.");
 
@@ -1,13 +1,71 @@
 from   distutils.core                            import setup
 from   distutils.core                            import Extension
+from   distutils.ccompiler                       import new_compiler
+from   distutils.errors                          import CompileError
+from   distutils.errors                          import LinkError
+from   distutils.sysconfig                       import customize_compiler
 import pybind11
+import os
+import sys
+import tempfile
+
+
+def CompilerSupportsOpenMP(compileArgs, linkArgs):
+    """
+    Checks if the compiler can build and link a small OpenMP program with the given flags.
+
+    Apple clang, for example, does not accept "-fopenmp" without a separately installed OpenMP runtime.
+
+    Parameters
+    ----------
+    compileArgs : list of str
+        Compiler flags that enable OpenMP.
+    linkArgs : list of str
+        Linker flags that enable OpenMP.
+
+    Returns
+    -------
+    : bool
+        True if the test program was built, False otherwise.
+    """
+    compiler = new_compiler()
+    customize_compiler(compiler)
+
+    with tempfile.TemporaryDirectory() as directory:
+        sourceFile = os.path.join(directory, "openmptest.c")
+        with open(sourceFile, "w") as file:
+            file.write("#include <omp.h>\nint main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }\n")
+
+        try:
+            objects = compiler.compile([sourceFile], output_dir=directory, extra_postargs=compileArgs)
+            compiler.link_executable(objects, os.path.join(directory, "openmptest"), extra_postargs=linkArgs)
+        except (CompileError, LinkError):
+            return False
+
+    return True
+
+
+# The passes over the signal are parallelized with OpenMP.  If the compiler does not support OpenMP,
+# the extension is built serially (the pragmas are ignored and the number of threads has no effect).
+if sys.platform == "win32":
+    openMPCompileArgs = ["/openmp"]
+    openMPLinkArgs    = []
+else:
+    openMPCompileArgs = ["-fopenmp"]
+    openMPLinkArgs    = ["-fopenmp"]
+
+if not CompilerSupportsOpenMP(openMPCompileArgs, openMPLinkArgs):
+    print("OpenMP is not supported by the compiler.  Building SegmentSignalPy without OpenMP.")
+    openMPCompileArgs = []
+    openMPLinkArgs    = []
 
 sfc_module = Extension(
     "SegmentSignalPy",
     sources=["module.cpp", "SegmentSignalFunctions.cpp", "SegmentationResults.cpp", "SegmentSignal.cpp"],
     include_dirs=[pybind11.get_include()],
     language="c++",
-    extra_compile_args=[],
+    extra_compile_args=openMPCompileArgs,
+    extra_link_args=openMPLinkArgs,
 )
 
 setup(
@@ -15,4 +73,4 @@ setup(
     version="1.0",
     description="Signal segmentation algorithm  by S.Radhakrishnan, et al.  This is a Python interface for the algorithm whish is in C++.",
     ext_modules=[sfc_module],
-)
\ No newline at end of file
+)
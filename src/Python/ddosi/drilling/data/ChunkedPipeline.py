@@ -0,0 +1,319 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.StreamingLowPassFilter                 import StreamingLowPassFilter
+from   ddosi.signalprocessing.RollingStatistics                      import RollingStatistics
+from   ddosi.signalprocessing.DataFrameUtilities                     import DataFrameUtilities
+from   ddosi.drilling.data.PreProcessing                             import PreProcessing
+
+
+class ChunkedPipeline():
+    """
+    Preprocesses data that is too large to fit in memory by streaming it through a series of stages one chunk at a time.
+
+    Stages are added in the order they are run.  Each stage can use the columns created by the stages before it.  The state
+    needed at the chunk boundaries is carried from one chunk to the next:
+        Low pass filter      : The filter state.  The filter is causal (see "StreamingLowPassFilter"), so unlike
+                               "DataFrameUtilities.LowPassFilter" the output is delayed by the group delay of the filter.
+        Rolling statistics   : The last "windowSize-1" rows of the input columns.
+        Rate of penetration  : The last row of time and depth.
+        Depth of cut         : No state is needed.
+
+    The rolling statistics, rate of penetration, and depth of cut are the same as processing all the data at once with
+    "DataFrameUtilities" and "PreProcessing".  The low pass filter is the same as running a causal filter over all the data at
+    once, which is not the same as the zero phase filter of "DataFrameUtilities.LowPassFilter".  The peak memory used is set by
+    the chunk size.
+    The new columns are named the same as the equivalent functions in "DataFrameUtilities" and "PreProcessing".
+
+    Example
+    -------
+    pipeline = ChunkedPipeline(chunkSize=1000000)
+    pipeline.AddLowPassFilter(["Acceleration"], 10.0, 1000.0)
+    pipeline.AddRollingStatistics(["Acceleration 10.0 Hz Lowpass Filtered"], [100, 1000], ["mean", "std"])
+    pipeline.AddRateOfPenetration()
+    pipeline.AddDepthOfCut()
+    pipeline.Run("input.csv", "output.csv")
+    """
+
+
+    def __init__(self, chunkSize:int=1000000):
+        """
+        Contructor.
+
+        Parameters
+        ----------
+        chunkSize : int, optional
+            The number of rows read and processed at a time. The default is 1000000.
+
+        Returns
+        -------
+        None.
+        """
+        if chunkSize < 1:
+            raise Exception("The chunk size must be at least one.")
+
+        self.chunkSize = chunkSize
+        self.stages    = []
+
+
+    def AddLowPassFilter(self, columns:list|tuple, cutOff:float, samplingFrequency:float, order:int=2):
+        """
+        Adds a causal low pass filter stage.
+
+        Parameters
+        ----------
+        columns : array like of strings
+            The column names to filter.
+        cutOff : float
+            The cut off frequency used in the filter.
+        samplingFrequency : float
+            The sampling frequency of the source data.
+        order : int, optional
+            Order of the filter used. The default is 2.
+
+        Returns
+        -------
+        None.
+        """
+        columns  = list(columns)
+        suffix   = str(cutOff) + " Hz Lowpass Filtered"
+        stage    = {
+            "columns"  : columns,
+            "newNames" : [column + " " + suffix for column in columns],
+            "filter"   : StreamingLowPassFilter(cutOff, samplingFrequency, order)
+        }
+        self.stages.append(("lowpass", stage))
+
+
+    def AddRollingStatistics(self, columns:list|tuple, windowSizes:int|list|tuple, statistics:str|list|tuple=("mean", "rms")):
+        """
+        Adds a rolling statistics stage.  See "DataFrameUtilities.RollingStatistics".
+
+        Parameters
+        ----------
+        columns : array like of strings
+            The column names in a list.
+        windowSizes : int or array like of ints
+            The number(s) of points to use for the rolling statistics.
+        statistics : str or array like of strings, optional
+            The statistics to calculate.  Any of "mean", "rms", "std", "min", and "max".  The default is ("mean", "rms").
+
+        Returns
+        -------
+        None.
+        """
+        windowSizes = [windowSizes] if isinstance(windowSizes, int) else list(windowSizes)
+        statistics  = [statistics] if isinstance(statistics, str) else list(statistics)
+        stage       = {
+            "columns"     : list(columns),
+            "windowSizes" : windowSizes,
+            "statistics"  : statistics,
+            "tail"        : None
+        }
+        self.stages.append(("rolling", stage))
+
+
+    def AddRateOfPenetration(self, timeColumn:str="Time", depthColumn:str="Depth"):
+        """
+        Adds a rate of penetration stage.  See "PreProcessing.CalculateRopFromTimeAndDepth".
+
+        Parameters
+        ----------
+        timeColumn : string, optional
+            The column name of the time data. The default is "Time".
+        depthColumn : string, optional
+            The column name of the depth data. The default is "Depth".
+
+        Returns
+        -------
+        None.
+        """
+        stage = {
+            "timeColumn"  : timeColumn,
+            "depthColumn" : depthColumn,
+            "previous"    : None
+        }
+        self.stages.append(("rop", stage))
+
+
+    def AddDepthOfCut(self, ropColumn:str="Rate of Penetration", rpmColumn:str="Rotary Speed"):
+        """
+        Adds a depth of cut stage.  See "PreProcessing.CalculateDepthOfCutFromRopAndRotarySpeed".
+
+        Parameters
+        ----------
+        ropColumn : string, optional
+            The column name of the rate of penetration data. The default is "Rate of Penetration".
+        rpmColumn : string, optional
+            The column name of the angular velocity data. The default is "Rotary Speed".
+
+        Returns
+        -------
+        None.
+        """
+        stage = {
+            "ropColumn" : ropColumn,
+            "rpmColumn" : rpmColumn
+        }
+        self.stages.append(("depthofcut", stage))
+
+
+    def Reset(self):
+        """
+        Clears the state carried between chunks so the next chunk is treated as the start of new data.
+
+        Returns
+        -------
+        None.
+        """
+        for kind, stage in self.stages:
+            match kind:
+                case "lowpass":
+                    stage["filter"].Reset()
+                case "rolling":
+                    stage["tail"] = None
+                case "rop":
+                    stage["previous"] = None
+
+
+    def Run(self, source, outputPath:str, columns:list|tuple=None, **kwargs) -> int:
+        """
+        Runs the pipeline over all the data in "source" and appends the results to a CSV file.
+
+        Parameters
+        ----------
+        source : str or iterable of pandas.DataFrame
+            The path to a CSV file or an iterable that returns the chunks as DataFrames.
+        outputPath : str
+            The path of the output CSV file.  The file is overwritten.
+        columns : array like of strings, optional
+            The columns to read from the CSV file.  If None, all the columns are read. The default is None.
+        **kwargs : keyword arguments
+            Additional arguments passed to pandas.read_csv.
+
+        Returns
+        -------
+        numberOfRows : int
+            The number of rows processed.
+        """
+        self.Reset()
+
+        if isinstance(source, str):
+            source = pd.read_csv(source, chunksize=self.chunkSize, usecols=columns, **kwargs)
+
+        numberOfRows = 0
+        pending      = None
+        for chunk in source:
+            # The rate of penetration of the first row is back filled from the second row, so the first chunk is held until
+            # it has at least two rows.
+            if numberOfRows == 0:
+                pending = chunk if pending is None else pd.concat([pending, chunk])
+                if len(pending) < 2:
+                    continue
+                chunk, pending = pending, None
+
+            numberOfRows += self._WriteChunk(self.ProcessChunk(chunk), outputPath, numberOfRows)
+
+        # All the data fit in a single row.
+        if pending is not None:
+            numberOfRows += self._WriteChunk(self.ProcessChunk(pending), outputPath, numberOfRows)
+
+        return numberOfRows
+
+
+    def ProcessChunk(self, chunk:pd.DataFrame) -> pd.DataFrame:
+        """
+        Runs the next chunk through all the stages.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            The next chunk of data.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The chunk with the new columns added.
+        """
+        newColumns = {}
+
+        for kind, stage in self.stages:
+            match kind:
+                case "lowpass":
+                    self._LowPassFilter(stage, chunk, newColumns)
+                case "rolling":
+                    self._RollingStatistics(stage, chunk, newColumns)
+                case "rop":
+                    self._RateOfPenetration(stage, chunk, newColumns)
+                case "depthofcut":
+                    self._DepthOfCut(stage, chunk, newColumns)
+
+        # All the new columns are attached at once.
+        if len(newColumns) == 0:
+            return chunk
+        return pd.concat([chunk, pd.DataFrame(newColumns, index=chunk.index)], axis=1)
+
+
+    def _WriteChunk(self, chunk:pd.DataFrame, outputPath:str, numberOfRows:int) -> int:
+        # The first chunk creates the file and writes the header, the remaining chunks are appended.
+        chunk.to_csv(outputPath, mode="w" if numberOfRows == 0 else "a", header=numberOfRows == 0, index=False)
+        return len(chunk)
+
+
+    def _LowPassFilter(self, stage:dict, chunk:pd.DataFrame, newColumns:dict):
+        filtered = stage["filter"].Filter(self._GetColumns(chunk, newColumns, stage["columns"]))
+        for i, name in enumerate(stage["newNames"]):
+            newColumns[name] = filtered[:, i]
+
+
+    def _RollingStatistics(self, stage:dict, chunk:pd.DataFrame, newColumns:dict):
+        values     = self._GetColumns(chunk, newColumns, stage["columns"])
+        tailLength = max(stage["windowSizes"]) - 1
+
+        # The rows carried from the previous chunk complete the windows that start before this chunk.
+        if stage["tail"] is not None:
+            values = np.concatenate([stage["tail"], values], axis=0)
+        carried    = 0 if stage["tail"] is None else len(stage["tail"])
+
+        results    = RollingStatistics.Calculate(values, stage["windowSizes"], stage["statistics"])
+        for (statistic, windowSize), result in results.items():
+            suffix = str(windowSize) + " pt " + DataFrameUtilities.rollingStatisticNames[statistic]
+            for i, column in enumerate(stage["columns"]):
+                newColumns[column + " " + suffix] = result[carried:, i]
+
+        stage["tail"] = values[max(len(values)-tailLength, 0):].copy() if tailLength > 0 else None
+
+
+    def _RateOfPenetration(self, stage:dict, chunk:pd.DataFrame, newColumns:dict):
+        timeColumn, depthColumn = stage["timeColumn"], stage["depthColumn"]
+        inputs = pd.DataFrame(self._GetColumns(chunk, newColumns, [timeColumn, depthColumn]), columns=[timeColumn, depthColumn])
+
+        # The last row of the previous chunk is put in front of this chunk, so the first row is calculated from it.  Without a
+        # previous chunk the first entry is back filled ("Run" holds a first chunk with a single row until the next chunk is read).
+        carried = 0 if stage["previous"] is None else 1
+        if stage["previous"] is not None:
+            inputs = pd.concat([stage["previous"], inputs], ignore_index=True)
+
+        results = PreProcessing.CalculateDerivedChannels(inputs, ["Rate of Penetration"], timeColumn=timeColumn, depthColumn=depthColumn, infinitePolicy="keep")
+
+        if len(inputs) > 0:
+            stage["previous"] = inputs.iloc[-1:]
+        newColumns["Rate of Penetration"] = results["Rate of Penetration"][carried:]
+
+
+    def _DepthOfCut(self, stage:dict, chunk:pd.DataFrame, newColumns:dict):
+        ropColumn, rpmColumn = stage["ropColumn"], stage["rpmColumn"]
+        inputs  = pd.DataFrame(self._GetColumns(chunk, newColumns, [ropColumn, rpmColumn]), columns=[ropColumn, rpmColumn])
+        results = PreProcessing.CalculateDerivedChannels(inputs, ["Depth of Cut"], ropColumn=ropColumn, rpmColumn=rpmColumn, infinitePolicy="zero")
+        newColumns["Depth of Cut"] = results["Depth of Cut"]
+
+
+    def _GetColumns(self, chunk:pd.DataFrame, newColumns:dict, columns:list) -> np.ndarray:
+        """
+        Gets columns as a 2-D array from either the chunk or the columns created by earlier stages.
+        """
+        return np.column_stack([newColumns[column] if column in newColumns else chunk[column].to_numpy(dtype=np.float64) for column in columns])
@@ -3,8 +3,11 @@ Created on March 15, 2023
 @author: Lance A. Endres
 """
 import numpy                                               as np
+import pandas                                              as pd
 
 class PreProcessing():
+    # The channels that can be calculated by "CalculateDerivedChannels".
+    derivedChannels = ("Rate of Penetration", "Depth of Cut", "Mechanical Specific Energy")
 
     @classmethod
     def CalculateRopFromTimeAndDepth(cls, data, timeColumn="Time", depthColumn="Depth"):
@@ -25,15 +28,7 @@ class PreProcessing():
         None.
 
         """
-        rateOfPenetration = data[depthColumn].diff() / data[timeColumn].diff()
-
-        # To calculate ROP, we need intervals of distance and time so we end up with one less entry for the ROP
-        # than either of those data sets and Pandas fills this in with nan.  The first entry is back filled with the
-        # same value as the second entry to make them the same length.  Repeating an entry is better than adding a
-        # zero because plots that use a starting value of zero create a big spike and look funny.
-        rateOfPenetration[0] = rateOfPenetration[1]
-
-        data["Rate of Penetration"] = rateOfPenetration
+        cls.AddDerivedChannels(data, ["Rate of Penetration"], timeColumn=timeColumn, depthColumn=depthColumn, infinitePolicy="keep")
 
 
     @classmethod
@@ -54,6 +49,294 @@ class PreProcessing():
         -------
         None.
         """
-        revolutionsPerSecond = data[rpmColumn] / 60.0
-        data["Depth of Cut"] = data[ropColumn] / revolutionsPerSecond
-        data["Depth of Cut"].replace([np.inf, -np.inf], 0, inplace=True)
\ No newline at end of file
+        cls.AddDerivedChannels(data, ["Depth of Cut"], ropColumn=ropColumn, rpmColumn=rpmColumn, infinitePolicy="zero")
+
+
+    @classmethod
+    def AddDerivedChannels(cls, data:pd.DataFrame, channels:list|tuple=derivedChannels, output:str="inplace", **kwargs):
+        """
+        Calculates derived channels (see "CalculateDerivedChannels") and attaches them to the DataFrame as one block, the same as
+        the functions in "DataFrameUtilities".  Existing columns with the same names are replaced where they are.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data in a pandas.DataFrame
+        channels : list|tuple, optional
+            The channels to calculate. The default is all of the "derivedChannels".
+        output : str, optional
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".  See "DataFrameUtilities".
+            The default is "inplace".
+        **kwargs : keyword arguments
+            Keyword arguments passed to "CalculateDerivedChannels".
+
+        Returns
+        -------
+        newData : pandas.DataFrame
+            The input DataFrame, the new DataFrame, or the block of new columns, depending on "output".
+        newNames : list of strings
+            A list of the new column names.
+        """
+        # Imported here because the filters in "DataFrameUtilities" import scipy.
+        from   ddosi.signalprocessing.DataFrameUtilities             import DataFrameUtilities
+
+        results                   = cls.CalculateDerivedChannels(data, channels, **kwargs)
+        newData, newNames, suffix = DataFrameUtilities._AttachColumns(data, list(results.keys()), np.column_stack(list(results.values())), output, None)
+        return newData, newNames
+
+
+    @classmethod
+    def CalculateDerivedChannels(
+            cls,
+            data:pd.DataFrame,
+            channels:list|tuple=derivedChannels,
+            timeColumn:str="Time",
+            depthColumn:str="Depth",
+            ropColumn:str="Rate of Penetration",
+            wobColumn:str="Weight on Bit",
+            torqueColumn:str="Torque",
+            rpmColumn:str="Rotary Speed",
+            bitDiameter:float=None,
+            infinitePolicy:str="zero",
+            nanPolicy:str="keep"
+        ) -> dict:
+        """
+        Calculates derived drilling channels in one pass over the data.  Each channel is written into its own preallocated array
+        and intermediate results are shared between the channels.
+
+        Channels
+            "Rate of Penetration"
+                The change in depth divided by the change in time.  The first entry is back filled with the second entry.  Repeating
+                an entry is better than adding a zero because plots that use a starting value of zero create a big spike and look funny.
+            "Depth of Cut"
+                The rate of penetration divided by the revolutions per second.
+            "Mechanical Specific Energy"
+                The energy used to remove a unit volume of rock (Teale):
+                    WOB/A + 2*pi*(RPM/60)*Torque / (A*ROP)
+                where A is the area of the bit.  The inputs must use consistent units (e.g., N, N.m, m, and m/s give Pa).
+
+        If the rate of penetration is not one of the channels, it is read from "ropColumn" when that column exists.  Otherwise, it is
+        calculated from the time and depth.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data in a pandas.DataFrame
+        channels : list|tuple, optional
+            The channels to calculate. The default is all of the "derivedChannels".
+        timeColumn : str, optional
+            The column name of the time data. The default is "Time".
+        depthColumn : str, optional
+            The column name of the depth data. The default is "Depth".
+        ropColumn : str, optional
+            The column name of the rate of penetration data. The default is "Rate of Penetration".
+        wobColumn : str, optional
+            The column name of the weight on bit data. The default is "Weight on Bit".
+        torqueColumn : str, optional
+            The column name of the torque data. The default is "Torque".
+        rpmColumn : str, optional
+            The column name of the rotary speed data (revolutions per minute). The default is "Rotary Speed".
+        bitDiameter : float, optional
+            The diameter of the bit.  Required for the mechanical specific energy. The default is None.
+        infinitePolicy : str, optional
+            How infinite values (e.g., division by a zero time step or zero rotary speed) are handled.
+                "zero" : Replaced with zero.
+                "nan"  : Replaced with NaN.
+                "keep" : Left as infinite.
+            The default is "zero".
+        nanPolicy : str, optional
+            How NaN values (e.g., missing inputs or zero divided by zero) are handled.
+                "zero" : Replaced with zero.
+                "keep" : Left as NaN.
+            The default is "keep".
+
+        Returns
+        -------
+        results : dict
+            The channel names and the calculated values as numpy arrays.
+        """
+        for channel in channels:
+            if channel not in cls.derivedChannels:
+                raise Exception("Invalid channel \"" + str(channel) + "\" provided.")
+        if infinitePolicy not in ("zero", "nan", "keep"):
+            raise Exception("Invalid 'infinitePolicy' argument provided.")
+        if nanPolicy not in ("zero", "keep"):
+            raise Exception("Invalid 'nanPolicy' argument provided.")
+        if "Mechanical Specific Energy" in channels and bitDiameter is None:
+            raise Exception("The bit diameter is required to calculate the mechanical specific energy.")
+
+        numberOfRows = len(data)
+        results      = {}
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if "Rate of Penetration" in channels or ropColumn not in data.columns:
+                rateOfPenetration = cls._RateOfPenetration(data[timeColumn].to_numpy(dtype=np.float64), data[depthColumn].to_numpy(dtype=np.float64))
+                if "Rate of Penetration" in channels:
+                    results["Rate of Penetration"] = rateOfPenetration
+            else:
+                rateOfPenetration = data[ropColumn].to_numpy(dtype=np.float64)
+
+            if "Depth of Cut" in channels or "Mechanical Specific Energy" in channels:
+                rotarySpeed = data[rpmColumn].to_numpy(dtype=np.float64)
+
+            if "Depth of Cut" in channels:
+                depthOfCut = np.empty(numberOfRows)
+                np.multiply(rateOfPenetration, 60.0, out=depthOfCut)
+                np.divide(depthOfCut, rotarySpeed, out=depthOfCut)
+                results["Depth of Cut"] = depthOfCut
+
+            if "Mechanical Specific Energy" in channels:
+                area           = np.pi * bitDiameter**2 / 4.0
+                specificEnergy = np.empty(numberOfRows)
+                np.multiply(data[torqueColumn].to_numpy(dtype=np.float64), rotarySpeed, out=specificEnergy)
+                specificEnergy *= 2.0*np.pi/60.0
+                np.divide(specificEnergy, rateOfPenetration, out=specificEnergy)
+                np.add(specificEnergy, data[wobColumn].to_numpy(dtype=np.float64), out=specificEnergy)
+                specificEnergy /= area
+                results["Mechanical Specific Energy"] = specificEnergy
+
+        # The policies are applied after all the channels are calculated so that they do not change the inputs of other channels.
+        for values in results.values():
+            cls._ApplyPolicies(values, infinitePolicy, nanPolicy)
+
+        return results
+
+
+    @classmethod
+    def _RateOfPenetration(cls, time:np.ndarray, depth:np.ndarray) -> np.ndarray:
+        rateOfPenetration = np.empty(len(time))
+        if len(time) < 2:
+            rateOfPenetration[:] = np.nan
+            return rateOfPenetration
+
+        np.subtract(depth[1:], depth[:-1], out=rateOfPenetration[1:])
+        rateOfPenetration[1:] /= np.subtract(time[1:], time[:-1])
+
+        # Back fill the first entry (by position, so any index works).
+        rateOfPenetration[0] = rateOfPenetration[1]
+        return rateOfPenetration
+
+
+    @classmethod
+    def _ApplyPolicies(cls, values:np.ndarray, infinitePolicy:str, nanPolicy:str):
+        match infinitePolicy:
+            case "zero":
+                values[np.isinf(values)] = 0.0
+            case "nan":
+                values[np.isinf(values)] = np.nan
+
+        if nanPolicy == "zero":
+            values[np.isnan(values)] = 0.0
+
+
+    @classmethod
+    def BinByDepth(
+            cls,
+            data:pd.DataFrame,
+            resolution:float,
+            columns:list|tuple=None,
+            depthColumn:str="Depth",
+            statistics:list|tuple=("mean", "max", "count"),
+            onBottom:str|np.ndarray|pd.Series=None,
+            newHoleOnly:bool=False
+        ) -> pd.DataFrame:
+        """
+        Converts time based data into depth bins.  The rows are assigned to bins of size "resolution" by their depth, then the bins
+        are aggregated with a single (stable) sort followed by reductions over each run of bins.  Drilling depth is mostly increasing,
+        so the sort is nearly linear.
+
+        Only the bins that contain rows are returned.  The output columns are:
+            depthColumn         : The depth at the center of the bin.
+            column              : The mean of the column in the bin (if "mean" is a statistic).  Using the original name allows the
+                                  output to be used with the depth based plots.
+            column + " Maximum" : The maximum of the column in the bin (if "max" is a statistic).
+            column + " Count"   : The number of (non-NaN) values of the column in the bin (if "count" is a statistic).
+        NaN values are ignored.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Time based data.
+        resolution : float
+            The size of the depth bins.  The bin edges are multiples of the resolution.
+        columns : list|tuple, optional
+            The columns to aggregate.  If None, all the numeric columns except the depth are used. The default is None.
+        depthColumn : str, optional
+            The column name of the depth data. The default is "Depth".
+        statistics : list|tuple, optional
+            The statistics calculated for each column.  Options are "mean", "max", and "count". The default is ("mean", "max", "count").
+        onBottom : str|np.ndarray|pd.Series, optional
+            A boolean column name (or array) that is True when the bit is on bottom.  If provided, only the rows that are on bottom
+            are used. The default is None.
+        newHoleOnly : bool, optional
+            If True, only the rows where the depth is at its maximum so far (drilling new hole) are used.  Rows from back reaming
+            and other passes over depth that has already been drilled are ignored. The default is False.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The binned data.
+        """
+        for statistic in statistics:
+            if statistic not in ("mean", "max", "count"):
+                raise Exception("Invalid statistic \"" + str(statistic) + "\" provided.")
+        if resolution <= 0:
+            raise Exception("The resolution must be greater than zero.")
+
+        if columns is None:
+            columns = [column for column in data.select_dtypes(include=np.number).columns if column != depthColumn]
+        columns = list(columns)
+
+        depth = data[depthColumn].to_numpy(dtype=np.float64)
+        keep  = ~np.isnan(depth)
+
+        if onBottom is not None:
+            keep &= np.asarray(data[onBottom] if isinstance(onBottom, str) else onBottom, dtype=bool)
+
+        if newHoleOnly:
+            keep &= depth >= np.fmax.accumulate(depth)
+
+        # The rows that are used.  None if all the rows are used, which avoids copying the columns.
+        rows  = None if keep.all() else np.flatnonzero(keep)
+        if rows is not None:
+            depth = depth[rows]
+        bins  = np.floor(depth / resolution).astype(np.int64)
+
+        # Sort by bin unless the depth is already in order (e.g., only new hole is used).
+        if np.any(bins[1:] < bins[:-1]):
+            order = np.argsort(bins, kind="stable")
+            rows  = order if rows is None else rows[order]
+            bins  = bins[order]
+
+        # The start and length of each run of the same bin.
+        starts  = np.flatnonzero(np.diff(bins, prepend=bins[0]-1)) if len(bins) > 0 else np.empty(0, dtype=np.int64)
+        lengths = np.diff(starts, append=len(bins))
+
+        binned  = {depthColumn : (bins[starts] + 0.5) * resolution}
+
+        for column in columns:
+            values = data[column].to_numpy(dtype=np.float64)
+            if rows is not None:
+                values = values[rows]
+
+            if len(starts) == 0:
+                counts = sums = maximums = np.empty(0)
+            else:
+                isNan = np.isnan(values)
+                if isNan.any():
+                    counts = np.add.reduceat(~isNan, starts)
+                    sums   = np.add.reduceat(np.where(isNan, 0.0, values), starts)
+                else:
+                    counts = lengths
+                    sums   = np.add.reduceat(values, starts)
+                maximums   = np.fmax.reduceat(values, starts) if "max" in statistics else None
+
+            if "mean" in statistics:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    binned[column] = sums / counts
+            if "max" in statistics:
+                binned[column + " Maximum"] = maximums
+            if "count" in statistics:
+                binned[column + " Count"] = counts
+
+        return pd.DataFrame(binned)
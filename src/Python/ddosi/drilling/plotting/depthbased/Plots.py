@@ -13,6 +13,7 @@ from   lendres.plotting.LegendHelper                                 import Lege
 from   lendres.plotting.LegendOptions                                import LegendOptions
 
 from   ddosi.plotting.DesignatedColors                               import DesignatedColors
+from   ddosi.plotting.LineDecimation                                 import LineDecimation
 
 
 class Plots():
@@ -67,7 +68,7 @@ class Plots():
 
 
     @classmethod
-    def NewWobAndRotarySpeedPlot(cls, data:pd.DataFrame, yAxisColumn:str="Depth", wobColumn:str="Weight on Bit", yUnits:str="cm", rpmColumn:str="Rotary Speed", title:str="Weight on Bit and Rotary Speed", titleSuffix:str=None, **kwargs):
+    def NewWobAndRotarySpeedPlot(cls, data:pd.DataFrame, yAxisColumn:str="Depth", wobColumn:str="Weight on Bit", yUnits:str="cm", rpmColumn:str="Rotary Speed", title:str="Weight on Bit and Rotary Speed", titleSuffix:str=None, decimate:bool=True, **kwargs):
         """
         Creates a depth based weight on bit and rotary speed plot.  The weight on bit and rotary speed are plotted on their own axes.  The plot is NOT finalized.
 
@@ -91,6 +92,9 @@ class Plots():
             If specified, it is added as a second line immediately under "title". The default is None.
         legendOptions : LegendOptions, optional
             Options that specify if and how the legend is generated. The default is LegendOptions().
+        decimate : bool, optional
+            If True, data with more rows than "LineDecimation.threshold" is reduced to a minimum/maximum envelope before plotting.
+            The plotted lines look the same, but draw and export much faster. The default is True.
         **kwargs : keyword arguments
             These arguments are passed to the plot function.  Each keyword argument can be a single value or a list.  If it is
             a single value, the same value is used for every call to plat.  If it is a list, the values are passed in order to
@@ -114,6 +118,10 @@ class Plots():
         yDataLabels    = [[wobColumn], [rpmColumn]]
 
         kwargs         = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, yDataLabels)
+
+        if decimate:
+            data = LineDecimation.Decimate(data, yDataLabels)
+
         figure, axeses = PlotMaker.NewMultiXAxesPlot(data, yAxisColumn, yDataLabels, **kwargs)
 
         cls.SetFigureSize(figure)
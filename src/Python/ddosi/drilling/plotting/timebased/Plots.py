@@ -13,6 +13,9 @@ from   lendres.plotting.LegendOptions                                import Lege
 from   lendres.datatypes.ListTools                                   import ListTools
 
 from   ddosi.plotting.DesignatedColors                               import DesignatedColors
+from   ddosi.plotting.LineDecimation                                 import LineDecimation
+from   ddosi.plotting.LevelOfDetail                                  import LevelOfDetail
+from   ddosi.plotting.FigureTemplate                                 import FigureTemplate
 
 
 class Plots():
@@ -66,10 +69,13 @@ class Plots():
 
 
     @classmethod
-    def NewWobAndRotarySpeedPlot(cls, data:pd.DataFrame, xAxisColumn:str="Time", wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", title:str="Weight on Bit and Rotary Speed", titleSuffix:str=None, **kwargs):
+    def NewWobAndRotarySpeedPlot(cls, data:pd.DataFrame, xAxisColumn:str="Time", wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", title:str="Weight on Bit and Rotary Speed", titleSuffix:str=None, decimate:bool=True, **kwargs):
         yDataLabels = [[wobColumn], [rpmColumn]]
         kwargs      = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, yDataLabels)
 
+        if decimate:
+            data = LineDecimation.Decimate(data, yDataLabels)
+
         figure, axeses = PlotMaker.NewMultiYAxesPlot(data, xAxisColumn, yDataLabels, **kwargs)
 
         # Title and labels.
@@ -142,7 +148,7 @@ class Plots():
 
 
     @classmethod
-    def NewParameterWobAndRotarySpeedPlot(cls, title:str, data:pd.DataFrame, xAxisColumn:str, parameterLabel:str, parameterColumn:str, wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", titleSuffix:str=None, **kwargs):
+    def NewParameterWobAndRotarySpeedPlot(cls, title:str, data:pd.DataFrame, xAxisColumn:str, parameterLabel:str, parameterColumn:str, wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", titleSuffix:str=None, decimate:bool=True, **kwargs):
         """
         Plots a parameter versus the weight on bit and rotary speed on a multi y-axes figure.  The parameter is read off of the left axis and the weight on bit and rotary speed
         have axes on the right side.
@@ -167,6 +173,9 @@ class Plots():
             The column name of the rotary speed. The default is "Rotary Speed".
         titleSuffix : str
             The second line of the title, if present.  If the titleSuffix string is blank, the second line is not added. The default is "".
+        decimate : bool, optional
+            If True, data with more rows than "LineDecimation.threshold" is reduced to a minimum/maximum envelope before plotting.
+            The plotted lines look the same, but draw and export much faster. The default is True.
         **kwargs : keyword arguments
             These arguments are passed to the plot function.
 
@@ -180,6 +189,9 @@ class Plots():
         yDataLabels = [[parameterColumn], [wobColumn], [rpmColumn]]
         kwargs      = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, yDataLabels)
 
+        if decimate:
+            data = LineDecimation.Decimate(data, yDataLabels)
+
         figure, axeses = PlotMaker.NewMultiYAxesPlot(data, xAxisColumn, yDataLabels, **kwargs)
 
         # Labels.
@@ -189,12 +201,57 @@ class Plots():
 
 
     @classmethod
-    def NewThreeAxesWobAndRotarySpeedFigure(cls, title:str, data:pd.DataFrame, xAxisColumn:str="Time", wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", titleSuffix:str=None, **kwargs):
+    def NewParameterWobAndRotarySpeedTemplate(cls, title:str, data:pd.DataFrame, xAxisColumn:str, parameterLabel:str, parameterColumn:str, wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", titleSuffix:str=None, legendOptions:LegendOptions=LegendOptions(), decimate:bool=True, **kwargs):
+        """
+        Creates a reusable parameter, weight on bit, and rotary speed figure (see "NewParameterWobAndRotarySpeedPlot").  The figure and
+        legend are built once from "data".  Use "FigureTemplate.Update" to plot other runs in the same figure.
+
+        Parameters
+        ----------
+        title : str
+            The first line of the title..
+        data : pd.DataFrame
+            The data used to build the figure.
+        xAxisColumn : str
+            The column name of the x-axis data.
+        parameterLabel : str
+            Left y-axis label.
+        parameterColumn : str
+            The column name of the parameter to plot on the left axis.
+        wobColumn : str, optional
+            The column name of the weight on bit. The default is "Weight on Bit".
+        rpmColumn : str, optional
+            The column name of the rotary speed. The default is "Rotary Speed".
+        titleSuffix : str
+            The second line of the title, if present.  If the titleSuffix string is blank, the second line is not added. The default is "".
+        legendOptions : LegendOptions, optional
+            Options that specify if and how the legend is generated. The default is LegendOptions().
+        decimate : bool, optional
+            If True, the data is reduced to a minimum/maximum envelope before plotting. The default is True.
+        **kwargs : keyword arguments
+            These arguments are passed to the plot function.
+
+        Returns
+        -------
+        template : FigureTemplate
+            The figure template.
+        """
+        figure, axeses = cls.NewParameterWobAndRotarySpeedPlot(title, data, xAxisColumn, parameterLabel, parameterColumn, wobColumn, rpmColumn, titleSuffix, decimate=decimate, **kwargs)
+        LegendHelper.CreateLegendAtFigureBottom(figure, axeses[0], offset=0.15*PlotHelper.GetSettings().Scale, legendOptions=legendOptions)
+        return FigureTemplate(figure, axeses, xAxisColumn, "x", decimate=decimate)
+
+
+    @classmethod
+    def NewThreeAxesWobAndRotarySpeedFigure(cls, title:str, data:pd.DataFrame, xAxisColumn:str="Time", wobColumn:str="Weight on Bit", rpmColumn:str="Rotary Speed", titleSuffix:str=None, decimate:bool=True, **kwargs):
         # Creates a figure with two axes having an aligned (shared) x-axis.
         figure, axeses = PlotHelper.NewMultiYAxesFigure(3)
 
         yDataLabels = [[wobColumn], [rpmColumn]]
         kwargs      = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, yDataLabels)
+
+        if decimate:
+            data = LineDecimation.Decimate(data, yDataLabels)
+
         PlotMaker.MultiAxesPlot(axeses[1:], data, xAxisColumn, yDataLabels, "x", **kwargs)
 
         # Labels.
@@ -204,17 +261,24 @@ class Plots():
 
 
     @classmethod
-    def NewCombinedAccelerationPlot(cls, data:pd.DataFrame, columns:list=["Acceleration X", "Acceleration Y", "Acceleration Z"], title:str="Accelerations", titleSuffix:str=None, **kwargs):
+    def NewCombinedAccelerationPlot(cls, data:pd.DataFrame, columns:list=["Acceleration X", "Acceleration Y", "Acceleration Z"], title:str="Accelerations", titleSuffix:str=None, decimate:bool=True, levelOfDetail:bool=False, **kwargs):
         PlotHelper.Format()
 
         kwargs            = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, columns)
         seriesKeyWordArgs = PlotHelper.ConvertKeyWordArgumentsToSeriesSets(ListTools.GetLengthOfNestedObjects(columns), **kwargs)
 
+        # A level of detail pyramid replaces the decimation because it draws the full resolution data when zoomed in.
+        if decimate and not levelOfDetail:
+            data = LineDecimation.Decimate(data, columns)
+
         figure = plt.gcf()
         axes   = plt.gca()
 
         for i in range(len(columns)):
-            axes.plot(data["Time"], data[columns[i]], label=columns[i], **(seriesKeyWordArgs[i]))
+            if levelOfDetail:
+                LevelOfDetail.Plot(axes, data["Time"], data[columns[i]], label=columns[i], **(seriesKeyWordArgs[i]))
+            else:
+                axes.plot(data["Time"], data[columns[i]], label=columns[i], **(seriesKeyWordArgs[i]))
 
         AxesHelper.Label(axes, title, "Time (s)", "Acceleration (m/s^2)", titleSuffix=titleSuffix)
 
@@ -230,16 +294,51 @@ class Plots():
 
 
     @classmethod
-    def NewAccelerationPlot(cls, data:pd.DataFrame, column:str, title:str="Acceleration", titleSuffix:str=None, **kwargs):
+    def NewAccelerationPlot(cls, data:pd.DataFrame, column:str, title:str="Acceleration", titleSuffix:str=None, decimate:bool=True, levelOfDetail:bool=False, **kwargs):
+        """
+        Creates an acceleration versus time plot.  The plot is NOT finalized.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data.
+        column : str
+            The column name of the acceleration.
+        title : str, optional
+            The figure title. The default is "Acceleration".
+        titleSuffix : str, optional
+            If specified, it is added as a second line immediately under "title". The default is None.
+        decimate : bool, optional
+            If True, data with more rows than "LineDecimation.threshold" is reduced to a minimum/maximum envelope before plotting.
+            The default is True.
+        levelOfDetail : bool, optional
+            If True, the line is drawn from a "LevelOfDetail" pyramid.  The resolution is updated when the axes are panned or
+            zoomed so full resolution detail is shown when zoomed in.  Replaces "decimate". The default is False.
+        **kwargs : keyword arguments
+            These arguments are passed to the plot function.
+
+        Returns
+        -------
+        figure : matplotlib.figure.Figure
+            The newly created figure.
+        axes : matplotlib.axes.Axes
+            The axes of the plot.
+        """
         # Must be run before creating figure or plotting data.
         PlotHelper.Format()
 
         kwargs = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, column)
 
+        if decimate and not levelOfDetail:
+            data = LineDecimation.Decimate(data, column)
+
         figure = plt.gcf()
         axes   = plt.gca()
 
-        axes.plot(data["Time"], data[column], label=column, **kwargs)
+        if levelOfDetail:
+            LevelOfDetail.Plot(axes, data["Time"], data[column], label=column, **kwargs)
+        else:
+            axes.plot(data["Time"], data[column], label=column, **kwargs)
         AxesHelper.Label(axes, title, "Time (s)", "Acceleration (m/s^2)", titleSuffix=titleSuffix)
 
         return figure, axes
\ No newline at end of file
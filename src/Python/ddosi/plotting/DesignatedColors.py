@@ -3,23 +3,38 @@ Created on February 17, 2023
 @author: Lance A. Endres
 """
 import pandas                                                        as pd
+import hashlib
+import json
 import os
+import threading
 
 from   lendres.path.Path                                             import Path
 from   lendres.plotting.PlotHelper                                   import PlotHelper
 
 
 class DesignatedColors():
+    # The color map.  The keys are the categories and the values are the lists of colors of the categories.
     colors          = None
-    usedColors      = None
     numberOfColors  = 0
 
+    # The closest matching category of each name looked up (None if the name does not match a category).
+    categories      = {}
+
+    # Folder of the files that cache the color maps read from Excel files.  The cache files are kept out of the package and
+    # data folders, which may be read only or under version control.
+    cacheDirectory  = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "ddosi")
+
+    lock            = threading.RLock()
+
 
     @classmethod
     def Initialize(cls, file:str=None):
         """
         Initializes the color map by reading it from a file.  Call this before attempting to call "GetColors".
 
+        Reading the Excel file is slow, so the color map is also written to a cache file in the folder "cacheDirectory".  The cache
+        file is used until the Excel file is modified.
+
         Parameters
         ----------
         file : str, optional
@@ -37,9 +52,123 @@ class DesignatedColors():
         if not Path.ContainsDirectory(file):
             file = os.path.join(Path.GetDirectory(__file__), file)
 
+        colors = cls._ReadCache(file)
+        if colors is None:
+            colors = cls._ReadExcel(file)
+            cls._WriteCache(file, colors)
+
+        with cls.lock:
+            cls.colors         = colors
+            cls.numberOfColors = max((len(categoryColors) for categoryColors in colors.values()), default=0)
+            cls.categories     = {}
+
+
+    @classmethod
+    def _ReadExcel(cls, file:str) -> dict:
+        """
+        Reads the color map from an Excel file.
+
+        Parameters
+        ----------
+        file : str
+            Excel file that contains the color map.
+
+        Returns
+        -------
+        colors : dict
+            The color map.
+        """
         # The first column are row labels and we indicate that by using "indoex_col=0".
-        cls.colors         = pd.read_excel(file, index_col=0)
-        cls.numberOfColors = len(cls.colors.columns)
+        dataFrame = pd.read_excel(file, index_col=0)
+
+        # The colors of a category end at the first empty cell.
+        colors    = {}
+        for category, row in dataFrame.iterrows():
+            categoryColors = []
+            for color in row:
+                if pd.isna(color):
+                    break
+                categoryColors.append(str(color))
+            colors[str(category)] = categoryColors
+        return colors
+
+
+    @classmethod
+    def _ReadCache(cls, file:str) -> dict|None:
+        """
+        Reads the color map from the cache file of an Excel file.
+
+        Parameters
+        ----------
+        file : str
+            Excel file that contains the color map.
+
+        Returns
+        -------
+        : dict|None
+            The color map, or None if the cache file does not exist or is out of date.
+        """
+        try:
+            with open(cls._GetCacheFile(file), "r") as cacheFile:
+                cache = json.load(cacheFile)
+            if cache["modified"] == os.path.getmtime(file) and cache["size"] == os.path.getsize(file):
+                return cache["colors"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+
+    @classmethod
+    def _WriteCache(cls, file:str, colors:dict):
+        """
+        Writes the color map to the cache file of an Excel file.  If the cache file cannot be written (e.g., the cache folder is
+        read only), the Excel file is read every time.
+
+        Parameters
+        ----------
+        file : str
+            Excel file that contains the color map.
+        colors : dict
+            The color map.
+
+        Returns
+        -------
+        None.
+        """
+        cache = {"modified" : os.path.getmtime(file), "size" : os.path.getsize(file), "colors" : colors}
+        try:
+            os.makedirs(cls.cacheDirectory, exist_ok=True)
+
+            # Write to a temporary file and rename it so other processes never read a partially written file.
+            cacheFile     = cls._GetCacheFile(file)
+            temporaryFile = cacheFile + "." + str(os.getpid())
+            with open(temporaryFile, "w") as outputFile:
+                json.dump(cache, outputFile)
+            os.replace(temporaryFile, cacheFile)
+        except OSError:
+            pass
+
+
+    @classmethod
+    def _GetCacheFile(cls, file:str) -> str:
+        """
+        Gets the path of the cache file of an Excel file.  The name includes a hash of the full path of the Excel file so that Excel
+        files with the same name in different folders do not share a cache file.
+
+        Parameters
+        ----------
+        file : str
+            Excel file that contains the color map.
+
+        Returns
+        -------
+        : str
+            The path of the cache file.
+        """
+        path = os.path.abspath(file)
+        name = os.path.splitext(os.path.basename(path))[0]
+        key  = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+        return os.path.join(cls.cacheDirectory, name + "-" + key + ".json")
 
 
     @classmethod
@@ -128,60 +257,92 @@ class DesignatedColors():
         colors : list
             A list of colors.  The list is a flat list (no nested lists).
         """
-        if cls.colors is None:
+        colors = cls.colors
+        if colors is None:
             raise Exception("The DesignatedColors class has not been properly initialized.")
 
-        # Add a column to remember the active color.
-        cls.colors["Active"] = 0
-        cls.usedColors       = []
+        # The number of colors used from each category and the colors used are specific to this call, so calls from different
+        # threads do not interfere.
+        active     = {}
+        usedColors = []
 
-        colors = []
-        cls._GetNamedColors(colors, names)
-        cls._FillRemainingColors(colors)
+        namedColors = []
+        cls._GetNamedColors(namedColors, names, colors, active, usedColors)
+        cls._FillRemainingColors(namedColors, usedColors)
 
         if type(names) is str:
-            return colors[0]
+            return namedColors[0]
         else:
-            return colors
+            return namedColors
 
 
     @classmethod
-    def _GetNamedColors(cls, colors:list, item:str|list|tuple):
+    def GetCategory(cls, name:str) -> str|None:
+        """
+        Finds the category of a name.  The category is the longest category that matches the start of the name.
+
+        Parameters
+        ----------
+        name : str
+            The name.
+
+        Returns
+        -------
+        : str|None
+            The category, or None if no category matches.
+        """
+        categories = cls.categories
+        if name in categories:
+            return categories[name]
+
+        # Check the start of the name from longest to shortest.
+        category = None
+        colors   = cls.colors
+        for length in range(len(name), 0, -1):
+            if name[:length] in colors:
+                category = name[:length]
+                break
+
+        with cls.lock:
+            cls.categories[name] = category
+        return category
+
+
+    @classmethod
+    def _GetNamedColors(cls, namedColors:list, item:str|list|tuple, colors:dict, active:dict, usedColors:list):
 
         match item:
             case str():
-                categories = cls.colors.index.values
-                matches    = [category for category in categories if item.startswith(category)]
-                if len(matches) > 0:
-                    # Find the best match of the matches and return the color for that category.
-                    category = max(matches, key=len)
-                    colors.append(cls._GetCategoryColor(category))
+                category = cls.GetCategory(item)
+                if category is None:
+                    namedColors.append("")
                 else:
-                    colors.append("")
+                    namedColors.append(cls._GetCategoryColor(category, colors, active, usedColors))
 
             case list() | tuple():
                 for entry in item:
-                    cls._GetNamedColors(colors, entry)
+                    cls._GetNamedColors(namedColors, entry, colors, active, usedColors)
 
             case _:
                 raise Exception("Unknown object type in input colors.")
 
 
     @classmethod
-    def _GetCategoryColor(cls, category):
-        column = cls.colors.loc[category, "Active"]
+    def _GetCategoryColor(cls, category:str, colors:dict, active:dict, usedColors:list):
+        column         = active.get(category, 0)
+        categoryColors = colors[category]
 
-        if column == cls.numberOfColors or pd.isna(cls.colors.loc[category, column]):
+        if column == len(categoryColors):
             return ""
         else:
-            cls.colors.loc[category, "Active"] = column + 1
-            color                             = cls.colors.loc[category, column]
-            cls.usedColors.append(color)
+            active[category] = column + 1
+            color            = categoryColors[column]
+            usedColors.append(color)
             return color
 
 
     @classmethod
-    def _FillRemainingColors(cls, colors:list):
+    def _FillRemainingColors(cls, colors:list, usedColors:list):
         """
         Provides colors for any names that were not found in the list of named colors.  Specificially, it looks
         for empty strings ('') and replaces them with a color in hexadecimal.
@@ -190,6 +351,8 @@ class DesignatedColors():
         ----------
         colors : list
             List of strings.
+        usedColors : list
+            The colors already used.
 
         Returns
         -------
@@ -197,20 +360,27 @@ class DesignatedColors():
         """
         for i in range(len(colors)):
             if colors[i] == "":
-                colors[i] = cls._GetNextColor()
+                colors[i] = cls._GetNextColor(usedColors)
 
 
     @classmethod
-    def _GetNextColor(cls):
+    def _GetNextColor(cls, usedColors:list):
         """
         Get a color from the color cycle.  The color returned will be unique (not in the colors already used).
 
+        Parameters
+        ----------
+        usedColors : list
+            The colors already used.
+
         Returns
         -------
         color : str
             A color as a hexadecimal string.
         """
-        color = PlotHelper.NextColorAsHex()
-        while color in cls.usedColors:
+        # The color cycle is shared.
+        with cls.lock:
             color = PlotHelper.NextColorAsHex()
-        return color
\ No newline at end of file
+            while color in usedColors:
+                color = PlotHelper.NextColorAsHex()
+        return color
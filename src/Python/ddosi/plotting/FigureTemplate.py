@@ -0,0 +1,143 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+
+from   matplotlib.ticker                                             import AutoLocator
+from   matplotlib.ticker                                             import FixedLocator
+
+from   lendres.plotting.AxesHelper                                   import AxesHelper
+
+from   ddosi.plotting.LineDecimation                                 import LineDecimation
+
+
+class FigureTemplate():
+    """
+    Reuses a figure to plot the same layout for many runs.
+
+    The figure (axes, labels, colors, and legend) is built once by a plot function.  For each run, only the data of the lines,
+    the axes limits, and the title are updated, so the cost of each figure is the cost of drawing the data.
+
+    The lines are matched to the data columns by their labels, which the plot functions set to the column names.  If the plot
+    function aligned the ticks of multiple axes, they are aligned again after the axes are rescaled.
+
+    Example
+    -------
+    template = Plots.NewParameterWobAndRotarySpeedTemplate("Torque", runs[0], "Time", "Torque (daN.m)", "Torque on Bit")
+    for name, data in runs:
+        template.Update(data, titleSuffix=name)
+        template.Save(name + ".png")
+    """
+
+
+    def __init__(self, figure, axeses, independentColumn:str, independentAxis:str="x", decimate:bool=True):
+        """
+        Contructor.
+
+        Parameters
+        ----------
+        figure : matplotlib.figure.Figure
+            The figure created by a plot function.
+        axeses : matplotlib.axes.Axes or list of matplotlib.axes.Axes
+            The axes of the figure.
+        independentColumn : str
+            The column name of the independent data (e.g., "Time" or "Depth").
+        independentAxis : str, optional
+            The axis the independent data is plotted on, "x" or "y". The default is "x".
+        decimate : bool, optional
+            If True, the data is decimated with "LineDecimation" before updating the lines. The default is True.
+
+        Returns
+        -------
+        None.
+        """
+        if independentAxis not in ("x", "y"):
+            raise Exception("Invalid 'independentAxis' argument provided.")
+
+        self.figure            = figure
+        self.axeses            = list(axeses) if isinstance(axeses, (list, tuple)) else [axeses]
+        self.independentColumn = independentColumn
+        self.independentAxis   = independentAxis
+        self.decimate          = decimate
+        self.dependentAxis     = "y" if independentAxis == "x" else "x"
+
+        # Lines whose label is not a column name (e.g., lines added for annotations) are left alone.
+        self.lines             = [line for axes in self.axeses for line in axes.lines if not line.get_label().startswith("_")]
+        self.columns           = [line.get_label() for line in self.lines]
+
+        # The title is on whichever axes it was placed on.  Only the first line is kept, the second line is the title suffix.
+        self.titleAxes         = next((axes for axes in self.axeses if axes.get_title() != ""), self.axeses[-1])
+        self.title             = self.titleAxes.get_title().split("\n")[0]
+
+        # Multiple axes plots fix the ticks of the dependent axes so the grid lines line up.
+        self.alignAxes         = len(self.axeses) > 1 and isinstance(self._GetDependentAxis(self.axeses[0]).get_major_locator(), FixedLocator)
+
+
+    def Update(self, data:pd.DataFrame, titleSuffix:str=None, title:str=None):
+        """
+        Replaces the data of the lines, rescales the axes, and sets the title.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data of the new run.  It must contain the independent column and the column of every line.
+        titleSuffix : str, optional
+            If specified, it is added as a second line immediately under the title. The default is None.
+        title : str, optional
+            The first line of the title.  If None, the title of the template is used. The default is None.
+
+        Returns
+        -------
+        None.
+        """
+        if self.decimate:
+            data = LineDecimation.Decimate(data, self.columns)
+
+        independent = data[self.independentColumn].to_numpy()
+
+        for line, column in zip(self.lines, self.columns):
+            values = data[column].to_numpy()
+            if self.independentAxis == "x":
+                line.set_data(independent, values)
+            else:
+                line.set_data(values, independent)
+
+        # The fixed ticks and limits of aligned axes are released so the axes can be rescaled.  Axis inversion (e.g., depth based
+        # plots) is kept by autoscaling.
+        for axes in self.axeses:
+            if self.alignAxes:
+                self._GetDependentAxis(axes).set_major_locator(AutoLocator())
+                axes.autoscale(True, axis=self.dependentAxis)
+            axes.relim()
+            axes.autoscale_view()
+
+        if self.alignAxes:
+            AxesHelper.AlignAxes(self.axeses, self.dependentAxis)
+
+        title = self.title if title is None else title
+        if titleSuffix is not None:
+            title += "\n" + titleSuffix
+        self.titleAxes.set_title(title)
+
+
+    def Save(self, path:str, **kwargs):
+        """
+        Saves the figure.
+
+        Parameters
+        ----------
+        path : str
+            The output file path.
+        **kwargs : keyword arguments
+            Keyword arguments passed to the savefig function.
+
+        Returns
+        -------
+        None.
+        """
+        self.figure.savefig(path, **kwargs)
+
+
+    def _GetDependentAxis(self, axes):
+        return axes.yaxis if self.dependentAxis == "y" else axes.xaxis
@@ -0,0 +1,181 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+
+
+class LevelOfDetail():
+    """
+    A minimum/maximum pyramid of a channel that keeps a plotted line at screen resolution while panning and zooming.
+
+    Level "k" of the pyramid holds, for every block of 2^k samples, the index of the sample with the minimum value and the index
+    of the sample with the maximum value.  Each level is built from the level below it, so building the pyramid takes linear time
+    and the indices of all the levels together are about twice the length of the signal.
+
+    When attached to a line, the x-axis limits are monitored.  Every time they change, the coarsest level that still has
+    "numberOfPoints" points in the visible window is drawn.  Zoomed out, the envelope of the whole signal is drawn.  Zoomed in far
+    enough, the original samples are drawn.
+
+    The x values must be sorted (e.g., time).
+    """
+    # The target number of points drawn in the visible window.
+    numberOfPoints = 8000
+
+
+    def __init__(self, x:np.ndarray, y:np.ndarray, numberOfPoints:int=None):
+        """
+        Contructor.  Builds the pyramid.
+
+        Parameters
+        ----------
+        x : array like
+            The x values.  Must be sorted.
+        y : array like
+            The y values.
+        numberOfPoints : int, optional
+            The target number of points drawn in the visible window.  If None, the class setting is used. The default is None.
+
+        Returns
+        -------
+        None.
+        """
+        self.x              = np.asarray(x)
+        self.y              = np.asarray(y)
+        self.numberOfPoints = LevelOfDetail.numberOfPoints if numberOfPoints is None else numberOfPoints
+        self.line           = None
+        self.level          = None
+
+        if len(self.x) != len(self.y):
+            raise Exception("The x and y values must be the same length.")
+
+        self.levels         = self._BuildLevels()
+
+
+    @classmethod
+    def Plot(cls, axes, x:np.ndarray, y:np.ndarray, numberOfPoints:int=None, **kwargs):
+        """
+        Plots a line that uses a level of detail pyramid.
+
+        Parameters
+        ----------
+        axes : matplotlib.axes.Axes
+            The axes to plot on.
+        x : array like
+            The x values.  Must be sorted.
+        y : array like
+            The y values.
+        numberOfPoints : int, optional
+            The target number of points drawn in the visible window.  If None, the class setting is used. The default is None.
+        **kwargs : keyword arguments
+            Keyword arguments passed to the plot function.
+
+        Returns
+        -------
+        line : matplotlib.lines.Line2D
+            The line.  The pyramid is stored on the line as "levelOfDetail".
+        """
+        levelOfDetail = cls(x, y, numberOfPoints)
+        x, y          = levelOfDetail.GetData(levelOfDetail.x[0], levelOfDetail.x[-1])
+        line          = axes.plot(x, y, **kwargs)[0]
+        levelOfDetail.Attach(line)
+        return line
+
+
+    def Attach(self, line):
+        """
+        Attaches the pyramid to a line.  The data of the line is replaced every time the x-axis limits change.
+
+        Parameters
+        ----------
+        line : matplotlib.lines.Line2D
+            The line.
+
+        Returns
+        -------
+        None.
+        """
+        self.line          = line
+        line.levelOfDetail = self
+        line.axes.callbacks.connect("xlim_changed", self._OnXLimitsChanged)
+
+
+    def GetData(self, lowerLimit:float, upperLimit:float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the points to draw for the visible window.
+
+        Parameters
+        ----------
+        lowerLimit : float
+            The lower x limit of the window.
+        upperLimit : float
+            The upper x limit of the window.
+
+        Returns
+        -------
+        x : np.ndarray
+            The x values.
+        y : np.ndarray
+            The y values.
+        """
+        lowerLimit, upperLimit = min(lowerLimit, upperLimit), max(lowerLimit, upperLimit)
+
+        # One extra sample on each side so the line continues to the edges of the axes.
+        start      = max(int(np.searchsorted(self.x, lowerLimit, side="left"))-1, 0)
+        stop       = min(int(np.searchsorted(self.x, upperLimit, side="right"))+1, len(self.x))
+        length     = max(stop-start, 1)
+
+        # Each block draws two points.
+        self.level = min(max(int(np.ceil(np.log2(2.0*length/self.numberOfPoints))), 0), len(self.levels))
+        if self.level == 0:
+            return self.x[start:stop], self.y[start:stop]
+
+        mins, maxs = self.levels[self.level-1]
+        first      = start >> self.level
+        last       = ((stop-1) >> self.level) + 1
+        indices    = np.sort(np.stack([mins[first:last], maxs[first:last]], axis=1), axis=1).ravel()
+
+        return self.x[indices], self.y[indices]
+
+
+    def _OnXLimitsChanged(self, axes):
+        x, y = self.GetData(*axes.get_xlim())
+        self.line.set_data(x, y)
+
+
+    def _BuildLevels(self) -> list:
+        """
+        Builds the levels of the pyramid above the original samples.
+
+        Returns
+        -------
+        levels : list
+            Level "k" (starting at one) is at index "k-1" and is a tuple of the minimum and maximum indices of each block.
+        """
+        levels    = []
+        indexType = np.int32 if len(self.y) < np.iinfo(np.int32).max else np.int64
+        mins      = np.arange(len(self.y), dtype=indexType)
+        maxs      = mins
+
+        # NaNs are never chosen over a number.
+        y         = self.y
+        isNan     = np.isnan(y) if np.issubdtype(y.dtype, np.floating) else None
+
+        while len(mins) > 1 and 2*len(mins) > self.numberOfPoints:
+            # An odd block at the end is paired with itself.
+            if len(mins) % 2 == 1:
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+
+            mins = self._Choose(mins[0::2], mins[1::2], np.less, isNan)
+            maxs = self._Choose(maxs[0::2], maxs[1::2], np.greater, isNan)
+            levels.append((mins, maxs))
+
+        return levels
+
+
+    def _Choose(self, first:np.ndarray, second:np.ndarray, comparison, isNan:np.ndarray) -> np.ndarray:
+        useSecond = comparison(self.y[second], self.y[first])
+        if isNan is not None:
+            useSecond |= isNan[first]
+        return np.where(useSecond, second, first)
@@ -0,0 +1,106 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+
+class LineDecimation():
+    """
+    A static class for reducing the number of points in line plots without changing how they look.
+
+    The rows are split into bins (about one per pixel column of the plot).  For every bin, the rows that contain the minimum and
+    maximum of each series are kept, along with the first and last rows.  A line through the kept rows covers the same pixels as a
+    line through all the rows, so peaks are exact, but only a few thousand points are drawn and exported.
+
+    The rows are kept in their original order, so the method works for both time based and depth based plots.
+    """
+    # Data with more rows than this is decimated.
+    threshold    = 100000
+
+    # The number of bins.  It should be at least the number of pixel columns of the plot.
+    numberOfBins = 4000
+
+
+    @classmethod
+    def Decimate(cls, data:pd.DataFrame, columns:str|list|tuple, numberOfBins:int=None, threshold:int=None) -> pd.DataFrame:
+        """
+        Reduces the number of rows in "data" to the minimum and maximum of each bin of each column.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data.
+        columns : str|list|tuple
+            The columns that are plotted as the line values.  Nested lists (as used by the multiple axes plots) are flattened.
+        numberOfBins : int, optional
+            The number of bins.  If None, the class setting is used. The default is None.
+        threshold : int, optional
+            Data with this many rows or fewer is returned unchanged.  If None, the class setting is used. The default is None.
+
+        Returns
+        -------
+        : pd.DataFrame
+            The rows of "data" that are kept.  If the data is not decimated, the input is returned.
+        """
+        numberOfBins    = cls.numberOfBins if numberOfBins is None else numberOfBins
+        threshold       = cls.threshold    if threshold    is None else threshold
+        numberOfRows    = len(data)
+
+        if numberOfRows <= max(threshold, 2*numberOfBins):
+            return data
+
+        rows            = cls.GetEnvelopeRows(data[cls._FlattenColumns(columns)].to_numpy(dtype=np.float64), numberOfBins)
+        return data.iloc[rows]
+
+
+    @classmethod
+    def GetEnvelopeRows(cls, values:np.ndarray, numberOfBins:int) -> np.ndarray:
+        """
+        Finds the rows that contain the minimum and maximum of each bin of each column.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values (rows by columns).
+        numberOfBins : int
+            The number of bins.
+
+        Returns
+        -------
+        rows : np.ndarray
+            The sorted, unique row indices.
+        """
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+
+        numberOfRows = values.shape[0]
+        binLength    = -(-numberOfRows // numberOfBins)
+        numberOfBins = -(-numberOfRows // binLength)
+        padLength    = numberOfBins*binLength - numberOfRows
+        offsets      = np.arange(numberOfBins)[:, np.newaxis] * binLength
+
+        rows         = [np.array([0, numberOfRows-1])]
+        for column in values.T:
+            # NaNs are ignored by replacing them with values that are never the minimum (or maximum).  The padding at the end
+            # of the last bin is treated the same way.
+            isNan    = np.isnan(column)
+            low      = np.pad(np.where(isNan,  np.inf, column), (0, padLength), constant_values=np.inf).reshape(numberOfBins, binLength)
+            high     = np.pad(np.where(isNan, -np.inf, column), (0, padLength), constant_values=-np.inf).reshape(numberOfBins, binLength)
+            rows.append((offsets + np.argmin(low, axis=1)[:, np.newaxis]).ravel())
+            rows.append((offsets + np.argmax(high, axis=1)[:, np.newaxis]).ravel())
+
+        rows = np.unique(np.concatenate(rows))
+        return rows[rows < numberOfRows]
+
+
+    @classmethod
+    def _FlattenColumns(cls, columns:str|list|tuple) -> list:
+        if isinstance(columns, str):
+            return [columns]
+
+        flattened = []
+        for column in columns:
+            flattened.extend(cls._FlattenColumns(column))
+        return flattened
@@ -0,0 +1,234 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import importlib
+import multiprocessing
+import os
+
+from   concurrent.futures                                            import ProcessPoolExecutor
+
+
+class ReportRenderer():
+    """
+    Renders plots to files without a display, in parallel.
+
+    A report is a list of jobs.  Each job is a run (the data) and a plot specification (the plot function and its arguments).
+    The jobs are rendered in a pool of processes that use the non-interactive Agg backend.  Each figure is saved and closed as soon
+    as it is rendered, so the processes do not accumulate figures.
+
+    The plot function is stored by its module and name so the jobs can be sent to other processes.  Use the "New*" plot functions
+    (e.g., "Plots.NewWobAndRotarySpeedPlot"), which return the figure without finalizing it.  Each job is drawn on a new figure that
+    is the current figure when the plot function is called.
+
+    Lines and collections with many points are rasterized so vector outputs (e.g., PDF) stay small and fast to open.  The axes,
+    labels, and text remain vector graphics.
+
+    Example
+    -------
+    jobs = [ReportRenderer.NewJob(path, Plots.NewWobAndRotarySpeedPlot, os.path.join(outputDirectory, name), titleSuffix=name) for name, path in runs]
+    ReportRenderer.Render(jobs, formats=("png", "pdf"))
+    """
+    # Artists with more points than this are rasterized.
+    rasterizeThreshold = 10000
+
+    # Resolution of raster outputs and rasterized artists.
+    dpi                = 150
+
+
+    @classmethod
+    def NewJob(cls, data:pd.DataFrame|str, plotFunction, outputPath:str, **kwargs) -> dict:
+        """
+        Creates a job that can be sent to another process.
+
+        Parameters
+        ----------
+        data : pd.DataFrame|str
+            The data or the path to the data.  Paths are read in the worker process (see "LoadData"), which avoids copying the data
+            between processes.
+        plotFunction : function
+            The plot function.  It is called as plotFunction(data, **kwargs) and must return the figure (or a tuple that starts
+            with the figure).
+        outputPath : str
+            The output path without an extension.  The extension of each format is added.
+        **kwargs : keyword arguments
+            Keyword arguments passed to the plot function.
+
+        Returns
+        -------
+        job : dict
+            The job.
+        """
+        return {
+            "data"       : data,
+            "module"     : plotFunction.__module__,
+            "function"   : plotFunction.__qualname__,
+            "outputPath" : outputPath,
+            "kwargs"     : kwargs
+        }
+
+
+    @classmethod
+    def Render(cls, jobs:list, formats:list|tuple=("png",), numberOfProcesses:int=None, colorsFile:str=None) -> list:
+        """
+        Renders the jobs in a pool of processes.
+
+        Parameters
+        ----------
+        jobs : list
+            The jobs created with "NewJob".
+        formats : list|tuple, optional
+            The output file formats (extensions). The default is ("png",).
+        numberOfProcesses : int, optional
+            The number of processes.  If None, the number of CPUs is used.  If 1, the jobs are rendered in this process with its
+            current backend (see "RenderJob"). The default is None.
+        colorsFile : str, optional
+            The file used to initialize DesignatedColors in each process.  See "DesignatedColors.Initialize". The default is None.
+
+        Returns
+        -------
+        results : list
+            For each job, the list of files written.  If a job failed, its entry is the exception that was raised.
+        """
+        if numberOfProcesses == 1:
+            _InitializeWorker(colorsFile, useAgg=False)
+            return [_RenderJobSafely(job, formats) for job in jobs]
+
+        # Spawned processes do not inherit the pyplot state (or a display) from this process.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=numberOfProcesses, mp_context=context, initializer=_InitializeWorker, initargs=(colorsFile,)) as executor:
+            futures = [executor.submit(_RenderJobSafely, job, formats) for job in jobs]
+            return [future.result() for future in futures]
+
+
+    @classmethod
+    def RenderJob(cls, job:dict, formats:list|tuple=("png",)) -> list:
+        """
+        Renders one job in this process.
+
+        The backend of this process is used (the worker processes of "Render" use Agg).  Interactive mode is turned off while the
+        job is rendered, so the figure is not shown, and only the figures created by the job are closed.  Figures that were
+        already open are left alone.
+
+        Parameters
+        ----------
+        job : dict
+            The job created with "NewJob".
+        formats : list|tuple, optional
+            The output file formats (extensions). The default is ("png",).
+
+        Returns
+        -------
+        paths : list
+            The files written.
+        """
+        import matplotlib.pyplot                                     as plt
+
+        data         = cls.LoadData(job["data"])
+        plotFunction = cls._GetFunction(job["module"], job["function"])
+
+        openFigures  = set(plt.get_fignums())
+        try:
+            with plt.ioff():
+                # The new figure is the current figure, so the plot function draws on it.
+                figure   = plt.figure()
+                result   = plotFunction(data, **job["kwargs"])
+                figure   = result[0] if isinstance(result, tuple) else result
+
+                cls.RasterizeLargeArtists(figure)
+
+                paths    = []
+                for extension in formats:
+                    path = job["outputPath"] + "." + extension
+                    figure.savefig(path, dpi=cls.dpi, bbox_inches="tight")
+                    paths.append(path)
+        finally:
+            # The plot function may have created more figures than the one it returned.
+            for number in set(plt.get_fignums()) - openFigures:
+                plt.close(number)
+
+        return paths
+
+
+    @classmethod
+    def RasterizeLargeArtists(cls, figure):
+        """
+        Rasterizes the lines and collections that have more points than "rasterizeThreshold".
+
+        Parameters
+        ----------
+        figure : matplotlib.figure.Figure
+            The figure.
+
+        Returns
+        -------
+        None.
+        """
+        for axes in figure.axes:
+            for line in axes.lines:
+                if len(line.get_xdata(orig=False)) > cls.rasterizeThreshold:
+                    line.set_rasterized(True)
+
+            for collection in axes.collections:
+                if sum(len(path.vertices) for path in collection.get_paths()) > cls.rasterizeThreshold:
+                    collection.set_rasterized(True)
+
+
+    @classmethod
+    def LoadData(cls, data:pd.DataFrame|str) -> pd.DataFrame:
+        """
+        Loads the data of a job.  Paths ending in ".pickle" or ".pkl" are read with pandas.read_pickle, paths ending in ".parquet"
+        are read with pandas.read_parquet, and all other paths are read with pandas.read_csv.
+
+        Parameters
+        ----------
+        data : pd.DataFrame|str
+            The data or the path to the data.
+
+        Returns
+        -------
+        : pd.DataFrame
+            The data.
+        """
+        if not isinstance(data, str):
+            return data
+
+        match os.path.splitext(data)[1].lower():
+            case ".pickle" | ".pkl":
+                return pd.read_pickle(data)
+            case ".parquet":
+                return pd.read_parquet(data)
+            case _:
+                return pd.read_csv(data)
+
+
+    @classmethod
+    def _GetFunction(cls, moduleName:str, functionName:str):
+        function = importlib.import_module(moduleName)
+        for name in functionName.split("."):
+            function = getattr(function, name)
+        return function
+
+
+def _InitializeWorker(colorsFile:str=None, useAgg:bool=True):
+    """
+    Sets up a process for rendering.  Module level so it can be sent to the worker processes.
+    """
+    if useAgg:
+        import matplotlib
+        matplotlib.use("Agg")
+
+    from   ddosi.plotting.DesignatedColors                           import DesignatedColors
+    if DesignatedColors.colors is None:
+        DesignatedColors.Initialize(colorsFile)
+
+
+def _RenderJobSafely(job:dict, formats:list|tuple):
+    """
+    Renders a job and returns the exception instead of raising it, so one failed job does not stop the report.
+    """
+    try:
+        return ReportRenderer.RenderJob(job, formats)
+    except Exception as exception:
+        return exception
@@ -6,6 +6,9 @@ https://medium.com/analytics-vidhya/how-to-filter-noise-with-a-low-pass-filter-p
 """
 from   scipy.signal                              import butter
 from   scipy.signal                              import filtfilt
+from   scipy.signal                              import sosfiltfilt
+
+from   functools                                 import lru_cache
 
 
 def ButterworthLowPassFilter(data, cutOffFrequency, samplingFrequency, order):
@@ -14,7 +17,104 @@ def ButterworthLowPassFilter(data, cutOffFrequency, samplingFrequency, order):
 
     # Get the filter coefficients.
     # Analog is false because we are using regularly sampled data.
-    b, a = butter(order, normalCutOff, btype="low", analog=False)
+    b, a = _DesignCoefficients(order, normalCutOff)
     y    = filtfilt(b, a, data, method="gust")
 
-    return y, b, a
\ No newline at end of file
+    return y, b, a
+
+
+def ButterworthLowPassFilterBlock(data, cutOffFrequency:float, samplingFrequency:float, order:int, method:str="pad"):
+    """
+    Zero phase (forward-backward) Butterworth low pass filter applied to a block of channels in one call.
+
+    The "pad" method uses second-order sections, which are numerically robust at low cut off frequencies, and pads the ends of
+    the signal with an odd extension.  The "gust" method uses Gustafsson's method to choose the initial conditions.  It matches
+    "ButterworthLowPassFilter", but is much slower than padding.
+
+    Parameters
+    ----------
+    data : array like
+        The channels.  A 2-D array is arranged as samples by channels and is filtered along the first axis.
+    cutOffFrequency : float
+        The cut off frequency of the filter.
+    samplingFrequency : float
+        The sampling frequency of the data.
+    order : int
+        The order of the filter.
+    method : str, optional
+        The edge handling method, "pad" or "gust". The default is "pad".
+
+    Returns
+    -------
+    y : numpy.ndarray
+        The filtered data.  The same shape as the input.
+    """
+    match method:
+        case "pad":
+            # The cached design is read only, but scipy's sosfilt requires a writeable array.  The copy is a few values.
+            sos = ButterworthLowPassSos(cutOffFrequency, samplingFrequency, order).copy()
+            return sosfiltfilt(sos, data, axis=0, padtype="odd")
+
+        case "gust":
+            b, a = ButterworthLowPassCoefficients(cutOffFrequency, samplingFrequency, order)
+            return filtfilt(b, a, data, axis=0, method="gust")
+
+        case _:
+            raise Exception("Invalid 'method' argument provided.")
+
+
+@lru_cache(maxsize=128)
+def ButterworthLowPassSos(cutOffFrequency:float, samplingFrequency:float, order:int):
+    """
+    Designs a Butterworth low pass filter as second-order sections.  The designs are cached by the cut off frequency, sampling
+    frequency, and order so repeated calls do not redesign the filter.
+
+    Parameters
+    ----------
+    cutOffFrequency : float
+        The cut off frequency of the filter.
+    samplingFrequency : float
+        The sampling frequency of the data.
+    order : int
+        The order of the filter.
+
+    Returns
+    -------
+    sos : numpy.ndarray
+        The second-order sections.  The array is shared by all callers, so it is read only.
+    """
+    # Analog is false because we are using regularly sampled data.
+    sos = butter(order, cutOffFrequency, btype="low", analog=False, output="sos", fs=samplingFrequency)
+    sos.flags.writeable = False
+    return sos
+
+
+def ButterworthLowPassCoefficients(cutOffFrequency:float, samplingFrequency:float, order:int):
+    """
+    Designs a Butterworth low pass filter as numerator and denominator coefficients.  The designs are cached.
+
+    Parameters
+    ----------
+    cutOffFrequency : float
+        The cut off frequency of the filter.
+    samplingFrequency : float
+        The sampling frequency of the data.
+    order : int
+        The order of the filter.
+
+    Returns
+    -------
+    b : numpy.ndarray
+        Numerator coefficients.  Shared by all callers, so it is read only.
+    a : numpy.ndarray
+        Denominator coefficients.  Shared by all callers, so it is read only.
+    """
+    return _DesignCoefficients(order, cutOffFrequency/(0.5*samplingFrequency))
+
+
+@lru_cache(maxsize=128)
+def _DesignCoefficients(order:int, normalCutOff:float):
+    b, a = butter(order, normalCutOff, btype="low", analog=False)
+    b.flags.writeable = False
+    a.flags.writeable = False
+    return b, a
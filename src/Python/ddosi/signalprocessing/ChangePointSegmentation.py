@@ -0,0 +1,171 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+
+from   SegmentSignalPy                                               import SegmentationResults
+
+
+class ChangePointSegmentation():
+    """
+    A static class for segmenting a signal with a pruned exact linear time (PELT) change point search.
+
+    Each segment is modeled as Gaussian with its own mean and variance.  The cost of a segment of "n" samples is twice its negative
+    log likelihood, without constants, "n*(log(bounded) + variance/bounded)", where "bounded" is the variance, but not less than the
+    variance floor.  Every boundary adds a penalty.  The segmentation with the lowest total cost is found exactly.  The mean and
+    variance of any segment are calculated from prefix sums of the signal and its square, so each cost takes constant time.  Start
+    points that can no longer be the start of the last segment are pruned (splitting a segment never increases this cost), so the
+    search is linear in the length of the signal when the number of boundaries grows with the length.  It is slower than the Single
+    Most Likelihood Replacement algorithm on long signals with many boundaries because the search is a loop in Python.
+
+    Unlike the Single Most Likelihood Replacement iterations, there is no iteration limit and the search cannot fail.
+
+    The search advances "minimumSegmentLength" samples at a time because none of those samples can start a segment that ends at
+    another of them.  Longer minimum segments are faster.
+    """
+    # Segments shorter than this are not found.  Must be at least 2 for the variance of a segment to be defined.
+    minimumSegmentLength = 5
+
+    # The variance of a segment is not allowed to be less than this fraction of the noise variance estimated from the first differences
+    # of the signal.  Without it, flat segments (e.g., quantized or held values) have no cost.
+    varianceFloor        = 0.01
+
+
+    @classmethod
+    def Segment(cls, signal, threshold:float, minimumSegmentLength:int=None):
+        """
+        Segments a signal.
+
+        Parameters
+        ----------
+        signal : array like
+            Input signal to be segmented.
+        threshold : float
+            Segmentation threshold.  The penalty of each boundary is "threshold*log(N)", where "N" is the length of the signal.
+            A threshold of 3 is the Bayesian information criterion for a change in mean and variance.
+        minimumSegmentLength : int, optional
+            The minimum length of a segment.  If None, the class setting is used. The default is None.
+
+        Returns
+        -------
+        results : SegmentationResults
+            Results of the segmentation.  There is no filtering step, so the filtered signal is the segmented log.  The noise variance
+            is the variance of each segment.  Iterations is one (a single pass).
+        """
+        minimumSegmentLength = cls.minimumSegmentLength if minimumSegmentLength is None else minimumSegmentLength
+        if minimumSegmentLength < 2:
+            raise Exception("The minimum segment length must be at least 2.")
+
+        values       = np.asarray(signal, dtype=np.float64)
+        signalLength = len(values)
+        if signalLength < 2*minimumSegmentLength:
+            raise Exception("The signal must be at least twice the minimum segment length.")
+
+        segmentStarts       = cls._Search(values, threshold*np.log(signalLength), minimumSegmentLength)
+        segmentLengths      = np.diff(np.append(segmentStarts, signalLength))
+
+        means               = np.add.reduceat(values, segmentStarts) / segmentLengths
+        variances           = np.add.reduceat((values-np.repeat(means, segmentLengths))**2, segmentStarts) / segmentLengths
+        variances           = np.maximum(variances, cls._GetVarianceFloor(values))
+
+        binaryEventSequence = np.zeros(signalLength, dtype=np.int32)
+        binaryEventSequence[segmentStarts[1:]] = 1
+        numberOfEvents      = len(segmentStarts) - 1
+
+        segmentedLog        = np.repeat(means, segmentLengths)
+        jumps               = np.diff(means)
+
+        return SegmentationResults(
+            signalLength,
+            binaryEventSequence,
+            numberOfEvents,
+            segmentedLog,
+            segmentedLog.copy(),
+            np.repeat(variances, segmentLengths),
+            float(np.var(jumps)) if numberOfEvents > 0 else 0.0,
+            numberOfEvents / signalLength,
+            1,
+            0
+        )
+
+
+    @classmethod
+    def _Search(cls, values:np.ndarray, penalty:float, minimumSegmentLength:int) -> np.ndarray:
+        """
+        Finds the segmentation with the lowest cost.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The signal.
+        penalty : float
+            The penalty of each boundary.
+        minimumSegmentLength : int
+            The minimum length of a segment.
+
+        Returns
+        -------
+        segmentStarts : np.ndarray
+            The index of the first sample of each segment.  The first segment starts at zero.
+        """
+        signalLength = len(values)
+        floor        = cls._GetVarianceFloor(values)
+
+        # Centering reduces the round off error of the prefix sums of the squares.
+        centered     = values - np.mean(values)
+        sums         = np.concatenate(([0.0], np.cumsum(centered)))
+        squares      = np.concatenate(([0.0], np.cumsum(centered*centered)))
+
+        # "costs[t]" is the lowest cost of the first "t" samples and "lastStarts[t]" is the start of the last segment of it.  The
+        # penalty of the first segment is removed by starting at minus the penalty.
+        costs        = np.full(signalLength+1, np.inf)
+        costs[0]     = -penalty
+        lastStarts   = np.zeros(signalLength+1, dtype=np.int64)
+        candidates   = np.zeros(1, dtype=np.int64)
+        pending      = np.zeros(1, dtype=bool)
+        offsets      = np.arange(minimumSegmentLength)
+
+        for first in range(minimumSegmentLength, signalLength+1, minimumSegmentLength):
+            last     = min(first+minimumSegmentLength, signalLength+1)
+            ends     = offsets[:last-first] + first
+
+            # Candidates by ends.  Candidates too close to an end cannot start the last segment.
+            lengths  = ends - candidates[:, np.newaxis]
+            valid    = lengths >= minimumSegmentLength
+            lengths  = np.maximum(lengths, 1)
+            means    = (sums[first:last] - sums[candidates][:, np.newaxis]) / lengths
+            variance = np.maximum((squares[first:last] - squares[candidates][:, np.newaxis]) / lengths - means*means, 0.0)
+            bounded  = np.maximum(variance, floor)
+            total    = costs[candidates][:, np.newaxis] + lengths*(np.log(bounded) + variance/bounded)
+
+            best     = np.argmin(np.where(valid, total, np.inf), axis=0)
+            lowest   = total[best, offsets[:last-first]] + penalty
+            costs[first:last]      = lowest
+            lastStarts[first:last] = candidates[best]
+
+            # A candidate whose cost to an end is already no better than the lowest cost of that end (which includes the penalty of a
+            # new boundary) can never start the last segment of a signal that ends at least a minimum segment length after that end,
+            # because splitting a segment never increases its cost.  Closer ends can still be in the last segment of the candidate,
+            # so a candidate is only removed after the next block, when all the remaining ends are far enough away.
+            pruned     = np.any(valid & (total >= lowest), axis=1)
+            keep       = ~pending
+            candidates = np.concatenate((candidates[keep], ends))
+            pending    = np.concatenate((pruned[keep], np.zeros(len(ends), dtype=bool)))
+
+        segmentStarts = []
+        end           = signalLength
+        while end > 0:
+            end = lastStarts[end]
+            segmentStarts.append(end)
+
+        return np.array(segmentStarts[::-1], dtype=np.int64)
+
+
+    @classmethod
+    def _GetVarianceFloor(cls, values:np.ndarray) -> float:
+        """
+        The lowest variance of a segment.  The noise variance is estimated as half the mean square of the first differences.
+        """
+        noiseVariance = 0.5*np.mean(np.diff(values)**2)
+        return max(cls.varianceFloor*noiseVariance, np.finfo(np.float64).tiny)
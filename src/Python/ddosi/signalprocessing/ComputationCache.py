@@ -0,0 +1,257 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   collections                                                   import OrderedDict
+import hashlib
+import threading
+
+
+class ComputationCache():
+    """
+    A static class that memoizes the results of expensive signal processing transforms.
+
+    Results are keyed by a fingerprint of the input buffer plus the name and parameters of the transform.  The cache has
+    a memory budget and evicts the least recently used entries once the budget is exceeded.
+
+    The fingerprint hashes every value in the buffer, so modifying the data in place creates a new key rather than
+    returning a stale result.  Hashing is much faster than the transforms that are cached.
+
+    The cached results are never handed out.  Each call returns a copy, so callers can modify the results they receive.
+    """
+    enabled             = True
+    memoryBudget        = 512 * 1024**2
+
+    _entries            = OrderedDict()
+    _memoryUsed         = 0
+    _lock               = threading.Lock()
+    hits                = 0
+    misses              = 0
+
+
+    @classmethod
+    def SetMemoryBudget(cls, memoryBudget:int):
+        """
+        Sets the maximum number of bytes the cached results can use.  Entries are evicted, least recently used first,
+        until the cache fits in the new budget.
+
+        Parameters
+        ----------
+        memoryBudget : int
+            The memory budget in bytes.
+
+        Returns
+        -------
+        None.
+        """
+        with cls._lock:
+            cls.memoryBudget = memoryBudget
+            cls._Evict()
+
+
+    @classmethod
+    def Clear(cls):
+        """
+        Removes all the entries from the cache and resets the statistics.
+
+        Returns
+        -------
+        None.
+        """
+        with cls._lock:
+            cls._entries.clear()
+            cls._memoryUsed = 0
+            cls.hits        = 0
+            cls.misses      = 0
+
+
+    @classmethod
+    def GetMemoryUsed(cls) -> int:
+        """
+        Returns
+        -------
+        : int
+            The number of bytes used by the cached results.
+        """
+        return cls._memoryUsed
+
+
+    @classmethod
+    def Fingerprint(cls, data:pd.Series|pd.DataFrame|list|tuple|np.ndarray) -> str:
+        """
+        Creates a fingerprint of a data buffer.  The fingerprint is created from the shape, data type, and all the values
+        of the buffer.
+
+        Parameters
+        ----------
+        data : pd.Series|pd.DataFrame|list|tuple|np.ndarray
+            The data to fingerprint.
+
+        Returns
+        -------
+        : str
+            The fingerprint as a hexadecimal string.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+
+        # The index is part of pandas objects and is carried into results (e.g., a rolling mean), so it is included.
+        if isinstance(data, (pd.core.series.Series, pd.DataFrame)):
+            cls._HashArray(hasher, data.index.to_numpy())
+            data = data.to_numpy()
+
+        cls._HashArray(hasher, np.asarray(data))
+
+        return hasher.hexdigest()
+
+
+    @classmethod
+    def _HashArray(cls, hasher, data:np.ndarray):
+        """
+        Adds the shape, data type, and values of an array to a hash.
+
+        Parameters
+        ----------
+        hasher : hashlib hash object
+            The hash to update.
+        data : np.ndarray
+            The array to hash.
+
+        Returns
+        -------
+        None.
+        """
+        hasher.update(str((data.shape, data.dtype.str)).encode())
+
+        flat = data.reshape(-1)
+
+        # Object arrays (e.g., string indices) are converted to their text representation.
+        if flat.dtype == object:
+            flat = flat.astype(str)
+
+        # The hash reads the buffer directly, so contiguous arrays are not copied.
+        hasher.update(np.ascontiguousarray(flat).view(np.uint8))
+
+
+    @classmethod
+    def Memoize(cls, name:str, data, parameters:tuple, function, *args, **kwargs):
+        """
+        Returns the cached result of a transform if it exists, otherwise the transform is calculated and the result is
+        added to the cache.
+
+        Numpy arrays and pandas objects in the result are copied before they are returned, so the caller can modify them
+        without changing the cached result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the transform.  Used as part of the key.
+        data : array like
+            The input data buffer.  It is fingerprinted and used as part of the key.
+        parameters : tuple
+            The parameters of the transform.  Must be hashable.  Used as part of the key.
+        function : callable
+            The function that calculates the result when it is not found in the cache.
+        *args : arguments
+            Arguments passed to the function.
+        **kwargs : keyword arguments
+            Keyword arguments passed to the function.
+
+        Returns
+        -------
+        result : object
+            The result of the transform.
+        """
+        if not cls.enabled:
+            return function(*args, **kwargs)
+
+        key = (name, cls.Fingerprint(data), parameters)
+
+        with cls._lock:
+            if key in cls._entries:
+                cls._entries.move_to_end(key)
+                cls.hits += 1
+                return cls._Copy(cls._entries[key][0])
+            cls.misses += 1
+
+        result = function(*args, **kwargs)
+        size   = cls._GetSize(result)
+
+        with cls._lock:
+            # A result larger than the entire budget is returned, but never stored.
+            if size <= cls.memoryBudget:
+                if key in cls._entries:
+                    cls._memoryUsed -= cls._entries.pop(key)[1]
+                cls._entries[key]  = (result, size)
+                cls._memoryUsed   += size
+                cls._Evict()
+
+        return cls._Copy(result)
+
+
+    @classmethod
+    def _Evict(cls):
+        """
+        Removes the least recently used entries until the memory used is within the budget.  The caller must hold the lock.
+
+        Returns
+        -------
+        None.
+        """
+        while cls._memoryUsed > cls.memoryBudget and len(cls._entries) > 0:
+            key, (result, size) = cls._entries.popitem(last=False)
+            cls._memoryUsed    -= size
+
+
+    @classmethod
+    def _GetSize(cls, result) -> int:
+        """
+        Estimates the memory used by a result.
+
+        Parameters
+        ----------
+        result : object
+            The result of a transform.  Can be an array, pandas object, or a tuple/list of those.
+
+        Returns
+        -------
+        : int
+            The number of bytes used.
+        """
+        match result:
+            case np.ndarray():
+                return result.nbytes
+            case pd.core.series.Series() | pd.DataFrame():
+                return int(np.sum(result.memory_usage(index=True, deep=False)))
+            case list() | tuple():
+                return sum(cls._GetSize(item) for item in result)
+            case _:
+                return 64
+
+
+    @classmethod
+    def _Copy(cls, result):
+        """
+        Copies the numpy arrays and pandas objects in a result so the cached copy is not modified by the caller.
+
+        Parameters
+        ----------
+        result : object
+            The result of a transform.
+
+        Returns
+        -------
+        : object
+            The result with numpy arrays and pandas objects copied.
+        """
+        match result:
+            case np.ndarray() | pd.core.series.Series() | pd.DataFrame():
+                return result.copy()
+            case tuple():
+                return tuple(cls._Copy(item) for item in result)
+            case list():
+                return [cls._Copy(item) for item in result]
+            case _:
+                return result
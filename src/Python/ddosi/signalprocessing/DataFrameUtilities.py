@@ -2,16 +2,41 @@
 Created on March 15, 2023
 @author: Lance A. Endres
 """
+import numpy                                                         as np
 import pandas                                                        as pd
-from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassFilter
+from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassFilterBlock
+from   ddosi.signalprocessing.FrequencyDomainFilterBank              import FrequencyDomainFilterBank
+from   ddosi.signalprocessing.RollingStatistics                      import RollingStatistics
 
 class DataFrameUtilities():
     """
     A static class for applying signal processing algorithms to DataFrames.
+
+    Each function calculates all the requested columns as a single 2-D block.  Every function returns (newData, newNames, suffix)
+    and the "output" argument controls what "newData" is:
+        "inplace" : The new columns are added to the input DataFrame, which is returned.
+        "frame"   : The input is not modified.  A new DataFrame that contains the input and the new columns (joined with a
+                    single concatenation) is returned.
+        "block"   : The input is not modified.  Only the new columns are returned as a DataFrame.
+
+    In all the modes, a new column that already exists in the input replaces it where it is, so running a function twice gives the
+    same columns.
+
+    "inplace" uses pandas column assignment, which adds the new columns one at a time.  It is fine for a few columns, but many
+    columns fragment the DataFrame (pandas warns about it).  "frame" joins the new columns with one concatenation (one copy of the
+    input) and "block" avoids the copy.  Using a "dtype" of numpy.float32 halves the memory used by the new columns.
     """
+    # Text used in the column name suffixes of the rolling statistics.
+    rollingStatisticNames = {
+        "mean" : "Moving Average",
+        "rms"  : "RMS",
+        "std"  : "Standard Deviation",
+        "min"  : "Minimum",
+        "max"  : "Maximum"
+    }
 
     @classmethod
-    def MovingAverage(cls, data:pd.DataFrame, columns:list|tuple, numberOfPoints:int):
+    def MovingAverage(cls, data:pd.DataFrame, columns:list|tuple, numberOfPoints:int, output:str="inplace", dtype=np.float64):
         """
         Creates moving averages for each column specified in "columns".  The moving averae is added to the DataFrame as a new
         column.  The new column name is the original column name with a suffix added that indicates the number of points used.
@@ -24,33 +49,37 @@ class DataFrameUtilities():
             The column names in a list.
         numberOfPoints : int
             The number of points to use for the moving average.
+        output : str, optional
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".  See the class documentation.
+            The default is "inplace".
+        dtype : numpy data type, optional
+            The data type of the new columns. The default is numpy.float64.
 
         Returns
         -------
+        newData : pandas.DataFrame
+            The input DataFrame, the new DataFrame, or the block of new columns, depending on "output".
         newNames : list of strings
             A list of the new column names.
         suffix : str
             The suffix added to the column names.
         """
-        newNames = []
         suffix   = str(numberOfPoints) + " pt Moving Average"
+        newNames = [column + " " + suffix for column in columns]
 
-        for column in columns:
-            movingAverage    = data[column].rolling(numberOfPoints).mean()
+        # All the columns are calculated in one pass.
+        movingAverages = RollingStatistics.Calculate(data[list(columns)], numberOfPoints, "mean", dtype=dtype)[("mean", numberOfPoints)]
 
-            # The front of the series gets filled with NaN until "numberOfPoints" entry is reached (that many points are needed
-            # to start the moving avaerage calculation).  Because, NaNs cause a lot of problems in calculations/plotting/et cetera,
-            # the NaNs are replaced with the first valid value.
-            movingAverage.fillna(movingAverage[numberOfPoints], inplace=True)
+        # The front of the series gets filled with NaN until "numberOfPoints" entry is reached (that many points are needed
+        # to start the moving avaerage calculation).  Because, NaNs cause a lot of problems in calculations/plotting/et cetera,
+        # the NaNs are replaced with the first valid value.
+        RollingStatistics.FillLeadingValues(movingAverages, numberOfPoints)
 
-            columnName       = column + " " + suffix
-            data[columnName] = movingAverage
-            newNames.append(columnName)
-        return newNames, suffix
+        return cls._AttachColumns(data, newNames, movingAverages, output, suffix)
 
 
     @classmethod
-    def RootMeanSquare(cls, data:pd.DataFrame, columns:list|tuple, numberOfPoints:int):
+    def RootMeanSquare(cls, data:pd.DataFrame, columns:list|tuple, numberOfPoints:int, output:str="inplace", dtype=np.float64):
         """
         Creates a root mean square for each column specified in "columns".  The root mean square is added to the DataFrame as a new
         column.  The new column name is the original column name with a suffix added that indicates the number of points used.
@@ -63,37 +92,92 @@ class DataFrameUtilities():
             The column names in a list.
         numberOfPoints : int
             The number of points to use for the moving average.
+        output : str, optional
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".  See the class documentation.
+            The default is "inplace".
+        dtype : numpy data type, optional
+            The data type of the new columns. The default is numpy.float64.
 
         Returns
         -------
+        newData : pandas.DataFrame
+            The input DataFrame, the new DataFrame, or the block of new columns, depending on "output".
         newNames : list of strings
             A list of the new column names.
         suffix : str
             The suffix added to the column names.
         """
-        newNames = []
         suffix   = str(numberOfPoints) + " pt RMS"
+        newNames = [column + " " + suffix for column in columns]
 
-        for column in columns:
-            rootMeanSquare  = data[column].pow(2).rolling(numberOfPoints).mean().pow(0.5)
+        # All the columns are calculated in one pass.
+        rootMeanSquares = RollingStatistics.Calculate(data[list(columns)], numberOfPoints, "rms", dtype=dtype)[("rms", numberOfPoints)]
 
-            # The front of the series gets filled with NaN until "numberOfPoints" entry is reached (that many points are needed
-            # to start the moving avaerage calculation).  Because, NaNs cause a lot of problems in calculations/plotting/et cetera,
-            # the NaNs are replaced with the first valid value.
-            rootMeanSquare.fillna(rootMeanSquare[numberOfPoints], inplace=True)
+        # The front of the series gets filled with NaN until "numberOfPoints" entry is reached (that many points are needed
+        # to start the moving avaerage calculation).  Because, NaNs cause a lot of problems in calculations/plotting/et cetera,
+        # the NaNs are replaced with the first valid value.
+        RollingStatistics.FillLeadingValues(rootMeanSquares, numberOfPoints)
 
-            columnName       = column + " " + suffix
-            data[columnName] = rootMeanSquare
-            newNames.append(columnName)
-        return newNames, suffix
+        return cls._AttachColumns(data, newNames, rootMeanSquares, output, suffix)
 
 
     @classmethod
-    def LowPassFilter(cls, data:pd.DataFrame, columns:list|tuple, cutOff:float, samplingFrequency:float, order=2):
+    def RollingStatistics(cls, data:pd.DataFrame, columns:list|tuple, windowSizes:int|list|tuple, statistics:str|list|tuple=("mean", "rms"), output:str="inplace", dtype=np.float64):
+        """
+        Creates rolling statistics for each column specified in "columns" for each window size.  All the statistics are calculated
+        in one pass over the data.  The statistics are added to the DataFrame as new columns.  The new column names are the original
+        column name with a suffix added that indicates the number of points and the statistic.
+
+        Unlike "MovingAverage" and "RootMeanSquare", the NaNs at the front of the new columns are not filled.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data in a pandas.DataFrame
+        columns : array like of strings
+            The column names in a list.
+        windowSizes : int or array like of ints
+            The number(s) of points to use for the rolling statistics.
+        statistics : str or array like of strings, optional
+            The statistics to calculate.  Any of "mean", "rms", "std", "min", and "max".  The default is ("mean", "rms").
+        output : str, optional
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".  See the class documentation.
+            The default is "inplace".
+        dtype : numpy data type, optional
+            The data type of the new columns. The default is numpy.float64.
+
+        Returns
+        -------
+        newData : pandas.DataFrame
+            The input DataFrame, the new DataFrame, or the block of new columns, depending on "output".
+        newNames : list of strings
+            A list of the new column names.
+        suffixes : list of strings
+            The suffixes added to the column names.
+        """
+        newNames = []
+        suffixes = []
+        results  = RollingStatistics.Calculate(data[list(columns)], windowSizes, statistics, dtype=dtype)
+
+        for (statistic, windowSize) in results.keys():
+            suffix = str(windowSize) + " pt " + cls.rollingStatisticNames[statistic]
+            suffixes.append(suffix)
+            newNames.extend([column + " " + suffix for column in columns])
+
+        # Join the results side by side so the new columns are in the same order as the names.
+        values = np.concatenate(list(results.values()), axis=1)
+
+        return cls._AttachColumns(data, newNames, values, output, suffixes)
+
+
+    @classmethod
+    def LowPassFilter(cls, data:pd.DataFrame, columns:list|tuple, cutOff:float, samplingFrequency:float, order=2, method:str="gust", output:str="inplace", dtype=np.float64):
         """
         Creeates low pass output for each column specified in "columns".  The low pass data is added to the DataFrame as a new
         column.  The new column name is the original column name with a suffix added that indicates the cut off frequency.
 
+        All the columns are filtered in one call.
+
         Parameters
         ----------
         data : pandas.DataFrame
@@ -106,20 +190,122 @@ class DataFrameUtilities():
             The sampling frequency of the source data.
         order : int, optional
             Order of the filter used.. The default is 2.
+        method : str, optional
+            The edge handling method, "pad" or "gust".  "pad" is much faster.  See "ButterworthLowPassFilterBlock". The default is "gust".
+        output : str, optional
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".  See the class documentation.
+            The default is "inplace".
+        dtype : numpy data type, optional
+            The data type of the new columns. The default is numpy.float64.
 
         Returns
         -------
+        newData : pandas.DataFrame
+            The input DataFrame, the new DataFrame, or the block of new columns, depending on "output".
         newNames : list of strings
             A list of the new column names.
         suffix : str
             The suffix added to the column names.
         """
-        newNames = []
         suffix   = str(cutOff) + " Hz Lowpass Filtered"
+        newNames = [column + " " + suffix for column in columns]
+
+        filteredData = ButterworthLowPassFilterBlock(data[list(columns)].to_numpy(dtype=np.float64), cutOff, samplingFrequency, order, method=method)
+        filteredData = filteredData.astype(dtype, copy=False)
+
+        return cls._AttachColumns(data, newNames, filteredData, output, suffix)
+
+
+    @classmethod
+    def LowPassFilterBank(cls, data:pd.DataFrame, columns:list|tuple, cutOffs:list|tuple, samplingFrequency:float, order=2, output:str="inplace", dtype=np.float64):
+        """
+        Creates low pass output for each column specified in "columns" at each cut off frequency.  The columns are named the same
+        as "LowPassFilter".
+
+        The filters are applied in the frequency domain with "FrequencyDomainFilterBank".  Each column is transformed once and all
+        the cut off frequencies are applied to the shared spectrum, which is much faster than calling "LowPassFilter" once for each
+        cut off frequency on long signals.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data in a pandas.DataFrame
+        columns : array like of strings
+            The column names in a list.
+        cutOffs : array like of floats
+            The cut off frequencies used in the filters.
+        samplingFrequency : float
+            The sampling frequency of the source data.
+        order : int, optional
+            Order of the filter used. The default is 2.
+        output : str, optional
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".  See the class documentation.
+            The default is "inplace".
+        dtype : numpy data type, optional
+            The data type of the new columns. The default is numpy.float64.
+
+        Returns
+        -------
+        newData : pandas.DataFrame
+            The input DataFrame, the new DataFrame, or the block of new columns, depending on "output".
+        newNames : list of strings
+            A list of the new column names.
+        suffixes : list of strings
+            The suffixes added to the column names.
+        """
+        newNames = []
+        suffixes = []
+        results  = FrequencyDomainFilterBank.Filter(data[list(columns)].to_numpy(dtype=np.float64), cutOffs, samplingFrequency, order, dtype=dtype)
+
+        for cutOff in results.keys():
+            suffix = str(cutOff) + " Hz Lowpass Filtered"
+            suffixes.append(suffix)
+            newNames.extend([column + " " + suffix for column in columns])
+
+        values = np.concatenate(list(results.values()), axis=1)
+
+        return cls._AttachColumns(data, newNames, values, output, suffixes)
+
+
+    @classmethod
+    def _AttachColumns(cls, data:pd.DataFrame, newNames:list, values:np.ndarray, output:str, suffix:str|list):
+        """
+        Attaches a block of new columns to the data.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data in a pandas.DataFrame
+        newNames : list of strings
+            The names of the new columns.
+        values : numpy.ndarray
+            The new columns as a 2-D array (samples by columns).
+        output : str
+            Specifies how the new columns are returned.  One of "inplace", "frame", or "block".
+        suffix : str|list
+            The suffix(es) added to the column names.
+
+        Returns
+        -------
+        See the class documentation.
+        """
+        if output not in ("inplace", "frame", "block"):
+            raise Exception("Invalid 'output' argument provided.")
+
+        block = pd.DataFrame(values, index=data.index, columns=newNames, copy=False)
+
+        match output:
+            case "inplace":
+                data[newNames] = block
+                return data, newNames, suffix
+
+            case "frame":
+                # Columns that already exist are replaced where they are (the same as "inplace") instead of being duplicated.
+                existing = [name for name in newNames if name in data.columns]
+                newData  = pd.concat([data, block.drop(columns=existing)], axis=1)
+                if len(existing) > 0:
+                    newData[existing] = block[existing]
+                return newData, newNames, suffix
 
-        for column in columns:
-            filteredData, b, a = ButterworthLowPassFilter(data[column], cutOff, samplingFrequency, order)
-            columnName         = column + " " + suffix
-            data[columnName]   = filteredData
-            newNames.append(columnName)
-        return newNames, suffix
\ No newline at end of file
+            case "block":
+                return block, newNames, suffix
@@ -0,0 +1,145 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+
+
+class Decimator():
+    """
+    Reduces the sampling rate of signals by an integer factor with a polyphase anti-alias filter (scipy.signal.resample_poly).
+
+    Segmenting at full rate is wasteful when the changes of interest happen over seconds.  Segment the decimated signal, then map
+    the boundaries back to the original sampling rate with "MapIndices" or "MapBinaryEventSequence".  The cost of the segmentation
+    drops by about the decimation factor.
+
+    The filter is zero phase, so sample "k" of the decimated signal is aligned with sample "k*factor" of the original signal.  A
+    boundary found on the decimated signal is located to within "factor" samples of the original signal.
+
+    The signals must not contain NaNs.
+    """
+
+
+    def __init__(self, factor:int, window:str|tuple=("kaiser", 5.0), padType:str="line"):
+        """
+        Contructor.
+
+        Parameters
+        ----------
+        factor : int
+            The decimation factor.
+        window : str|tuple, optional
+            The window used to design the anti-alias filter (see scipy.signal.resample_poly). The default is ("kaiser", 5.0).
+        padType : str, optional
+            How the signal is extended past its ends while filtering (see scipy.signal.resample_poly).  The default, "line",
+            extends the trend of the signal so the ends of signals with an offset do not droop, which would look like a boundary.
+            The default is "line".
+
+        Returns
+        -------
+        None.
+        """
+        if int(factor) != factor or factor < 1:
+            raise Exception("The decimation factor must be a positive integer.")
+
+        self.factor         = int(factor)
+        self.window         = window
+        self.padType        = padType
+        self.originalLength = None
+
+
+    def Decimate(self, data):
+        """
+        Decimates the data.  The length of the data is recorded for mapping results back to the original sampling rate.
+
+        Parameters
+        ----------
+        data : array like
+            The data.  A 2-D array is arranged as samples by channels and all the channels are filtered together.  If a pandas
+            DataFrame or Series is supplied, the result is the same type with the index of every "factor"th row.
+
+        Returns
+        -------
+        : array like
+            The decimated data with "ceil(len(data)/factor)" samples.
+        """
+        self.originalLength = len(data)
+
+        values = np.asarray(data, dtype=np.float64)
+        if self.factor == 1:
+            decimated = values.copy()
+        else:
+            from   scipy.signal                                      import resample_poly
+            decimated = resample_poly(values, 1, self.factor, axis=0, window=self.window, padtype=self.padType)
+
+        if hasattr(data, "iloc"):
+            import pandas                                            as pd
+            index = data.index[::self.factor]
+            if isinstance(data, pd.DataFrame):
+                return pd.DataFrame(decimated, index=index, columns=data.columns)
+            return pd.Series(decimated, index=index, name=data.name)
+
+        return decimated
+
+
+    def DecimateXData(self, xData) -> np.ndarray:
+        """
+        Gets the x-axis values (e.g., time) of the decimated samples.
+
+        Parameters
+        ----------
+        xData : array like
+            The x-axis values of the original samples.
+
+        Returns
+        -------
+        : np.ndarray
+            The x-axis values of the decimated samples.
+        """
+        return np.asarray(xData)[::self.factor]
+
+
+    def MapIndices(self, indices) -> np.ndarray:
+        """
+        Maps indices of the decimated signal to indices of the original signal.
+
+        Parameters
+        ----------
+        indices : array like
+            Indices of the decimated signal.
+
+        Returns
+        -------
+        : np.ndarray
+            Indices of the original signal.
+        """
+        mapped = np.asarray(indices, dtype=np.int64) * self.factor
+        if self.originalLength is not None:
+            mapped = np.minimum(mapped, self.originalLength-1)
+        return mapped
+
+
+    def MapBinaryEventSequence(self, binaryEventSequence, originalLength:int=None) -> np.ndarray:
+        """
+        Maps a binary event sequence (segment boundaries) found on the decimated signal to the original sampling rate.
+
+        Parameters
+        ----------
+        binaryEventSequence : array like
+            The binary event sequence of the decimated signal (e.g., "SegmentationResults.BinaryEventSequence").
+        originalLength : int, optional
+            The length of the original signal.  If None, the length recorded by "Decimate" is used. The default is None.
+
+        Returns
+        -------
+        : np.ndarray
+            The binary event sequence at the original sampling rate.
+        """
+        originalLength = self.originalLength if originalLength is None else originalLength
+        if originalLength is None:
+            raise Exception("The original length is not known.  Decimate the data or supply the original length.")
+
+        sequence = np.zeros(originalLength, dtype=np.int32)
+        events   = np.flatnonzero(np.asarray(binaryEventSequence))
+        sequence[np.minimum(events*self.factor, originalLength-1)] = 1
+        return sequence
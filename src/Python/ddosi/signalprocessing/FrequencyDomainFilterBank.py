@@ -0,0 +1,236 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import scipy.fft                                                     as fft
+
+from   functools                                                     import lru_cache
+
+
+class FrequencyDomainFilterBank():
+    """
+    Zero phase Butterworth low pass filters applied in the frequency domain.
+
+    The forward-backward (filtfilt) application of a Butterworth filter has a real, zero phase response equal to the squared
+    magnitude of the filter:
+        |H(f)|^2 = 1 / (1 + (tan(pi*f/fs) / tan(pi*fc/fs))^(2N))
+    This response is converted to a symmetric finite impulse response kernel that is truncated once the energy in the tails is
+    below a tolerance.  The signal is then filtered with overlap-save blocks.  Each block is transformed once and the spectrum
+    is shared by all the cut off frequencies, so adding a cut off frequency only costs one multiply and one inverse transform
+    per block.  Memory used for the calculations is set by the block length, not the length of the signal.
+
+    The ends of the signal are extended with an odd extension the length of the kernel.  Away from the ends, the output matches
+    the time domain forward-backward filter.  Near the ends, it differs because the time domain filter uses a much shorter
+    extension.
+    """
+    # Number of FFT workers.  Negative values count back from the number of CPUs (-1 uses all of them).
+    workers             = -1
+
+    # The minimum FFT length used for the overlap-save blocks.
+    minimumBlockLength  = 2**16
+
+    # The largest grid used to design a kernel.  Limits the memory used by very low cut off frequencies.
+    maximumDesignLength = 2**26
+
+
+    @classmethod
+    def Filter(cls, data, cutOffFrequencies:float|list|tuple, samplingFrequency:float, order:int=2, tolerance:float=1e-12, dtype=np.float64) -> dict:
+        """
+        Filters the data with a zero phase Butterworth low pass filter for each cut off frequency.
+
+        Parameters
+        ----------
+        data : array like
+            The channels.  A 2-D array is arranged as samples by channels and is filtered along the first axis.
+        cutOffFrequencies : float|list|tuple
+            The cut off frequency or frequencies.
+        samplingFrequency : float
+            The sampling frequency of the data.
+        order : int, optional
+            The order of the Butterworth filter. The default is 2.
+        tolerance : float, optional
+            The fraction of the kernel energy that is allowed to be truncated. The default is 1e-12.
+        dtype : numpy data type, optional
+            The data type of the outputs. The default is numpy.float64.
+
+        Returns
+        -------
+        : dict
+            The filtered data keyed by the cut off frequency.  Each entry has the same shape as the input.
+        """
+        data              = np.asarray(data, dtype=np.float64)
+        oneDimensional    = data.ndim == 1
+        if oneDimensional:
+            data = data[:, np.newaxis]
+
+        cutOffFrequencies = [cutOffFrequencies] if np.isscalar(cutOffFrequencies) else list(cutOffFrequencies)
+        kernels           = [_DesignKernel(cutOff, samplingFrequency, order, tolerance) for cutOff in cutOffFrequencies]
+
+        # All the kernels use the same blocks, so the blocks must overlap by the longest kernel.
+        halfLength        = max(len(kernel)-1 for kernel in kernels)
+        fftLength         = fft.next_fast_len(max(cls.minimumBlockLength, 8*halfLength), real=True)
+        stepLength        = fftLength - 2*halfLength
+        spectra           = [cls._KernelSpectrum(kernel, fftLength) for kernel in kernels]
+
+        numberOfSamples   = data.shape[0]
+        head, tail        = cls._OddExtensions(data, halfLength)
+        outputs           = [np.empty(data.shape, dtype=dtype) for cutOff in cutOffFrequencies]
+        block             = np.empty((fftLength, data.shape[1]))
+
+        # The padded signal is [head, data, tail].  Output sample "i" is at position "i+halfLength" of the padded signal.
+        for start in range(0, numberOfSamples, stepLength):
+            cls._ReadBlock(data, head, tail, start, block)
+            spectrum = fft.rfft(block, axis=0, workers=cls.workers)
+            length   = min(stepLength, numberOfSamples-start)
+
+            for output, kernelSpectrum in zip(outputs, spectra):
+                filtered = fft.irfft(spectrum*kernelSpectrum, fftLength, axis=0, workers=cls.workers)
+                output[start:start+length] = filtered[halfLength:halfLength+length]
+
+        if oneDimensional:
+            outputs = [output[:, 0] for output in outputs]
+
+        return dict(zip(cutOffFrequencies, outputs))
+
+
+    @classmethod
+    def _KernelSpectrum(cls, kernel:np.ndarray, fftLength:int) -> np.ndarray:
+        """
+        Spectrum of a symmetric kernel placed circularly (centered on sample zero) so it does not shift the signal.
+
+        Parameters
+        ----------
+        kernel : np.ndarray
+            One side of the symmetric kernel, starting at the center.
+        fftLength : int
+            The FFT length.
+
+        Returns
+        -------
+        : np.ndarray
+            The spectrum as a column so it broadcasts over the channels.
+        """
+        halfLength                  = len(kernel) - 1
+        circular                    = np.zeros(fftLength)
+        circular[:halfLength+1]     = kernel
+        if halfLength > 0:
+            circular[-halfLength:]  = kernel[:0:-1]
+
+        # The kernel is symmetric so the spectrum is real.
+        return fft.rfft(circular).real[:, np.newaxis]
+
+
+    @classmethod
+    def _OddExtensions(cls, data:np.ndarray, length:int):
+        """
+        Odd extensions of the start and end of the data.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The data as a 2-D array.
+        length : int
+            The length of the extensions.
+
+        Returns
+        -------
+        head : np.ndarray
+            The extension before the start of the data.
+        tail : np.ndarray
+            The extension after the end of the data.
+        """
+        edgeLength = min(length+1, data.shape[0])
+        head       = np.pad(data[:edgeLength], ((length, 0), (0, 0)), mode="reflect", reflect_type="odd")[:length]
+        tail       = np.pad(data[-edgeLength:], ((0, length), (0, 0)), mode="reflect", reflect_type="odd")[edgeLength:]
+        return head, tail
+
+
+    @classmethod
+    def _ReadBlock(cls, data:np.ndarray, head:np.ndarray, tail:np.ndarray, start:int, block:np.ndarray):
+        """
+        Copies a block of the padded signal, [head, data, tail, zeros...], into "block".
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The data.
+        head : np.ndarray
+            The extension before the start of the data.
+        tail : np.ndarray
+            The extension after the end of the data.
+        start : int
+            The index in the data of the first output sample of the block.  The block starts "len(head)" samples before this.
+        block : np.ndarray
+            The output block.
+
+        Returns
+        -------
+        None.
+        """
+        block[:] = 0.0
+        end      = start + len(block)
+        pieces   = ((head, 0), (data, len(head)), (tail, len(head)+len(data)))
+
+        # Positions are in the padded signal.  Anything past the tail is left as zero.
+        for piece, pieceStart in pieces:
+            first = max(start - pieceStart, 0)
+            last  = min(end - pieceStart, len(piece))
+            if first < last:
+                offset = pieceStart + first - start
+                block[offset:offset+last-first] = piece[first:last]
+
+
+@lru_cache(maxsize=128)
+def _DesignKernel(cutOffFrequency:float, samplingFrequency:float, order:int, tolerance:float) -> np.ndarray:
+    """
+    Designs the symmetric kernel of a zero phase Butterworth low pass filter.
+
+    Parameters
+    ----------
+    cutOffFrequency : float
+        The cut off frequency.
+    samplingFrequency : float
+        The sampling frequency.
+    order : int
+        The order of the Butterworth filter.
+    tolerance : float
+        The fraction of the kernel energy that is allowed to be truncated.
+
+    Returns
+    -------
+    kernel : np.ndarray
+        One side of the kernel starting at the center sample.  The array is shared by all callers and is read only.
+    """
+    if cutOffFrequency <= 0 or cutOffFrequency >= samplingFrequency/2.0:
+        raise Exception("The cut off frequency must be between zero and the Nyquist frequency.")
+
+    warpedCutOff = np.tan(np.pi*cutOffFrequency/samplingFrequency)
+    designLength = 2**12
+
+    while True:
+        frequencies = np.arange(designLength//2+1) / designLength
+        with np.errstate(over="ignore"):
+            ratio   = np.tan(np.pi*frequencies) / warpedCutOff
+            ratio[-1] = np.inf
+            response  = 1.0 / (1.0 + ratio**(2*order))
+
+        impulse     = fft.irfft(response, designLength)[:designLength//2+1]
+        energy      = impulse**2
+        energy[1:] *= 2.0
+
+        # Energy beyond each sample (the tail that is truncated if the kernel ends there).
+        remaining   = np.cumsum(energy[::-1])[::-1]
+        remaining   = np.append(remaining[1:], 0.0) / remaining[0]
+
+        # The design grid must be long enough that the impulse response has decayed before it wraps around.
+        if remaining[designLength//4] <= tolerance:
+            break
+        if designLength >= FrequencyDomainFilterBank.maximumDesignLength:
+            raise Exception("The cut off frequency is too low to design a kernel.")
+        designLength *= 2
+
+    halfLength = int(np.argmax(remaining <= tolerance))
+    kernel     = impulse[:halfLength+1].copy()
+    kernel.flags.writeable = False
+    return kernel
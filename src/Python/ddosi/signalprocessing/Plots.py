@@ -2,6 +2,7 @@
 Created on October 4, 2023
 @author: Lance A. Endres
 """
+import numpy                                                         as np
 import pandas                                                        as pd
 
 import matplotlib.lines                                              as Lines
@@ -13,6 +14,7 @@ from   lendres.plotting.LegendHelper                                 import Lege
 from   lendres.plotting.AnnotationHelper                             import AnnotationHelper
 
 from   ddosi.signalprocessing.SignalProcessing                       import SignalProcessing
+from   ddosi.signalprocessing.Spectrogram                            import Spectrogram
 from   ddosi.plotting.DesignatedColors                               import DesignatedColors
 
 
@@ -41,7 +43,7 @@ class Plots():
         labelPeaks : bool, optional
             Specifies if the local peaks should be labeled. The default is True.
         **kwargs : keyword arguments
-            Keyword arguments passed to the plotting function.
+            Keyword arguments passed to NewPowerSpectralDensityPlot (e.g., "segmentLength", "overlap", and line styles).
 
         Returns
         -------
@@ -86,7 +88,7 @@ class Plots():
         labelPeaks : bool, optional
             Specifies if the local peaks should be labeled. The default is True.
         **kwargs : keyword arguments
-            Keyword arguments passed to the plotting function.
+            Keyword arguments passed to NewPowerSpectralDensityPlot (e.g., "segmentLength", "overlap", and line styles).
 
         Returns
         -------
@@ -102,7 +104,7 @@ class Plots():
 
 
     @classmethod
-    def NewPowerSpectralDensityPlot(cls, data:pd.DataFrame, column:str, samplingFrequency:int, titleSuffix:str=None, labelPeaks:AnnotationHelper|bool=True, numberOfAnnotations=6, findPeaksKwargs:dict={}, **kwargs):
+    def NewPowerSpectralDensityPlot(cls, data:pd.DataFrame, column:str, samplingFrequency:int, titleSuffix:str=None, labelPeaks:AnnotationHelper|bool=True, numberOfAnnotations=6, findPeaksKwargs:dict={}, segmentLength:int=256, overlap:int=0, **kwargs):
         """
         Does the main work of making a power spectral density plot.
 
@@ -118,8 +120,13 @@ class Plots():
             If supplied, the string is appended as a second line to the title.  Default is none.
         labelPeaks : bool, optional
             Specifies if the local peaks should be labeled. The default is True.
+        segmentLength : int, optional
+            The number of points in each segment of Welch's method. The default is 256.
+        overlap : int, optional
+            The number of points of overlap between segments. The default is 0.
         **kwargs : keyword arguments
-            Keyword arguments passed to the plotting function.
+            Keyword arguments passed to the plotting function (plot).  For compatibility with matplotlib's psd, "NFFT" and
+            "noverlap" are used as the segment length and overlap.
 
         Returns
         -------
@@ -132,9 +139,18 @@ class Plots():
         figure = plt.gcf()
         axes   = plt.gca()
 
+        segmentLength          = kwargs.pop("NFFT", segmentLength)
+        overlap                = kwargs.pop("noverlap", overlap)
+        if "window" in kwargs:
+            raise Exception("The power spectral density is calculated with a Hanning window, the 'window' argument is not supported.")
+
         kwargs                 = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, column)
-        Pxx, frequencies, line = plt.psd(data[column], Fs=samplingFrequency, label=column, return_line=True, **kwargs)
-        # To convert the returned values to the values plotted, use: plotPxx = 10*np.log10(Pxx)
+
+        # The power spectral density is calculated by SignalProcessing (instead of "plt.psd") so the result is shared through
+        # the ComputationCache.  The values are returned in dB/Hz (the same as plotted by "plt.psd").
+        frequencies, psd       = SignalProcessing.PowerSpectralDensity(data[column], samplingFrequency, segmentLength, overlap)
+        line                   = axes.plot(frequencies, psd, label=column, **kwargs)[0]
+        axes.grid(True)
 
         AxesHelper.Label(axes, "Power Spectral Density Plot", xLabels="Frequency (Hz)", yLabels="Power Spectral Density (dB/Hz)", titleSuffix=titleSuffix)
 
@@ -149,19 +165,20 @@ class Plots():
         figure = plt.figure()
         axes   = plt.gca()
 
-        frequencies, result = SignalProcessing.RealFFT(data[column], samplingFrequency);
+        # The frequencies and amplitudes are the same length, so the amplitudes do not need to be trimmed.
+        frequencies, result = SignalProcessing.RealFFTBlock(data[column], samplingFrequency, length="none")
 
         if stem:
             # A stem plot doesn't return a standard Line2D object, so we will create one for the labeling.
-            line      = Lines.Line2D(frequencies, result[0:-1])
+            line      = Lines.Line2D(frequencies, result)
             line.axes = axes
             colorArg  = DesignatedColors.GetColorsAsKeyWordArguments(column)
-            markerline, stemlines, baseline = plt.stem(frequencies, result[0:-1], colorArg["color"], markerfmt=" ", basefmt="-b", label=column, **kwargs)
+            markerline, stemlines, baseline = plt.stem(frequencies, result, colorArg["color"], markerfmt=" ", basefmt="-b", label=column, **kwargs)
             plt.setp(markerline, "color", colorArg["color"])
             plt.setp(baseline, "color", colorArg["color"])
         else:
             kwargs    = DesignatedColors.ApplyKeyWordArgumentsToColors(kwargs, column)
-            line      = plt.plot(frequencies, result[0:-1], label=column, **kwargs)
+            line      = plt.plot(frequencies, result, label=column, **kwargs)
 
         AxesHelper.Label(axes, "FFT", xLabels="Frequency (Hz)", yLabels="Amplitude", titleSuffix=titleSuffix)
 
@@ -194,10 +211,14 @@ class Plots():
 
 
     @classmethod
-    def CreateSpectrogramPlot(cls, data:pd.DataFrame, column:str, samplingFrequency:int, maxFequency:float=None, titleSuffix:str=None, **kwargs):
+    def CreateSpectrogramPlot(cls, data:pd.DataFrame, column:str, samplingFrequency:int, maxFequency:float=None, titleSuffix:str=None, numberOfTimeBins:int=2000, pooling:str="max", **kwargs):
         """
         Creates a spectrogram (waterfall) plot.  It includes a color bar to indicate the levels.
 
+        The spectrogram is calculated by "Spectrogram" in blocks and reduced to "numberOfTimeBins" columns, so long signals do not
+        need the full short time Fourier transform in memory.  The result is cached, so the plot can be recreated with different
+        settings without recalculating it.
+
         Parameters
         ----------
        data : pandas.DataFrame
@@ -210,8 +231,13 @@ class Plots():
             If provided, it is the upper bounds on the x-axis of the plot. The default is None.
         titleSuffix : str or None, optional
             If supplied, the string is appended as a second line to the title.  Default is none.
+        numberOfTimeBins : int, optional
+            The maximum number of time bins (image columns).  If None, every segment is plotted. The default is 2000.
+        pooling : str, optional
+            How segments are combined into time bins, "max" or "mean". The default is "max".
         **kwargs : keyword arguments
-            Keyword arguments passed to the plotting function.
+            Keyword arguments passed to the plotting function (imshow).  "NFFT" and "noverlap" are used for the spectrogram
+            calculation (the same as matplotlib's specgram).
 
         Returns
         -------
@@ -222,7 +248,20 @@ class Plots():
         dataWidthPercent = 0.965
         figure, (dataAxes, colorBarAxes) = plt.subplots(1, 2, width_ratios=(dataWidthPercent, 1-dataWidthPercent))
 
-        spectrum, frequencies, times, image = dataAxes.specgram(data[column], Fs=samplingFrequency, **kwargs)
+        segmentLength = kwargs.pop("NFFT", 256)
+        overlap       = kwargs.pop("noverlap", 128)
+        frequencies, times, spectrum = Spectrogram.Calculate(data[column], samplingFrequency, segmentLength, overlap, numberOfTimeBins, pooling)
+
+        # Only the rows that are shown are drawn.
+        if maxFequency is not None:
+            rows        = np.searchsorted(frequencies, maxFequency, side="right") + 1
+            frequencies = frequencies[:rows]
+            spectrum    = spectrum[:rows]
+
+        # The image extends half a time bin past the first and last bin centers (the same as specgram).
+        halfWidth = (times[-1]-times[0]) / (len(times)-1) / 2.0 if len(times) > 1 else segmentLength / samplingFrequency / 2.0
+        extent    = (times[0]-halfWidth, times[-1]+halfWidth, frequencies[0], frequencies[-1])
+        image     = dataAxes.imshow(spectrum, origin="lower", aspect="auto", extent=extent, interpolation="nearest", **kwargs)
 
         colorBar = figure.colorbar(image, colorBarAxes)
         colorBarAxes.yaxis.label.set_size(fontsize=PlotHelper.GetScaledAnnotationSize())
@@ -0,0 +1,193 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+
+class Resampler():
+    """
+    A static class for resampling data with irregular time stamps (jitter, dropouts, and duplicates) onto a uniform grid.
+
+    The filtering and spectral functions (e.g., "ButterworthLowPassFilter", "PowerSpectralDensity", "RealFFT", and the spectrogram)
+    assume uniform samples at one sampling frequency.  Resample the data first to give them correct inputs.
+
+    The grid positions are found once for all the channels and the channels are interpolated together as a 2-D block.  The grid is
+    processed in chunks so the temporary arrays stay small.
+    """
+    # The number of grid points processed at once.
+    chunkSize = 1000000
+
+
+    @classmethod
+    def Resample(
+            cls,
+            data:pd.DataFrame,
+            samplingFrequency:float,
+            timeColumn:str="Time",
+            columns:list|tuple=None,
+            method:str="linear",
+            maximumGap:float=None,
+            fillGaps:bool=True,
+            startTime:float=None
+        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Resamples the data onto a uniform grid.
+
+        Rows with the same time stamp are averaged (ignoring NaNs) and rows without a time are dropped.  The data does not have to be
+        sorted by time.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data.
+        samplingFrequency : float
+            The sampling frequency of the grid.
+        timeColumn : str, optional
+            The column name of the time data. The default is "Time".
+        columns : list|tuple, optional
+            The columns to resample.  If None, all the numeric columns except the time are used. The default is None.
+        method : str, optional
+            The interpolation method.
+                "linear" : Linear interpolation between the samples on each side of the grid point.
+                "hold"   : Zero order hold.  The last sample at or before the grid point is used.
+            The default is "linear".
+        maximumGap : float, optional
+            Intervals between samples longer than this are reported as gaps.  If None, three times the median interval is used.
+            The default is None.
+        fillGaps : bool, optional
+            If True, the gaps are filled using the interpolation method.  If False, the grid points in the gaps are NaN. The default is True.
+        startTime : float, optional
+            The time of the first grid point.  If None, the time of the first sample is used. The default is None.
+
+        Returns
+        -------
+        resampled : pd.DataFrame
+            The time column (the grid) and the resampled columns.
+        gaps : pd.DataFrame
+            One row for each gap with the columns "Start Time", "End Time", "Duration", and "Grid Points" (the number of grid
+            points inside the gap).
+        """
+        if method not in ("linear", "hold"):
+            raise Exception("Invalid 'method' argument provided.")
+
+        if columns is None:
+            columns = [column for column in data.select_dtypes(include=np.number).columns if column != timeColumn]
+        columns = list(columns)
+
+        times, values = cls._PrepareSamples(data[timeColumn].to_numpy(dtype=np.float64), data[columns].to_numpy(dtype=np.float64))
+        if len(times) == 0:
+            raise Exception("The data does not contain any time stamps.")
+
+        # The grid covers the samples.
+        startTime      = times[0] if startTime is None else startTime
+        numberOfPoints = max(int(np.floor((times[-1] - startTime) * samplingFrequency + 1e-9)) + 1, 0)
+        grid           = startTime + np.arange(numberOfPoints) / samplingFrequency
+
+        intervals      = np.diff(times)
+        if maximumGap is None:
+            maximumGap = 3.0*np.median(intervals) if len(intervals) > 0 else np.inf
+
+        output = np.empty((numberOfPoints, len(columns)))
+        for start in range(0, numberOfPoints, cls.chunkSize):
+            stop = min(start+cls.chunkSize, numberOfPoints)
+            output[start:stop] = cls._Interpolate(times, values, grid[start:stop], method)
+
+        # Gaps are the intervals that are too long.  The grid points strictly inside them were filled.
+        gapIndices = np.flatnonzero(intervals > maximumGap)
+        gapStarts  = times[gapIndices]
+        gapEnds    = times[gapIndices+1]
+        first      = np.searchsorted(grid, gapStarts, side="right")
+        last       = np.searchsorted(grid, gapEnds, side="left")
+
+        if not fillGaps:
+            for i, j in zip(first, last):
+                output[i:j] = np.nan
+
+        gaps = pd.DataFrame({
+            "Start Time"  : gapStarts,
+            "End Time"    : gapEnds,
+            "Duration"    : gapEnds - gapStarts,
+            "Grid Points" : last - first
+        })
+
+        resampled = pd.DataFrame(output, columns=columns)
+        resampled.insert(0, timeColumn, grid)
+        return resampled, gaps
+
+
+    @classmethod
+    def _PrepareSamples(cls, times:np.ndarray, values:np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Drops the samples without a time, sorts by time, and averages the samples with the same time.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            The time stamps.
+        values : np.ndarray
+            The values (samples by channels).
+
+        Returns
+        -------
+        times : np.ndarray
+            The unique, sorted time stamps.
+        values : np.ndarray
+            The values at the unique time stamps.
+        """
+        hasTime = ~np.isnan(times)
+        if not hasTime.all():
+            times  = times[hasTime]
+            values = values[hasTime]
+
+        if np.any(times[1:] < times[:-1]):
+            order  = np.argsort(times, kind="stable")
+            times  = times[order]
+            values = values[order]
+
+        # The start of each run of the same time stamp.
+        starts = np.flatnonzero(np.diff(times, prepend=np.nan) != 0)
+        if len(starts) < len(times):
+            isNan = np.isnan(values)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.add.reduceat(np.where(isNan, 0.0, values), starts, axis=0) / np.add.reduceat(~isNan, starts, axis=0)
+            times  = times[starts]
+
+        return times, values
+
+
+    @classmethod
+    def _Interpolate(cls, times:np.ndarray, values:np.ndarray, grid:np.ndarray, method:str) -> np.ndarray:
+        """
+        Interpolates all the channels at the grid points.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            The unique, sorted time stamps.
+        values : np.ndarray
+            The values (samples by channels).
+        grid : np.ndarray
+            The grid points.
+        method : str
+            The interpolation method ("linear" or "hold").
+
+        Returns
+        -------
+        : np.ndarray
+            The interpolated values (grid points by channels).
+        """
+        # The sample at or before each grid point.  Grid points before the first sample use the first sample.
+        left = np.clip(np.searchsorted(times, grid, side="right") - 1, 0, len(times)-1)
+
+        if method == "hold" or len(times) == 1:
+            return values[left]
+
+        left     = np.minimum(left, len(times)-2)
+        fraction = np.clip((grid - times[left]) / (times[left+1] - times[left]), 0.0, 1.0)[:, np.newaxis]
+        before   = values[left]
+        after    = values[left+1]
+
+        # Grid points that fall on a sample use the sample, even if the sample on the other side is NaN.
+        return np.where(fraction == 0.0, before, np.where(fraction == 1.0, after, before + fraction*(after - before)))
@@ -0,0 +1,394 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+
+class RollingStatistics():
+    """
+    A static class for calculating several rolling (trailing window) statistics of several channels at once.
+
+    The mean and root mean square of every window size are calculated from one set of shared cumulative sums.  The sums
+    restart every block so that the round off error does not grow with the length of the signal.  The standard deviation
+    subtracts two nearly equal sums, so it uses its own sums for each window size over blocks of the window length, each
+    centered on its own mean.  Its round off error is then set by the spread of the values near the window instead of
+    their offset or trend.  The minimum and maximum use a monotonic deque filter (scipy.ndimage) that runs in linear time
+    regardless of the window size.
+
+    The results match pandas.Series.rolling(windowSize).  The first "windowSize-1" entries are NaN and any window that
+    contains a NaN is NaN.  For short windows on signals with a large offset or trend, the standard deviation is more
+    accurate than that of pandas, which updates its sums as the window slides over the whole signal.
+    """
+    statistics = ("mean", "rms", "std", "min", "max")
+
+
+    @classmethod
+    def Calculate(cls, data:pd.DataFrame|pd.Series|np.ndarray, windowSizes:int|list|tuple, statistics:str|list|tuple=("mean",), dtype=np.float64, ddof:int=1) -> dict:
+        """
+        Calculates rolling statistics for each channel (column) in "data" for each window size.
+
+        Parameters
+        ----------
+        data : pd.DataFrame|pd.Series|np.ndarray
+            The channels.  A 2-D array is arranged as samples by channels.  A 1-D array is treated as a single channel.
+        windowSizes : int|list|tuple
+            The window size(s) (number of points).
+        statistics : str|list|tuple, optional
+            The statistic(s) to calculate.  Any of "mean", "rms", "std", "min", and "max". The default is ("mean",).
+        dtype : numpy data type, optional
+            The data type of the outputs, numpy.float64 or numpy.float32.  The calculations are always done in float64.  The
+            default is numpy.float64.
+        ddof : int, optional
+            Delta degrees of freedom used for the standard deviation. The default is 1 (same as pandas).
+
+        Returns
+        -------
+        results : dict
+            A dictionary keyed by (statistic, windowSize).  Each entry is an array the same shape as the input data.
+        """
+        if isinstance(windowSizes, int):
+            windowSizes = [windowSizes]
+
+        if isinstance(statistics, str):
+            statistics = [statistics]
+
+        for statistic in statistics:
+            if statistic not in cls.statistics:
+                raise Exception("Unknown rolling statistic \"" + str(statistic) + "\".")
+
+        for windowSize in windowSizes:
+            if windowSize < 1:
+                raise Exception("The window size must be at least one.")
+
+        values           = cls._ToTwoDimensionalArray(data)
+        isOneDimensional = np.ndim(data) == 1
+        numberOfRows     = values.shape[0]
+
+        # All the outputs are allocated as one block and each result is a view into it.
+        keys             = [(statistic, windowSize) for windowSize in windowSizes for statistic in statistics]
+        outputs          = np.empty((len(keys),) + values.shape, dtype=dtype)
+        results          = {key : outputs[i] for i, key in enumerate(keys)}
+
+        # Windows that contain a NaN are NaN (the same as pandas).  A cumulative count of NaNs finds them.
+        isNan            = np.isnan(values)
+        hasNans          = isNan.any()
+        if hasNans:
+            nanCounts    = cls._CumulativeSum(isNan.astype(np.int64))
+            values       = np.where(isNan, 0.0, values)
+
+        # Cumulative sums are shared by the mean and root mean square of every window size.
+        sumStatistics  = [statistic for statistic in statistics if statistic in ("mean", "rms")]
+        sumWindowSizes = [windowSize for windowSize in windowSizes if windowSize <= numberOfRows]
+        needSquares    = "rms" in sumStatistics
+        if len(sumStatistics) > 0 and len(sumWindowSizes) > 0:
+            # Shifting the data by the first value of each channel reduces round off error in the cumulative sums.  The mean
+            # and root mean square are corrected for the shift.
+            shift          = values[0].copy()
+            shifted        = values - shift
+
+            # The cumulative sums restart at the start of each block so the round off error is set by the block length
+            # instead of the length of the signal.  A window spans at most two blocks.
+            blockLength    = max(sumWindowSizes)
+            sums           = cls._BlockCumulativeSum(shifted, blockLength)
+
+            if needSquares:
+                squares    = np.square(shifted)
+                squareSums = cls._BlockCumulativeSum(squares, blockLength)
+
+        for windowSize in windowSizes:
+            if windowSize > numberOfRows:
+                for statistic in statistics:
+                    results[(statistic, windowSize)][:] = np.nan
+                continue
+
+            # The window sums are calculated once and shared by the mean and root mean square.
+            if len(sumStatistics) > 0:
+                windowSum       = cls._WindowSum(shifted, sums, blockLength, windowSize)
+                windowSquareSum = cls._WindowSum(squares, squareSums, blockLength, windowSize) if needSquares else None
+
+            if hasNans:
+                windowHasNans   = (nanCounts[windowSize:] - nanCounts[:-windowSize]) > 0
+
+            for statistic in statistics:
+                output = results[(statistic, windowSize)]
+                output[:windowSize-1] = np.nan
+
+                match statistic:
+                    case "mean" | "rms":
+                        cls._CalculateFromSums(output[windowSize-1:], statistic, windowSum, windowSquareSum, shift, windowSize)
+
+                    case "std":
+                        cls._CalculateStandardDeviation(output[windowSize-1:], values, windowSize, ddof)
+
+                    case "min":
+                        from   scipy.ndimage                                 import minimum_filter1d
+                        origin = (windowSize-1) // 2
+                        output[windowSize-1:] = minimum_filter1d(values, windowSize, axis=0, origin=origin, mode="nearest")[windowSize-1:]
+
+                    case "max":
+                        from   scipy.ndimage                                 import maximum_filter1d
+                        origin = (windowSize-1) // 2
+                        output[windowSize-1:] = maximum_filter1d(values, windowSize, axis=0, origin=origin, mode="nearest")[windowSize-1:]
+
+                if hasNans:
+                    output[windowSize-1:][windowHasNans] = np.nan
+
+        if isOneDimensional:
+            results = {key : value[:, 0] for key, value in results.items()}
+
+        return results
+
+
+    @classmethod
+    def FillLeadingValues(cls, values:np.ndarray, numberOfPoints:int) -> np.ndarray:
+        """
+        Replaces NaNs with the value at entry "numberOfPoints" of each channel.
+
+        The front of a rolling statistic is NaN until "numberOfPoints" entries are reached (that many points are needed to
+        start the calculation).  Because NaNs cause a lot of problems in calculations/plotting/et cetera, they are replaced
+        with a valid value.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 1-D or 2-D (samples by channels) array.  It is modified in place.
+        numberOfPoints : int
+            The number of points used in the rolling statistic.
+
+        Returns
+        -------
+        values : np.ndarray
+            The input array.
+        """
+        isNan         = np.isnan(values)
+        fillValues    = np.broadcast_to(values[numberOfPoints], values.shape)
+        values[isNan] = fillValues[isNan]
+        return values
+
+
+    @classmethod
+    def _CalculateFromSums(cls, output:np.ndarray, statistic:str, windowSum:np.ndarray, windowSquareSum:np.ndarray, shift:np.ndarray, windowSize:int):
+        """
+        Calculates a statistic from the window sums of the shifted values and writes it to the output.
+
+        Parameters
+        ----------
+        output : np.ndarray
+            The output to write to.
+        statistic : str
+            The statistic, "mean" or "rms".
+        windowSum : np.ndarray
+            Sums of the shifted values in each window.
+        windowSquareSum : np.ndarray
+            Sums of the squares of the shifted values in each window.
+        shift : np.ndarray
+            The shift applied to each channel.
+        windowSize : int
+            The number of points in the window.
+
+        Returns
+        -------
+        None.
+        """
+        match statistic:
+            case "mean":
+                np.divide(windowSum, windowSize, out=output, casting="unsafe")
+                output += shift.astype(output.dtype)
+
+            case "rms":
+                # Sum of (y+c)^2 = Sum of y^2 + 2c*(Sum of y) + n*c^2
+                meanSquare  = windowSum * (2.0*shift)
+                meanSquare += windowSquareSum
+                meanSquare /= windowSize
+                meanSquare += shift*shift
+                np.maximum(meanSquare, 0.0, out=meanSquare)
+                np.sqrt(meanSquare, out=output, casting="unsafe")
+
+
+    @classmethod
+    def _CalculateStandardDeviation(cls, output:np.ndarray, values:np.ndarray, windowSize:int, ddof:int):
+        """
+        Calculates the standard deviation of each complete window and writes it to the output.
+
+        The cumulative sums restart every "windowSize" rows and the values of each block are centered on the mean of the block,
+        so a window spans the end of one block and the start of the next.  The sums of the end of the previous block are moved
+        to the center of the block the window ends in before they are added.
+
+        Parameters
+        ----------
+        output : np.ndarray
+            The output to write to.  Row "i" is the window that ends at row "i+windowSize-1" of "values".
+        values : np.ndarray
+            A 2-D array of values.
+        windowSize : int
+            The number of points in the window.
+        ddof : int
+            Delta degrees of freedom.
+
+        Returns
+        -------
+        None.
+        """
+        if windowSize - ddof <= 0:
+            output[:] = np.nan
+            return
+
+        numberOfRows, numberOfColumns = values.shape
+        numberOfBlocks  = -(-numberOfRows // windowSize)
+        blockStarts     = np.arange(numberOfBlocks) * windowSize
+        centers         = np.add.reduceat(values, blockStarts, axis=0) / np.diff(np.append(blockStarts, numberOfRows))[:, None]
+
+        centered        = values - np.repeat(centers, windowSize, axis=0)[:numberOfRows]
+        sums, totals             = cls._BlockCumulativeSum(centered, windowSize)
+        squareSums, squareTotals = cls._BlockCumulativeSum(np.square(centered), windowSize)
+
+        # The window ending at row "e" has the first "e % windowSize + 1" rows of its block and the last "tailLength" rows of the
+        # previous block.
+        ends            = np.arange(windowSize-1, numberOfRows)
+        blocks          = ends // windowSize
+        tailLength      = (windowSize - 1 - ends % windowSize)[:, None]
+        hasTail         = tailLength[:, 0] > 0
+
+        windowSum       = sums[ends]
+        windowSquareSum = squareSums[ends]
+
+        tailEnds        = ends[hasTail]
+        tailBlocks      = blocks[hasTail] - 1
+        tailSum         = totals[tailBlocks] - sums[tailEnds-windowSize]
+        tailSquareSum   = squareTotals[tailBlocks] - squareSums[tailEnds-windowSize]
+
+        # Sum of (y+d)^2 = Sum of y^2 + 2d*(Sum of y) + k*d^2, where "d" is the difference in the centers of the blocks.
+        difference      = centers[tailBlocks] - centers[tailBlocks+1]
+        length          = tailLength[hasTail]
+        windowSum[hasTail]       += tailSum + length*difference
+        windowSquareSum[hasTail] += tailSquareSum + 2.0*difference*tailSum + length*difference*difference
+
+        variance  = windowSum * windowSum
+        variance /= -windowSize
+        variance += windowSquareSum
+        variance /= (windowSize - ddof)
+        np.maximum(variance, 0.0, out=variance)
+        np.sqrt(variance, out=output, casting="unsafe")
+
+
+    @classmethod
+    def _BlockCumulativeSum(cls, values:np.ndarray, blockLength:int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cumulative sum along the first axis that restarts at the start of each block.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 2-D array of values.
+        blockLength : int
+            The number of rows in each block.
+
+        Returns
+        -------
+        cumulativeSum : np.ndarray
+            The cumulative sum within each block.  The same shape as the input.
+        totals : np.ndarray
+            The sum of each block.  It has one row per block.
+        """
+        numberOfRows, numberOfColumns = values.shape
+        numberOfBlocks  = -(-numberOfRows // blockLength)
+
+        # The values are padded with zeros to fill the last block so the sums can be calculated on a 3-D view.
+        cumulativeSum   = np.zeros((numberOfBlocks*blockLength, numberOfColumns), dtype=np.float64)
+        cumulativeSum[:numberOfRows] = values
+        blocks          = cumulativeSum.reshape(numberOfBlocks, blockLength, numberOfColumns)
+        np.cumsum(blocks, axis=1, out=blocks)
+
+        return cumulativeSum[:numberOfRows], blocks[:, -1, :]
+
+
+    @classmethod
+    def _WindowSum(cls, values:np.ndarray, cumulativeSums:tuple[np.ndarray, np.ndarray], blockLength:int, windowSize:int) -> np.ndarray:
+        """
+        Sums of the values in each complete window using the block cumulative sums.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 2-D array of values.
+        cumulativeSums : tuple[np.ndarray, np.ndarray]
+            The block cumulative sums and block totals of "values" from "_BlockCumulativeSum".
+        blockLength : int
+            The number of rows in each block.  Must be at least the window size.
+        windowSize : int
+            The number of points in the window.
+
+        Returns
+        -------
+        windowSum : np.ndarray
+            The sum of each window.  Row "i" is the window that ends at row "i+windowSize-1" of "values".
+        """
+        cumulativeSum, totals = cumulativeSums
+        numberOfWindows       = values.shape[0] - windowSize + 1
+
+        # Sum of rows s to e (inclusive) when both are in the same block.
+        windowSum   = np.subtract(cumulativeSum[windowSize-1:], cumulativeSum[:numberOfWindows])
+        windowSum  += values[:numberOfWindows]
+
+        # When the window starts in the previous block, the end of the previous block is added.  These are the windows that
+        # start in the last "windowSize-1" rows of each block.
+        if windowSize > 1:
+            numberOfBlocks = totals.shape[0]
+            starts         = (np.arange(numberOfBlocks)[:, None]*blockLength + np.arange(blockLength-windowSize+1, blockLength)[None, :]).ravel()
+            starts         = starts[starts < numberOfWindows]
+            windowSum[starts] += totals[starts // blockLength]
+
+        return windowSum
+
+
+    @classmethod
+    def _CumulativeSum(cls, values:np.ndarray) -> np.ndarray:
+        """
+        Cumulative sum along the first axis with a leading row of zeros so that the sum of the window ending at (and including)
+        row "i" is cumulativeSum[i+1] - cumulativeSum[i+1-windowSize].  Used for the NaN counts, which are exact.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 2-D array of values.
+
+        Returns
+        -------
+        cumulativeSum : np.ndarray
+            The cumulative sum with one more row than the input.
+        """
+        cumulativeSum     = np.empty((values.shape[0]+1, values.shape[1]), dtype=values.dtype)
+        cumulativeSum[0]  = 0
+        np.cumsum(values, axis=0, out=cumulativeSum[1:])
+        return cumulativeSum
+
+
+    @classmethod
+    def _ToTwoDimensionalArray(cls, data:pd.DataFrame|pd.Series|np.ndarray) -> np.ndarray:
+        """
+        Converts the input to a 2-D float64 array arranged as samples by channels.
+
+        Parameters
+        ----------
+        data : pd.DataFrame|pd.Series|np.ndarray
+            Input data.
+
+        Returns
+        -------
+        : np.ndarray
+            2-D float64 array.
+        """
+        if isinstance(data, (pd.core.series.Series, pd.DataFrame)):
+            data = data.to_numpy()
+
+        values = np.asarray(data, dtype=np.float64)
+
+        match values.ndim:
+            case 1:
+                return values.reshape(-1, 1)
+            case 2:
+                return values
+            case _:
+                raise Exception("The data must be 1 or 2 dimensional.")
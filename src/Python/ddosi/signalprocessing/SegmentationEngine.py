@@ -0,0 +1,16 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+from   enum                                      import IntEnum
+from   enum                                      import auto
+
+class SegmentationEngine(IntEnum):
+    # Maximum likelihood segmentation of Radhakrishnan, et al. with Single Most Likelihood Replacement iterations.
+    SingleMostLikelihoodReplacement = 0
+
+    # Pruned exact linear time change point search (see "ChangePointSegmentation").
+    PrunedExactLinearTime           = auto()
+
+    # The number of types/items in the enumeration.
+    Length                          = auto()
@@ -5,15 +5,20 @@ Created on March 15, 2023
 import pandas                                                        as pd
 import numpy                                                         as np
 
-import scipy.fft
-
-
-import matplotlib.mlab as mlab
+from   ddosi.signalprocessing.ComputationCache                       import ComputationCache
+from   ddosi.signalprocessing.RollingStatistics                      import RollingStatistics
+from   ddosi.signalprocessing.WelchPowerSpectralDensity              import WelchPowerSpectralDensity
+import numbers
 
 class SignalProcessing():
     """
     A static class for applying signal processing algorithms.
+
+    The results of the transforms are memoized in the ComputationCache so that regenerating or restyling a plot does not
+    recalculate them.
     """
+    # Number of FFT workers used by the block transforms.  Negative values count back from the number of CPUs (-1 uses all of them).
+    workers = -1
 
     @classmethod
     def MovingAverage(cls, signal:pd.Series|list|tuple|np.ndarray, numberOfPoints:int) -> pd.Series:
@@ -36,14 +41,19 @@ class SignalProcessing():
         if not isinstance(signal, pd.core.series.Series):
             signal = pd.Series(signal)
 
-        movingAverage = signal.rolling(numberOfPoints).mean()
+        return ComputationCache.Memoize("MovingAverage", signal, (numberOfPoints,), cls._MovingAverage, signal, numberOfPoints)
+
+
+    @classmethod
+    def _MovingAverage(cls, signal:pd.Series, numberOfPoints:int) -> pd.Series:
+        movingAverage = RollingStatistics.Calculate(signal, numberOfPoints, "mean")[("mean", numberOfPoints)]
 
         # The front of the series gets filled with NaN until "numberOfPoints" entry is reached (that many points are needed
         # to start the moving avaerage calculation).  Because, NaNs cause a lot of problems in calculations/plotting/et cetera,
         # the NaNs are replaced with the first valid value.
-        movingAverage.fillna(movingAverage[numberOfPoints], inplace=True)
+        RollingStatistics.FillLeadingValues(movingAverage, numberOfPoints)
 
-        return movingAverage
+        return pd.Series(movingAverage, index=signal.index, name=signal.name)
 
 
     @classmethod
@@ -67,23 +77,54 @@ class SignalProcessing():
         if not isinstance(signal, pd.core.series.Series):
             signal = pd.Series(signal)
 
-        rootMeanSquare  = signal.pow(2).rolling(numberOfPoints).mean().pow(0.5)
+        return ComputationCache.Memoize("RootMeanSquare", signal, (numberOfPoints,), cls._RootMeanSquare, signal, numberOfPoints)
+
+
+    @classmethod
+    def _RootMeanSquare(cls, signal:pd.Series, numberOfPoints:int) -> pd.Series:
+        rootMeanSquare  = RollingStatistics.Calculate(signal, numberOfPoints, "rms")[("rms", numberOfPoints)]
 
         # The front of the series gets filled with NaN until "numberOfPoints" entry is reached (that many points are needed
         # to start the moving avaerage calculation).  Because, NaNs cause a lot of problems in calculations/plotting/et cetera,
         # the NaNs are replaced with the first valid value.
-        rootMeanSquare.fillna(rootMeanSquare[numberOfPoints], inplace=True)
+        RollingStatistics.FillLeadingValues(rootMeanSquare, numberOfPoints)
 
-        return rootMeanSquare
+        return pd.Series(rootMeanSquare, index=signal.index, name=signal.name)
 
 
     @classmethod
-    def PowerSpectralDensity(cls, signal:pd.Series|list|tuple|np.ndarray, samplingFrequency:int, **kwargs) -> tuple[np.ndarray, np.ndarray]:
-        # This method will also work, but it will return the signal as positive and not the
-        # from scipy import signal as SciPySignal
-        # frequencies, psd = SciPySignal.welch(signal, axis=0)
+    def PowerSpectralDensity(cls, signal:pd.Series|pd.DataFrame|list|tuple|np.ndarray, samplingFrequency:int, segmentLength:int=256, overlap:int=0, **kwargs) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the power spectral density (in dB/Hz) with Welch's method.  The defaults and scaling are the same as
+        matplotlib.mlab.psd.
+
+        Parameters
+        ----------
+        signal : pd.Series|pd.DataFrame|list|tuple|np.array
+            Signal to calculate the power spectral density for.  A DataFrame or 2-D array (samples by channels) calculates all the
+            channels at once.
+        samplingFrequency : int
+            Samplling frequency/rate.
+        segmentLength : int, optional
+            The number of points in each segment (NFFT). The default is 256.
+        overlap : int, optional
+            The number of points of overlap between segments. The default is 0.
+        kwargs : keyword arguments
+            Not used.
 
-        psd, frequencies = mlab.psd(signal, Fs=samplingFrequency)
+        Returns
+        -------
+        frequencies : np.array
+            The frequencies.
+        psd : np.array
+            The power spectral density in dB/Hz.  A column for each channel if the input has more than one channel.
+        """
+        return ComputationCache.Memoize("PowerSpectralDensity", signal, (samplingFrequency, segmentLength, overlap), cls._PowerSpectralDensity, signal, samplingFrequency, segmentLength, overlap)
+
+
+    @classmethod
+    def _PowerSpectralDensity(cls, signal:pd.Series|pd.DataFrame|list|tuple|np.ndarray, samplingFrequency:int, segmentLength:int, overlap:int) -> tuple[np.ndarray, np.ndarray]:
+        frequencies, psd = WelchPowerSpectralDensity(samplingFrequency, segmentLength, overlap).Calculate(signal)
         psd = 10*np.log10(psd)
 
         return frequencies, psd
@@ -113,10 +154,95 @@ class SignalProcessing():
         if isinstance(signal, pd.core.series.Series):
             signal = signal.values
 
+        # The keyword arguments are part of the key.  They are converted to text because they are not guaranteed to be hashable.
+        parameters = (samplingFrequency, repr(sorted(kwargs.items())))
+        return ComputationCache.Memoize("RealFFT", signal, parameters, cls._RealFFT, signal, samplingFrequency, **kwargs)
+
+
+    @classmethod
+    def _RealFFT(cls, signal:np.ndarray, samplingFrequency:int, **kwargs) -> tuple[np.ndarray, np.ndarray]:
+        import scipy.fft
         numberOfPoints = len(signal)
 
         frequencies = scipy.fft.rfftfreq(numberOfPoints, d=1.0/samplingFrequency)
         frequencies = frequencies[0:int(numberOfPoints/2)]
         fft         = np.abs(scipy.fft.rfft(signal, **kwargs))
 
-        return frequencies, fft
\ No newline at end of file
+        return frequencies, fft
+
+
+    @classmethod
+    def RealFFTBlock(cls, data:pd.DataFrame|pd.Series|np.ndarray, samplingFrequency:int, length:str|int="pad", dtype=np.float64) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Performs an FFT on several channels of real data at once and returns the frequencies and amplitudes.
+
+        FFTs are fastest when the length only has small prime factors.  The "length" argument sets the length used for the transform:
+            "pad"  : Zero pad to the next fast length.
+            "crop" : Crop to the previous fast length (the end of the data is dropped).
+            "none" : Use the length of the data.
+            int    : Zero pad or crop to the specified length.
+        Padding changes the frequency spacing (the spectrum is interpolated).  Cropping keeps the spectrum exact for a shorter signal.
+
+        Parameters
+        ----------
+        data : pd.DataFrame|pd.Series|np.ndarray
+            The channels.  A 2-D array is arranged as samples by channels.
+        samplingFrequency : int
+            Samplling frequency/rate.
+        length : str|int, optional
+            The length policy or the length of the transform. The default is "pad".
+        dtype : numpy data type, optional
+            The data type of the amplitudes. The default is numpy.float64.
+
+        Returns
+        -------
+        frequencies : np.array
+            The frequencies.  Shared by all the channels and the same length as the amplitudes.
+        amplitudes : np.array
+            The FFT amplitudes.  A column for each channel (frequencies by channels) or 1-D for a single channel.
+        """
+        parameters = (samplingFrequency, length, np.dtype(dtype).str)
+        return ComputationCache.Memoize("RealFFTBlock", data, parameters, cls._RealFFTBlock, data, samplingFrequency, length, dtype)
+
+
+    @classmethod
+    def _RealFFTBlock(cls, data:pd.DataFrame|pd.Series|np.ndarray, samplingFrequency:int, length:str|int, dtype) -> tuple[np.ndarray, np.ndarray]:
+        import scipy.fft
+        values         = np.asarray(data, dtype=np.float64)
+        numberOfPoints = values.shape[0]
+
+        match length:
+            case "pad":
+                numberOfPoints = scipy.fft.next_fast_len(numberOfPoints, real=True)
+            case "crop":
+                numberOfPoints = cls._PreviousFastLength(numberOfPoints)
+            case "none":
+                pass
+            case numbers.Integral():
+                numberOfPoints = int(length)
+            case _:
+                raise Exception("Invalid 'length' argument provided.")
+
+        # The "n" argument zero pads or crops the data.
+        frequencies = scipy.fft.rfftfreq(numberOfPoints, d=1.0/samplingFrequency)
+        amplitudes  = np.abs(scipy.fft.rfft(values, n=numberOfPoints, axis=0, workers=cls.workers)).astype(dtype, copy=False)
+
+        return frequencies, amplitudes
+
+
+    @classmethod
+    def _PreviousFastLength(cls, numberOfPoints:int) -> int:
+        """
+        Finds the largest number less than or equal to "numberOfPoints" that only has the prime factors 2, 3, and 5.
+        """
+        best   = 1
+        power5 = 1
+        while power5 <= numberOfPoints:
+            power35 = power5
+            while power35 <= numberOfPoints:
+                # The largest power of 2 that fits.
+                value   = power35 * 2**((numberOfPoints // power35).bit_length() - 1)
+                best    = max(best, value)
+                power35 *= 3
+            power5 *= 5
+        return best
@@ -2,20 +2,22 @@
 Created on February 14, 2023
 @author: Lance A. Endres
 """
+# The annotations are not evaluated so pandas and matplotlib are only imported when they are used.  Segmenting does not need them.
+from   __future__                                                    import annotations
+
 import numpy                                                         as np
-import pandas                                                        as pd
-import matplotlib.pyplot                                             as plt
-import matplotlib
 
 from   itertools                                                     import chain
 import pickle
+from   typing                                                        import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import matplotlib.axes
+    import pandas                                                    as pd
 
 from   SegmentSignalPy                                               import SegmentationResults
 from   SegmentSignalPy                                               import FindSignificantZones
 
-from   lendres.plotting.AxesHelper                                   import AxesHelper
-from   lendres.plotting.PlotHelper                                   import PlotHelper
-
 
 class SignificantZones():
 
@@ -165,12 +167,15 @@ class SignificantZones():
 
         A default label of "Zone" is applied if none is specified.
 
+        The zones are drawn as a single collection.  Zone numbers are only added to zones that are wide enough (on screen) to fit
+        them without overlapping another number.
+
         Parameters
         ----------
         axes : matplotlib.axes.Axes
             The axis of the plot.
         **kwargs : keyword arguments
-            Keyword arguments passed to the fill_between plotting function.
+            Keyword arguments passed to the PolyCollection.
 
         Returns
         -------
@@ -181,8 +186,12 @@ class SignificantZones():
         kwargs.setdefault("facecolor", (0,0,1,0.075))
         kwargs.setdefault("edgecolor", (0,0,1,0.30))
 
-        yValues = self._PlotZoneBoundaries(axes, **kwargs)
-        self._AnnotateZones(axes, yValues[0])
+        # The zone values are used for the boxes and the labels, so they are only calculated once.
+        zones      = list(range(self.NumberOfZones))
+        zoneValues = self._GetZoneValueArray(zones)
+
+        yValues = self._PlotZoneBoundaries(axes, zones, zoneValues=zoneValues, **kwargs)
+        self._AnnotateZones(axes, yValues[0], zoneValues)
 
 
     def HighlightZones(self, axes:matplotlib.axes.Axes, zones:int|list, **kwargs):
@@ -196,7 +205,7 @@ class SignificantZones():
         zones : list
             Zone numbers to highlight.
         **kwargs : keyword arguments
-            Keyword arguments passed to the fill_between plotting function.
+            Keyword arguments passed to the PolyCollection.
 
         Returns
         -------
@@ -210,22 +219,28 @@ class SignificantZones():
         self._PlotZoneBoundaries(axes, zones, **kwargs)
 
 
-    def _PlotZoneBoundaries(self, axes:matplotlib.axes.Axes, zones:int|list=None, **kwargs):
+    def _PlotZoneBoundaries(self, axes:matplotlib.axes.Axes, zones:int|list=None, zoneValues:np.ndarray=None, **kwargs):
         """
         Plots the specified zones as shaded boxes.  The face and edge color for the fill must be specified in the keyword arguments.
 
+        All the boxes are drawn as one PolyCollection.  The zone numbers and names are stored on the collection as "zones" and
+        "zoneNames" so a zone can be found later if needed.
+
         Parameters
         ----------
         axes : matplotlib.axes.Axes
             The axis of the plot.
         zones : list, optional
             Zone numbers to plot.  If None, all the zones are plotted.  The default is None.
+        zoneValues : np.ndarray, optional
+            The values of the zones, if they have already been calculated.  The default is None.
         **kwargs : keyword arguments
-            Keyword arguments passed to the fill_between plotting function.
+            Keyword arguments passed to the PolyCollection.
 
         Returns
         -------
-        None.
+        : list
+            The top and bottom of the boxes.
         """
         if self.significantZonesIndices is None:
             raise Exception("There are no indices.  Run \"FindSignificantZones\" first.")
@@ -238,49 +253,103 @@ class SignificantZones():
         if type(zones) is int:
             zones = [zones]
 
-        for zone, i in zip(self.GetZoneValues(zones), zones):
-            # Fill between two horizontal line segements.  The x data is used for both curves.
-            # Top line: (zone[0], yTop) to (zone[1], yTop)
-            # Bottom line: (zone[0], yBttom) to (zone[1], yBottom)
-            patch = plt.fill_between(zone, yTop, yBottom, **kwargs)
+        if zoneValues is None:
+            zoneValues = self._GetZoneValueArray(zones)
 
-            # Provide a name so we can find the patch later if needed.
-            patch.zoneName = "Zone " + str(i)
+        # Each box is four vertices: (start, bottom), (start, top), (end, top), (end, bottom).
+        vertices = np.empty((len(zones), 4, 2))
+        vertices[:, 0:2, 0] = zoneValues[:, 0:1]
+        vertices[:, 2:4, 0] = zoneValues[:, 1:2]
+        vertices[:, [0, 3], 1] = yBottom[0]
+        vertices[:, [1, 2], 1] = yTop[0]
 
-            # Remove the fill label so that only the first one shows up in the legend.
-            kwargs["label"] = None
+        from   matplotlib.collections                                import PolyCollection
+        collection = PolyCollection(vertices, **kwargs)
+
+        # Provide names so we can find the zones later if needed.
+        collection.zones     = list(zones)
+        collection.zoneNames = ["Zone " + str(i) for i in zones]
+
+        axes.add_collection(collection)
+        axes.autoscale_view()
 
         return [yTop[0], yBottom[0]]
 
 
-    def _AnnotateZones(self, axes:matplotlib.axes.Axes, yPosition:float):
+    def _AnnotateZones(self, axes:matplotlib.axes.Axes, yPosition:float, zoneValues:np.ndarray=None):
         """
         Numbers each zone at the top center of the zone.
 
+        Numbers are only added to zones that are wide enough on screen (at the current axes limits) to hold them.  Numbers that
+        would overlap a number to their left are skipped.
+
         Parameters
         ----------
         axes : matplotlib.axes.Axes
             The axis of the plot.
         yPosition : Vertical position to place the labels.
+        zoneValues : np.ndarray, optional
+            The values of all the zones, if they have already been calculated.  The default is None.
 
         Returns
         -------
         None.
         """
-        for zone, i in zip(self.GetZoneValues(), range(self.NumberOfZones)):
+        if zoneValues is None:
+            zoneValues = self._GetZoneValueArray(list(range(self.NumberOfZones)))
+
+        if len(zoneValues) == 0:
+            return
+
+        from   lendres.plotting.PlotHelper                           import PlotHelper
+        size        = 0.5*PlotHelper.GetScaledAnnotationSize()
+        centers     = np.average(zoneValues, axis=1)
+
+        # Widths on screen in pixels.  The label width is estimated from the number of digits.
+        pixels      = axes.transData.transform(np.column_stack([zoneValues.ravel(), np.full(zoneValues.size, yPosition)]))[:, 0].reshape(-1, 2)
+        zoneWidths  = np.abs(pixels[:, 1] - pixels[:, 0])
+        digits      = np.floor(np.log10(np.maximum(np.arange(len(zoneValues)), 1))) + 1
+        labelWidths = 0.65 * size * digits * axes.figure.dpi / 72.0
+        centerPixel = np.average(pixels, axis=1)
+
+        lastRightEdge = -np.inf
+        for i in np.flatnonzero(zoneWidths >= labelWidths):
+            leftEdge = centerPixel[i] - labelWidths[i]/2.0
+            if leftEdge < lastRightEdge:
+                continue
+            lastRightEdge = centerPixel[i] + labelWidths[i]/2.0
+
             # Number the zone at the top, inside, center of the zone.
             axes.annotate(
                 i,
-                xy=(np.average(zone), yPosition),                              # Point to annotate (top center of fill).
+                xy=(centers[i], yPosition),                                    # Point to annotate (top center of fill).
                 xytext=(0, -3),                                                # Move text down a few points.
                 textcoords="offset points",                                    # Specifies that xytext is in points.
-                size=0.5*PlotHelper.GetScaledAnnotationSize(),                 # Font size.
+                size=size,                                                     # Font size.
                 fontweight="bold",                                             # Bold font.
                 horizontalalignment="center",                                  # Center text horizontally.
                 verticalalignment="top"                                        # Justify to top of text.
             )
 
 
+    def _GetZoneValueArray(self, zones:list) -> np.ndarray:
+        """
+        Retrieves the values associated with the zone boundry indices as an array.
+
+        Parameters
+        ----------
+        zones : list
+            The zones to extract the values for.
+
+        Returns
+        -------
+        : np.ndarray
+            The start and stop value of each requested zone (zones by 2).
+        """
+        indices = np.asarray(self.significantZonesIndices, dtype=np.int64).reshape(-1, 2)[zones]
+        return np.asarray(self.xData, dtype=np.float64)[indices].reshape(-1, 2)
+
+
     def _GetYBoundryLists(self, axes:matplotlib.axes.Axes):
         """
         Gets the top and bottom boundries of the axes in a format suitable for plotting with the "fill_between" function.
@@ -297,6 +366,7 @@ class SignificantZones():
         yBottom : list
             The bottom value as a list.
         """
+        from   lendres.plotting.AxesHelper                           import AxesHelper
         yData   = AxesHelper.GetYBoundaries(axes)
         yBottom = [yData[0], yData[0]]
         yTop    = [yData[1], yData[1]]
@@ -352,6 +422,7 @@ class SignificantZones():
         dataSubset = data.drop(dropIndices, inplace=False).reset_index()
 
         # Update the x-axis data.  This must be done after the data has been updated to make sure we get the new, reduced data.
+        import pandas                                                as pd
         match xData:
             case str():
                 self.xData = dataSubset[xData]
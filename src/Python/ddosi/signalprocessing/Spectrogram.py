@@ -0,0 +1,114 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.ComputationCache                       import ComputationCache
+from   ddosi.signalprocessing.WelchPowerSpectralDensity              import WelchPowerSpectralDensity
+
+
+class Spectrogram():
+    """
+    A static class for calculating spectrograms of long signals with bounded memory.
+
+    The segments are transformed in batches and each batch is pooled into time bins before the next batch is calculated, so only
+    the reduced spectrogram is kept in memory.  The defaults and scaling match matplotlib.mlab.specgram (a 256 point Hanning
+    window, 128 points of overlap, power spectral density in dB).
+
+    The results are memoized in the ComputationCache, so plotting the same spectrogram again (e.g., with different frequency
+    limits or a different color map) does not recalculate it.
+    """
+    # The maximum number of segments transformed at once.
+    batchLength = 1024
+
+
+    @classmethod
+    def Calculate(cls, signal:pd.Series|list|tuple|np.ndarray, samplingFrequency:float, segmentLength:int=256, overlap:int=128, numberOfTimeBins:int=2000, pooling:str="max") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculates the spectrogram of a signal.
+
+        Parameters
+        ----------
+        signal : pd.Series|list|tuple|np.ndarray
+            The signal.
+        samplingFrequency : float
+            The sampling frequency.
+        segmentLength : int, optional
+            The number of points in each segment (NFFT). The default is 256.
+        overlap : int, optional
+            The number of points of overlap between segments. The default is 128.
+        numberOfTimeBins : int, optional
+            The maximum number of time bins in the result.  If the signal has more segments than this, the segments are pooled
+            into this many bins.  If None, the segments are not pooled. The default is 2000.
+        pooling : str, optional
+            How segments are pooled into time bins.
+                "max"  : The maximum power in the bin.  Preserves short events.
+                "mean" : The average power in the bin.
+            The default is "max".
+
+        Returns
+        -------
+        frequencies : np.ndarray
+            The frequencies.
+        times : np.ndarray
+            The time at the center of each time bin.
+        spectrum : np.ndarray
+            The power spectral density in dB.  The rows are the frequencies and the columns are the time bins.
+        """
+        parameters = (samplingFrequency, segmentLength, overlap, numberOfTimeBins, pooling)
+        return ComputationCache.Memoize("Spectrogram", signal, parameters, cls._Calculate, signal, samplingFrequency, segmentLength, overlap, numberOfTimeBins, pooling)
+
+
+    @classmethod
+    def _Calculate(cls, signal:pd.Series|list|tuple|np.ndarray, samplingFrequency:float, segmentLength:int, overlap:int, numberOfTimeBins:int, pooling:str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if pooling not in ("max", "mean"):
+            raise Exception("Invalid 'pooling' argument provided.")
+
+        import scipy.fft                                             as fft
+
+        # The window, scaling, and frequencies are the same as the power spectral density.
+        welch  = WelchPowerSpectralDensity(samplingFrequency, segmentLength, overlap)
+        values = np.asarray(signal, dtype=np.float64)
+        if len(values) < segmentLength:
+            values = np.pad(values, (0, segmentLength-len(values)))
+
+        numberOfSegments = (len(values) - overlap) // welch.step
+        segments         = np.lib.stride_tricks.sliding_window_view(values, segmentLength)[::welch.step][:numberOfSegments]
+
+        # Segments "binEdges[i]" to "binEdges[i+1]" are pooled into bin "i".
+        if numberOfTimeBins is None or numberOfTimeBins >= numberOfSegments:
+            binEdges = np.arange(numberOfSegments+1)
+        else:
+            binEdges = np.linspace(0, numberOfSegments, numberOfTimeBins+1).round().astype(np.int64)
+
+        numberOfBins = len(binEdges) - 1
+        spectrum     = np.empty((len(welch.frequencies), numberOfBins))
+
+        # Each batch covers whole bins so it can be pooled without keeping the segments.
+        firstBin = 0
+        while firstBin < numberOfBins:
+            lastBin  = max(int(np.searchsorted(binEdges, binEdges[firstBin]+cls.batchLength, side="right"))-1, firstBin+1)
+            lastBin  = min(lastBin, numberOfBins)
+            start    = binEdges[firstBin]
+            stop     = binEdges[lastBin]
+
+            spectra  = fft.rfft(segments[start:stop] * welch.window, axis=-1, workers=WelchPowerSpectralDensity.workers)
+            power    = (spectra.real**2 + spectra.imag**2) * welch.scale
+            indices  = binEdges[firstBin:lastBin] - start
+
+            match pooling:
+                case "max":
+                    spectrum[:, firstBin:lastBin] = np.maximum.reduceat(power, indices, axis=0).T
+                case "mean":
+                    spectrum[:, firstBin:lastBin] = (np.add.reduceat(power, indices, axis=0) / np.diff(binEdges[firstBin:lastBin+1])[:, np.newaxis]).T
+
+            firstBin = lastBin
+
+        # The time of a segment is its center.  The time of a bin is the average of its first and last segment.
+        centers  = (segmentLength/2.0 + binEdges[:-1]*welch.step) / samplingFrequency
+        lasts    = (segmentLength/2.0 + (binEdges[1:]-1)*welch.step) / samplingFrequency
+        times    = (centers + lasts) / 2.0
+
+        return welch.frequencies, times, 10.0*np.log10(spectrum)
@@ -0,0 +1,154 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+
+from   scipy.signal                                                  import sosfilt
+from   scipy.signal                                                  import sosfilt_zi
+from   scipy.signal                                                  import group_delay
+
+from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassSos
+
+
+class StreamingLowPassFilter():
+    """
+    A causal (forward only) Butterworth low pass filter that carries the filter state between calls.  This allows data to be
+    filtered in chunks of any size without holding the entire signal in memory.  The output is identical to filtering the whole
+    signal at once.
+
+    Unlike "ButterworthLowPassFilter", which filters forward and backward, a causal filter delays the signal.  The delay is
+    reported by "GroupDelay" so it can be compensated for downstream (e.g., shifting segment boundaries).
+    """
+
+
+    def __init__(self, cutOffFrequency:float, samplingFrequency:float, order:int=2, initialState:str="steady"):
+        """
+        Contructor.
+
+        Parameters
+        ----------
+        cutOffFrequency : float
+            The cut off frequency of the filter.
+        samplingFrequency : float
+            The sampling frequency of the data.
+        order : int, optional
+            The order of the filter. The default is 2.
+        initialState : str, optional
+            How the filter state is initialized from the first chunk.
+                "steady" : The filter starts in the steady state for the first sample.  This prevents a transient at the start.
+                "zero"   : The filter starts at rest (the same as scipy.signal.sosfilt without initial conditions).
+            The default is "steady".
+
+        Returns
+        -------
+        None.
+        """
+        if initialState not in ("steady", "zero"):
+            raise Exception("Invalid 'initialState' argument provided.")
+
+        self.cutOffFrequency   = cutOffFrequency
+        self.samplingFrequency = samplingFrequency
+        self.order             = order
+        self.initialState      = initialState
+        # The cached design is read only, but scipy's sosfilt requires a writeable array.
+        self.sos               = ButterworthLowPassSos(cutOffFrequency, samplingFrequency, order).copy()
+        self.state             = None
+        self.samplesProcessed  = 0
+
+
+    def Reset(self):
+        """
+        Resets the filter state so the next chunk is treated as the start of a new signal.
+
+        Returns
+        -------
+        None.
+        """
+        self.state            = None
+        self.samplesProcessed = 0
+
+
+    def Filter(self, chunk) -> np.ndarray:
+        """
+        Filters the next chunk of the signal.
+
+        Parameters
+        ----------
+        chunk : array like
+            The next chunk of data.  A 2-D array is arranged as samples by channels.  The number of channels must be the same
+            for every chunk.
+
+        Returns
+        -------
+        filtered : numpy.ndarray
+            The filtered chunk.  The same shape as the input.
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+
+        if chunk.shape[0] == 0:
+            return chunk.copy()
+
+        if self.state is None:
+            self.state = self._InitializeState(chunk)
+        elif self.state.shape[2:] != chunk.shape[1:]:
+            raise Exception("The number of channels in the chunk does not match the previous chunks.")
+
+        filtered, self.state   = sosfilt(self.sos, chunk, axis=0, zi=self.state)
+        self.samplesProcessed += chunk.shape[0]
+
+        return filtered
+
+
+    def GroupDelay(self, frequencies:float|list|np.ndarray=0.0) -> float|np.ndarray:
+        """
+        The group delay of the filter.  For a low pass filter, the group delay at low frequencies (the pass band) is the delay
+        of the slowly varying parts of the signal.
+
+        Parameters
+        ----------
+        frequencies : float|list|np.ndarray, optional
+            The frequencies (Hz) to calculate the delay at. The default is 0.0.
+
+        Returns
+        -------
+        delay : float|np.ndarray
+            The group delay in samples at each frequency.  Divide by the sampling frequency to get the delay in seconds.
+        """
+        isScalar    = np.isscalar(frequencies)
+        frequencies = np.atleast_1d(np.asarray(frequencies, dtype=np.float64))
+
+        # The group delay of cascaded sections is the sum of the delay of each section.  Evaluating each section individually
+        # avoids the numerical problems of combining the sections into one transfer function.
+        delay       = np.zeros(len(frequencies))
+        for section in self.sos:
+            w, sectionDelay = group_delay((section[:3], section[3:]), w=frequencies, fs=self.samplingFrequency)
+            delay += sectionDelay
+
+        return delay[0] if isScalar else delay
+
+
+    def _InitializeState(self, chunk:np.ndarray) -> np.ndarray:
+        """
+        Creates the initial filter state for the first chunk.
+
+        Parameters
+        ----------
+        chunk : np.ndarray
+            The first chunk of data.
+
+        Returns
+        -------
+        state : np.ndarray
+            The filter state with shape (number of sections, 2, ...) where "..." is the shape of a sample.
+        """
+        shape = (self.sos.shape[0], 2) + chunk.shape[1:]
+
+        match self.initialState:
+            case "zero":
+                return np.zeros(shape)
+
+            case "steady":
+                # Steady state response to a step scaled by the first sample of each channel.
+                zi = sosfilt_zi(self.sos).reshape((self.sos.shape[0], 2) + (1,)*(chunk.ndim-1))
+                return zi * chunk[0]
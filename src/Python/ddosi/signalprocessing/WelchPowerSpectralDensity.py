@@ -0,0 +1,169 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+
+class WelchPowerSpectralDensity():
+    """
+    Welch's method power spectral density for a block of channels.
+
+    The defaults and scaling match matplotlib.mlab.psd (a 256 point symmetric Hanning window, no overlap, no detrending, one sided,
+    and scaled by the sampling frequency).  The window, scaling, and frequencies are set up once and shared by all the channels.
+    The segments of all the channels are transformed together with a multithreaded FFT.
+
+    The estimate can be updated incrementally.  Each call to "Update" adds the segments that are completed by the new block to the
+    running average.  The samples that do not complete a segment are carried to the next call, so the estimate after any number
+    of updates is the same as calculating it from all the data at once.
+    """
+    # Number of FFT workers.  Negative values count back from the number of CPUs (-1 uses all of them).
+    workers     = -1
+
+    # The maximum number of segments transformed at once.  Limits the memory used for long signals.
+    batchLength = 1024
+
+
+    def __init__(self, samplingFrequency:float, segmentLength:int=256, overlap:int=0):
+        """
+        Contructor.
+
+        Parameters
+        ----------
+        samplingFrequency : float
+            The sampling frequency of the data.
+        segmentLength : int, optional
+            The number of points in each segment (NFFT). The default is 256.
+        overlap : int, optional
+            The number of points of overlap between segments. The default is 0.
+
+        Returns
+        -------
+        None.
+        """
+        if overlap < 0 or overlap >= segmentLength:
+            raise Exception("The overlap must be at least zero and less than the segment length.")
+
+        self.samplingFrequency = samplingFrequency
+        self.segmentLength     = segmentLength
+        self.overlap           = overlap
+        self.step              = segmentLength - overlap
+        self.window            = np.hanning(segmentLength)
+        self.frequencies       = np.fft.rfftfreq(segmentLength, d=1.0/samplingFrequency)
+
+        # Scale by the window power and the sampling frequency.  One sided, so the power at all frequencies except zero and the
+        # Nyquist frequency is doubled.
+        self.scale             = np.full(len(self.frequencies), 2.0 / (samplingFrequency * np.sum(self.window**2)))
+        self.scale[0]         /= 2.0
+        if segmentLength % 2 == 0:
+            self.scale[-1]    /= 2.0
+
+        self.Reset()
+
+
+    def Reset(self):
+        """
+        Clears the running estimate.
+
+        Returns
+        -------
+        None.
+        """
+        self.powerSum           = None
+        self.numberOfSegments   = 0
+        self.remainder          = None
+        self.isOneDimensional   = False
+
+
+    def Calculate(self, data:pd.DataFrame|pd.Series|np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the power spectral density of all the data at once.  Any running estimate is discarded.
+
+        Parameters
+        ----------
+        data : pd.DataFrame|pd.Series|np.ndarray
+            The channels.  A 2-D array is arranged as samples by channels.
+
+        Returns
+        -------
+        frequencies : np.ndarray
+            The frequencies.
+        psd : np.ndarray
+            The power spectral density.  A column for each channel (frequencies by channels) or 1-D for a single channel.
+        """
+        self.Reset()
+
+        # A signal shorter than a segment is zero padded to one segment (the same as matplotlib.mlab.psd).
+        values = np.asarray(data, dtype=np.float64)
+        if values.shape[0] < self.segmentLength:
+            padding = [(0, self.segmentLength-values.shape[0])] + [(0, 0)]*(values.ndim-1)
+            values  = np.pad(values, padding)
+
+        self.Update(values)
+        return self.GetEstimate()
+
+
+    def Update(self, block:pd.DataFrame|pd.Series|np.ndarray):
+        """
+        Adds a block of data to the running estimate.
+
+        Parameters
+        ----------
+        block : pd.DataFrame|pd.Series|np.ndarray
+            The next block of the channels.  A 2-D array is arranged as samples by channels.  The number of channels must be the
+            same for every block.
+
+        Returns
+        -------
+        None.
+        """
+        values = np.asarray(block, dtype=np.float64)
+        self.isOneDimensional = values.ndim == 1
+        if self.isOneDimensional:
+            values = values[:, np.newaxis]
+
+        if self.remainder is not None:
+            if self.remainder.shape[1] != values.shape[1]:
+                raise Exception("The number of channels in the block does not match the previous blocks.")
+            values = np.concatenate([self.remainder, values], axis=0)
+
+        if self.powerSum is None:
+            self.powerSum = np.zeros((len(self.frequencies), values.shape[1]))
+
+        numberOfSegments = max((values.shape[0] - self.overlap) // self.step, 0)
+
+        # Segments are views into the data (segments by channels by points).  They are windowed and transformed in batches.
+        if numberOfSegments > 0:
+            import scipy.fft                                         as fft
+            segments = np.lib.stride_tricks.sliding_window_view(values, self.segmentLength, axis=0)[::self.step][:numberOfSegments]
+            for start in range(0, numberOfSegments, self.batchLength):
+                spectra        = fft.rfft(segments[start:start+self.batchLength] * self.window, axis=-1, workers=self.workers)
+                self.powerSum += np.sum(spectra.real**2 + spectra.imag**2, axis=0).T
+
+        self.numberOfSegments += numberOfSegments
+
+        # Keep the samples that start the next segment.
+        self.remainder = values[numberOfSegments*self.step:].copy()
+
+
+    def GetEstimate(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the current power spectral density estimate.
+
+        Returns
+        -------
+        frequencies : np.ndarray
+            The frequencies.
+        psd : np.ndarray
+            The power spectral density.  A column for each channel (frequencies by channels) or 1-D for a single channel.
+        """
+        if self.numberOfSegments == 0:
+            raise Exception("Not enough data has been provided to complete a segment.")
+
+        psd = self.powerSum * self.scale[:, np.newaxis] / self.numberOfSegments
+
+        if self.isOneDimensional:
+            psd = psd[:, 0]
+
+        return self.frequencies.copy(), psd
@@ -0,0 +1,99 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+import os
+import tempfile
+import warnings
+
+from   ddosi.drilling.data.ChunkedPipeline                           import ChunkedPipeline
+from   ddosi.drilling.data.PreProcessing                             import PreProcessing
+from   ddosi.signalprocessing.DataFrameUtilities                     import DataFrameUtilities
+
+import unittest
+
+
+class testChunkedPipeline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        numberOfPoints = 5000
+        time           = np.arange(numberOfPoints) / 100.0
+        cls.data       = pd.DataFrame({
+            "Time"         : time,
+            "Depth"        : 1000.0 + np.cumsum(np.abs(np.random.randn(numberOfPoints))) * 0.01,
+            "Rotary Speed" : 120.0 + 5.0*np.random.randn(numberOfPoints),
+            "Acceleration" : np.sin(2*np.pi*time) + 0.2*np.random.randn(numberOfPoints)
+        })
+        cls.data.loc[100:120, "Rotary Speed"] = 0.0
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        self.pipeline = ChunkedPipeline(chunkSize=777)
+        self.pipeline.AddLowPassFilter(["Acceleration"], 5.0, 100.0)
+        self.pipeline.AddRollingStatistics(["Acceleration", "Acceleration 5.0 Hz Lowpass Filtered"], [10, 250], ["mean", "std", "max"])
+        self.pipeline.AddRateOfPenetration()
+        self.pipeline.AddDepthOfCut()
+
+
+    def testChunkedMatchesWhole(self):
+        whole   = self.pipeline.ProcessChunk(self.data)
+
+        self.pipeline.Reset()
+        chunks  = [self.pipeline.ProcessChunk(self.data.iloc[i:i+777]) for i in range(0, len(self.data), 777)]
+        chunked = pd.concat(chunks)
+
+        self.assertEqual(list(chunked.columns), list(whole.columns))
+        self.assertTrue(np.allclose(chunked.to_numpy(), whole.to_numpy(), equal_nan=True, atol=1e-9))
+
+        # Compare to the in memory functions.
+        data = self.data.copy()
+        DataFrameUtilities.RollingStatistics(data, ["Acceleration"], [10, 250], ["mean", "std", "max"])
+        PreProcessing.CalculateRopFromTimeAndDepth(data)
+        PreProcessing.CalculateDepthOfCutFromRopAndRotarySpeed(data)
+        for column in data.columns:
+            self.assertTrue(np.allclose(chunked[column], data[column], equal_nan=True), msg=column)
+
+
+    def testRunFromFile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            inputPath  = os.path.join(directory, "input.csv")
+            outputPath = os.path.join(directory, "output.csv")
+            self.data.to_csv(inputPath, index=False)
+
+            numberOfRows = self.pipeline.Run(inputPath, outputPath)
+            result       = pd.read_csv(outputPath)
+
+        self.pipeline.Reset()
+        self.assertEqual(numberOfRows, len(self.data))
+        self.assertTrue(np.allclose(result.to_numpy(), self.pipeline.ProcessChunk(self.data).to_numpy(), equal_nan=True))
+
+
+    def testSingleRowFirstChunk(self):
+        # A repeated time stamp gives an infinite rate of penetration without warnings.
+        data            = self.data.copy()
+        data.loc[2000, "Time"] = data.loc[1999, "Time"]
+        pipeline        = ChunkedPipeline()
+        pipeline.AddRateOfPenetration()
+        chunks          = [data.iloc[:1], data.iloc[1:2000], data.iloc[2000:]]
+
+        with tempfile.TemporaryDirectory() as directory:
+            outputPath = os.path.join(directory, "output.csv")
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", RuntimeWarning)
+                pipeline.Run(iter(chunks), outputPath)
+            result     = pd.read_csv(outputPath)
+
+        PreProcessing.CalculateRopFromTimeAndDepth(data)
+        self.assertTrue(np.isinf(result.loc[2000, "Rate of Penetration"]))
+        self.assertTrue(np.allclose(result["Rate of Penetration"], data["Rate of Penetration"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
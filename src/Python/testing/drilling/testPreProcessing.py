@@ -0,0 +1,124 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.drilling.data.PreProcessing                             import PreProcessing
+
+import unittest
+
+
+class testPreProcessing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        numberOfPoints = 2000
+        cls.data       = pd.DataFrame({
+            "Time"          : np.arange(numberOfPoints) / 100.0,
+            "Depth"         : 1000.0 + np.cumsum(np.abs(np.random.randn(numberOfPoints))) * 0.01,
+            "Weight on Bit" : 50000.0 + 1000.0*np.random.randn(numberOfPoints),
+            "Torque"        : 2000.0 + 100.0*np.random.randn(numberOfPoints),
+            "Rotary Speed"  : 120.0 + 5.0*np.random.randn(numberOfPoints)
+        },
+        # An index that does not start at zero.
+        index=np.arange(numberOfPoints) + 500)
+
+        # A repeated time step (infinite rate of penetration) and stopped rotation (infinite depth of cut).
+        cls.data.loc[600, "Time"]              = cls.data.loc[599, "Time"]
+        cls.data.loc[700:710, "Rotary Speed"]  = 0.0
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        self.data = self.data.copy()
+
+
+    def testRateOfPenetrationAndDepthOfCut(self):
+        rateOfPenetration = (self.data["Depth"].diff() / self.data["Time"].diff()).to_numpy()
+        rateOfPenetration[0] = rateOfPenetration[1]
+        depthOfCut = rateOfPenetration / (self.data["Rotary Speed"].to_numpy() / 60.0)
+        depthOfCut[np.isinf(depthOfCut)] = 0.0
+
+        PreProcessing.CalculateRopFromTimeAndDepth(self.data)
+        PreProcessing.CalculateDepthOfCutFromRopAndRotarySpeed(self.data)
+
+        np.testing.assert_allclose(self.data["Rate of Penetration"], rateOfPenetration)
+        np.testing.assert_allclose(self.data["Depth of Cut"], depthOfCut)
+        self.assertTrue(np.isinf(self.data.loc[600, "Rate of Penetration"]))
+        self.assertEqual(self.data.loc[700, "Depth of Cut"], 0.0)
+
+
+    def testDerivedChannels(self):
+        bitDiameter = 0.2
+        PreProcessing.AddDerivedChannels(self.data, bitDiameter=bitDiameter, infinitePolicy="nan")
+        for channel in PreProcessing.derivedChannels:
+            self.assertIn(channel, self.data.columns)
+
+        rateOfPenetration = self.data["Rate of Penetration"]
+        area              = np.pi * bitDiameter**2 / 4.0
+        specificEnergy    = self.data["Weight on Bit"]/area + 2.0*np.pi*(self.data["Rotary Speed"]/60.0)*self.data["Torque"] / (area*rateOfPenetration)
+
+        rows = np.isfinite(specificEnergy)
+        np.testing.assert_allclose(self.data["Mechanical Specific Energy"][rows], specificEnergy[rows])
+
+        # Infinite values were replaced by NaN.
+        self.assertTrue(np.isnan(self.data.loc[600, "Rate of Penetration"]))
+        self.assertTrue(np.isnan(self.data.loc[700, "Depth of Cut"]))
+        self.assertFalse(np.isinf(self.data[list(PreProcessing.derivedChannels)].to_numpy()).any())
+
+
+    def testDerivedChannelsOutput(self):
+        frame, newNames = PreProcessing.AddDerivedChannels(self.data, output="frame", bitDiameter=0.2)
+        data, names     = PreProcessing.AddDerivedChannels(self.data, bitDiameter=0.2)
+
+        self.assertIs(data, self.data)
+        self.assertEqual(newNames, list(PreProcessing.derivedChannels))
+        pd.testing.assert_frame_equal(data, frame)
+
+        # Existing columns are replaced.
+        data, names     = PreProcessing.AddDerivedChannels(self.data, bitDiameter=0.2)
+        self.assertEqual(list(data.columns), list(frame.columns))
+
+
+    def testPolicies(self):
+        results = PreProcessing.CalculateDerivedChannels(self.data, ["Depth of Cut"], infinitePolicy="keep", nanPolicy="zero")
+        self.assertTrue(np.isinf(results["Depth of Cut"][200]))
+        self.assertFalse(np.isnan(results["Depth of Cut"]).any())
+
+        self.assertRaises(Exception, PreProcessing.CalculateDerivedChannels, self.data, ["Mechanical Specific Energy"])
+        self.assertRaises(Exception, PreProcessing.CalculateDerivedChannels, self.data, ["Depth of Cut"], infinitePolicy="none")
+
+
+    def testBinByDepth(self):
+        data = pd.DataFrame({
+            "Depth"         : [0.1, 0.4, 1.2, 1.9, 1.5, 0.8, 1.7, 2.6, 2.2],
+            "Weight on Bit" : [1.0, 3.0, 5.0, 7.0, np.nan, 9.0, 2.0, 4.0, 6.0],
+            "On Bottom"     : [True, True, True, True, True, False, True, True, False]
+        })
+
+        binned = PreProcessing.BinByDepth(data, 1.0, ["Weight on Bit"])
+        np.testing.assert_allclose(binned["Depth"], [0.5, 1.5, 2.5])
+        np.testing.assert_allclose(binned["Weight on Bit"], [13.0/3.0, 14.0/3.0, 5.0])
+        np.testing.assert_allclose(binned["Weight on Bit Maximum"], [9.0, 7.0, 6.0])
+        np.testing.assert_array_equal(binned["Weight on Bit Count"], [3, 3, 2])
+
+        # Pulling back from 1.9 to 1.5 and 0.8 and going back down to 1.7 is not new hole.
+        binned = PreProcessing.BinByDepth(data, 1.0, ["Weight on Bit"], onBottom="On Bottom", newHoleOnly=True)
+        np.testing.assert_allclose(binned["Weight on Bit"], [2.0, 6.0, 4.0])
+        np.testing.assert_array_equal(binned["Weight on Bit Count"], [2, 2, 1])
+
+        # Compare with a group by.
+        binned  = PreProcessing.BinByDepth(self.data, 0.05, ["Torque"], statistics=["mean", "max"])
+        grouped = self.data.groupby(np.floor(self.data["Depth"] / 0.05))["Torque"].agg(["mean", "max"])
+        np.testing.assert_allclose(binned["Torque"], grouped["mean"])
+        np.testing.assert_allclose(binned["Torque Maximum"], grouped["max"])
+        self.assertNotIn("Torque Count", binned.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+import ddosi.plotting
+from   ddosi.plotting.DesignatedColors                               import DesignatedColors
+
+import unittest
+
+
+class testDesignatedColorsLookup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory      = tempfile.mkdtemp()
+        cls.file           = os.path.join(cls.directory, "Colors.xlsx")
+        shutil.copyfile(os.path.join(os.path.dirname(ddosi.plotting.__file__), "Colors.xlsx"), cls.file)
+
+        # Keep the cache files of the tests out of the user's cache folder.
+        cls.cacheDirectory = DesignatedColors.cacheDirectory
+        DesignatedColors.cacheDirectory = os.path.join(cls.directory, "cache")
+
+
+    @classmethod
+    def tearDownClass(cls):
+        DesignatedColors.cacheDirectory = cls.cacheDirectory
+        shutil.rmtree(cls.directory)
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        DesignatedColors.Initialize(self.file)
+
+
+    def testCache(self):
+        cacheFile = DesignatedColors._GetCacheFile(self.file)
+        self.assertTrue(os.path.exists(cacheFile))
+        colors    = DesignatedColors.colors
+
+        # Nothing is written next to the Excel file.
+        self.assertEqual(sorted(os.listdir(self.directory)), ["Colors.xlsx", "cache"])
+        self.assertEqual(os.path.dirname(cacheFile), DesignatedColors.cacheDirectory)
+
+        # The cache file is used while the Excel file is unchanged.
+        self.assertEqual(DesignatedColors._ReadCache(self.file), colors)
+
+        # The cache file is out of date once the Excel file is modified.
+        modified = os.path.getmtime(self.file)
+        os.utime(self.file, (modified+10, modified+10))
+        self.assertIsNone(DesignatedColors._ReadCache(self.file))
+
+        DesignatedColors.Initialize(self.file)
+        self.assertEqual(DesignatedColors.colors, colors)
+        self.assertIsNotNone(DesignatedColors._ReadCache(self.file))
+
+
+    def testClosestMatch(self):
+        self.assertEqual(DesignatedColors.GetCategory("Weight on Bit"), "Weight on Bit")
+        self.assertEqual(DesignatedColors.GetCategory("Weight on Bit Filtered"), "Weight on Bit")
+        self.assertEqual(DesignatedColors.GetCategory("Acceleration XY Filtered"), "Acceleration XY")
+        self.assertEqual(DesignatedColors.GetCategory("Acceleration X Filtered"), "Acceleration X")
+        self.assertIsNone(DesignatedColors.GetCategory("Doesn't Exist"))
+
+
+    def testGetColors(self):
+        weightOnBit = DesignatedColors.colors["Weight on Bit"]
+        torque      = DesignatedColors.colors["Torque"]
+
+        # Each use of a category uses its next color.  The counts start over on each call.
+        for i in range(2):
+            colors = DesignatedColors.GetColors(["Weight on Bit", ["Torque", "Weight on Bit Filtered"], "Doesn't Exist"])
+            self.assertEqual(colors[:3], [weightOnBit[0], torque[0], weightOnBit[1]])
+            self.assertNotIn(colors[3], colors[:3])
+
+        # Categories that run out of colors get colors from the color cycle.
+        colors = DesignatedColors.GetColors(["Torque", "Torque"])
+        self.assertEqual(colors[0], torque[0])
+        self.assertNotEqual(colors[1], torque[0])
+
+        self.assertEqual(DesignatedColors.GetColors("Rotary Speed"), DesignatedColors.colors["Rotary Speed"][0])
+
+
+    def testThreads(self):
+        names    = ["Weight on Bit", "Weight on Bit 2", "Acceleration X", "Acceleration Y", "Rotary Speed"]
+        expected = DesignatedColors.GetColors(names)
+        results  = []
+
+        def GetColors():
+            for i in range(200):
+                results.append(DesignatedColors.GetColors(names))
+
+        threads = [threading.Thread(target=GetColors) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 800)
+        self.assertTrue(all(result == expected for result in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
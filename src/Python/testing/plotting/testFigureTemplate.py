@@ -0,0 +1,80 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+import matplotlib.pyplot                                             as plt
+import os
+import tempfile
+
+from   ddosi.plotting.DesignatedColors                               import DesignatedColors
+from   ddosi.plotting.FigureTemplate                                 import FigureTemplate
+from   ddosi.drilling.plotting.timebased.Plots                       import Plots
+
+import unittest
+
+
+class testFigureTemplate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        DesignatedColors.Initialize()
+        cls.first  = cls.NewRun(1000, 1.0)
+        cls.second = cls.NewRun(1500, 3.0)
+
+
+    @classmethod
+    def NewRun(cls, numberOfPoints:int, scale:float) -> pd.DataFrame:
+        time = np.arange(numberOfPoints) / 100.0
+        return pd.DataFrame({
+            "Time"          : time,
+            "Torque on Bit" : scale*np.sin(time),
+            "Weight on Bit" : scale*np.cos(time),
+            "Rotary Speed"  : 100.0 + scale*time
+        })
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        plt.figure()
+        figure, axeses = Plots.NewParameterWobAndRotarySpeedPlot("Torque", self.first, "Time", "Torque (daN.m)", "Torque on Bit", titleSuffix="First")
+        self.template  = FigureTemplate(figure, axeses, "Time")
+
+
+    def tearDown(self):
+        plt.close("all")
+
+
+    def testUpdate(self):
+        self.assertEqual(self.template.columns, ["Torque on Bit", "Weight on Bit", "Rotary Speed"])
+        self.assertEqual(self.template.title, "Torque")
+
+        numberOfLines = sum(len(axes.lines) for axes in self.template.axeses)
+        self.template.Update(self.second, titleSuffix="Second")
+
+        # The lines are reused and hold the new data.
+        self.assertEqual(sum(len(axes.lines) for axes in self.template.axeses), numberOfLines)
+        for line, column in zip(self.template.lines, self.template.columns):
+            self.assertTrue(np.array_equal(line.get_xdata(), self.second["Time"]))
+            self.assertTrue(np.array_equal(line.get_ydata(), self.second[column]))
+
+        # The limits follow the new data.
+        self.assertGreaterEqual(self.template.axeses[0].get_xlim()[1], self.second["Time"].max())
+        self.assertGreaterEqual(self.template.axeses[-1].get_ylim()[1], self.second["Rotary Speed"].max())
+        self.assertEqual(self.template.titleAxes.get_title(), "Torque\nSecond")
+
+
+    def testSave(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, data in (("first", self.first), ("second", self.second)):
+                path = os.path.join(directory, name + ".png")
+                self.template.Update(data, titleSuffix=name)
+                self.template.Save(path)
+                self.assertTrue(os.path.getsize(path) > 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
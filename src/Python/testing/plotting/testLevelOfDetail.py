@@ -0,0 +1,59 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import matplotlib.pyplot                                             as plt
+
+from   ddosi.plotting.LevelOfDetail                                  import LevelOfDetail
+
+import unittest
+
+
+class testLevelOfDetail(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        numberOfPoints    = 1000003
+        cls.x             = np.arange(numberOfPoints) / 1000.0
+        cls.y             = np.random.randn(numberOfPoints)
+        cls.y[654321]     = 50.0
+        cls.y[10]         = np.nan
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        self.figure, self.axes = plt.subplots()
+
+
+    def tearDown(self):
+        plt.close(self.figure)
+
+
+    def testZoom(self):
+        line          = LevelOfDetail.Plot(self.axes, self.x, self.y, numberOfPoints=4000)
+        levelOfDetail = line.levelOfDetail
+
+        # Zoomed out, the envelope is drawn and contains the peak.
+        self.assertLessEqual(len(line.get_xdata()), 4002)
+        self.assertEqual(np.nanmax(line.get_ydata()), 50.0)
+        self.assertEqual(np.nanmin(line.get_ydata()), np.nanmin(self.y))
+
+        # Zoomed in, the original samples are drawn.
+        self.axes.set_xlim(654.0, 655.0)
+        self.assertEqual(levelOfDetail.level, 0)
+        self.assertTrue(np.array_equal(line.get_ydata(), self.y[653999:655002]))
+
+        # Part way, a coarser level is drawn that still contains the peak.
+        self.axes.set_xlim(600.0, 700.0)
+        self.assertGreater(levelOfDetail.level, 0)
+        self.assertLessEqual(len(line.get_xdata()), 4004)
+        self.assertEqual(np.max(line.get_ydata()), 50.0)
+        self.assertTrue(np.all(np.diff(line.get_xdata()) >= 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
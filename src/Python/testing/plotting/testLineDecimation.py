@@ -0,0 +1,59 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.plotting.LineDecimation                                 import LineDecimation
+
+import unittest
+
+
+class testLineDecimation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        numberOfRows = 500003
+        cls.data     = pd.DataFrame({
+            "Time" : np.arange(numberOfRows) / 1000.0,
+            "a"    : np.random.randn(numberOfRows),
+            "b"    : np.cumsum(np.random.randn(numberOfRows))
+        })
+        cls.data.loc[123457, "a"] = 100.0
+        cls.data.loc[1000, "b"]   = np.nan
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testEnvelope(self):
+        numberOfBins = 1000
+        decimated    = LineDecimation.Decimate(self.data, [["a"], ["b"]], numberOfBins=numberOfBins)
+
+        self.assertLessEqual(len(decimated), 4*numberOfBins+2)
+        self.assertTrue(decimated.index.is_monotonic_increasing)
+        self.assertEqual(decimated.index[0], 0)
+        self.assertEqual(decimated.index[-1], len(self.data)-1)
+
+        # The extremes of every bin are kept.
+        binLength = -(-len(self.data) // numberOfBins)
+        bins      = self.data.index // binLength
+        for column in ["a", "b"]:
+            self.assertTrue(np.allclose(decimated[column].groupby(decimated.index // binLength).max(), self.data[column].groupby(bins).max()))
+            self.assertTrue(np.allclose(decimated[column].groupby(decimated.index // binLength).min(), self.data[column].groupby(bins).min()))
+
+
+    def testThreshold(self):
+        data = self.data.iloc[:1000]
+        self.assertIs(LineDecimation.Decimate(data, "a"), data)
+        self.assertIs(LineDecimation.Decimate(self.data, "a", threshold=len(self.data)), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+import matplotlib.pyplot                                             as plt
+import os
+import tempfile
+
+from   ddosi.plotting.ReportRenderer                                 import ReportRenderer
+from   ddosi.drilling.plotting.timebased.Plots                       import Plots
+
+import unittest
+
+
+class testReportRenderer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        numberOfPoints = 50000
+        cls.data       = pd.DataFrame({
+            "Time"           : np.arange(numberOfPoints) / 100.0,
+            "Acceleration X" : np.random.randn(numberOfPoints),
+            "Weight on Bit"  : 10.0 + np.random.randn(numberOfPoints),
+            "Rotary Speed"   : 120.0 + np.random.randn(numberOfPoints)
+        })
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testRenderInParallel(self):
+        with tempfile.TemporaryDirectory() as directory:
+            dataPath = os.path.join(directory, "run.pickle")
+            self.data.to_pickle(dataPath)
+
+            jobs = [
+                ReportRenderer.NewJob(dataPath, Plots.NewWobAndRotarySpeedPlot, os.path.join(directory, "wob"), titleSuffix="Run 1"),
+                ReportRenderer.NewJob(self.data, Plots.NewAccelerationPlot, os.path.join(directory, "acceleration"), column="Acceleration X", decimate=False),
+                ReportRenderer.NewJob(self.data, Plots.NewAccelerationPlot, os.path.join(directory, "missing"), column="Missing Column")
+            ]
+            results = ReportRenderer.Render(jobs, formats=("png", "pdf"), numberOfProcesses=2)
+
+            self.assertEqual(results[0], [os.path.join(directory, "wob.png"), os.path.join(directory, "wob.pdf")])
+            for path in results[0] + results[1]:
+                self.assertTrue(os.path.getsize(path) > 0)
+
+            # A failed job does not stop the others.
+            self.assertIsInstance(results[2], Exception)
+
+
+    def testRenderInProcessLeavesOpenFigures(self):
+        figure = plt.figure()
+        with tempfile.TemporaryDirectory() as directory:
+            job     = ReportRenderer.NewJob(self.data, Plots.NewAccelerationPlot, os.path.join(directory, "acceleration"), column="Acceleration X")
+            results = ReportRenderer.Render([job], numberOfProcesses=1)
+            self.assertTrue(os.path.getsize(results[0][0]) > 0)
+
+        # Only the figures of the job are closed.
+        self.assertEqual(plt.get_fignums(), [figure.number])
+        plt.close(figure)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,8 @@ import pandas                                                        as pd
 import matplotlib.pyplot                                             as plt
 
 from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassFilter
+from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassFilterBlock
+from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassSos
 
 import unittest
 
@@ -69,6 +71,32 @@ class testButterworthLowPassFilter(unittest.TestCase):
         plt.show()
 
 
+    def testBlockFilter(self):
+        samplingFrequency = 1000.0
+        cutOff            = 5.0
+        order             = 4
+        time              = np.arange(20000) / samplingFrequency
+        data              = np.column_stack([np.sin(2*np.pi*(1+i)*time) + 0.5*np.sin(2*np.pi*60*time) for i in range(4)])
+
+        # The Gustafsson method matches filtering one column at a time.
+        filtered = ButterworthLowPassFilterBlock(data, cutOff, samplingFrequency, order, method="gust")
+        for i in range(data.shape[1]):
+            y, b, a = ButterworthLowPassFilter(data[:, i], cutOff, samplingFrequency, order)
+            self.assertTrue(np.allclose(filtered[:, i], y, atol=1e-8))
+
+        # The padded method only differs at the ends of the signal.
+        padded = ButterworthLowPassFilterBlock(data, cutOff, samplingFrequency, order, method="pad")
+        self.assertEqual(padded.shape, data.shape)
+        self.assertTrue(np.allclose(padded[2000:-2000], filtered[2000:-2000], atol=1e-4))
+
+        # The design is cached.
+        self.assertIs(ButterworthLowPassSos(cutOff, samplingFrequency, order), ButterworthLowPassSos(cutOff, samplingFrequency, order))
+
+        # The cached arrays are shared, so they cannot be modified.
+        self.assertFalse(ButterworthLowPassSos(cutOff, samplingFrequency, order).flags.writeable)
+        self.assertFalse(ButterworthLowPassFilter(data[:, 0], cutOff, samplingFrequency, order)[1].flags.writeable)
+
+
 
 
 
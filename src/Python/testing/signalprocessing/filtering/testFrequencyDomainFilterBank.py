@@ -0,0 +1,66 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.ButterworthLowPass                     import ButterworthLowPassFilterBlock
+from   ddosi.signalprocessing.FrequencyDomainFilterBank              import FrequencyDomainFilterBank
+from   ddosi.signalprocessing.DataFrameUtilities                     import DataFrameUtilities
+
+import unittest
+
+
+class testFrequencyDomainFilterBank(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        cls.samplingFrequency = 1000.0
+        time                  = np.arange(100000) / cls.samplingFrequency
+        cls.data              = np.column_stack([np.sin(2*np.pi*(1+i)*time) + 0.5*np.sin(2*np.pi*60*time) + 0.3*np.random.randn(len(time)) for i in range(3)])
+
+        # Use short blocks so the signal is split over many overlap-save blocks.
+        FrequencyDomainFilterBank.minimumBlockLength = 2**12
+
+
+    @classmethod
+    def tearDownClass(cls):
+        FrequencyDomainFilterBank.minimumBlockLength = 2**16
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testMatchesTimeDomain(self):
+        cutOffs = [2.0, 10.0, 50.0]
+        results = FrequencyDomainFilterBank.Filter(self.data, cutOffs, self.samplingFrequency, 2)
+
+        self.assertEqual(list(results.keys()), cutOffs)
+        for cutOff in cutOffs:
+            solution = ButterworthLowPassFilterBlock(self.data, cutOff, self.samplingFrequency, 2, method="pad")
+            self.assertEqual(results[cutOff].shape, self.data.shape)
+            self.assertTrue(np.allclose(results[cutOff][5000:-5000], solution[5000:-5000], atol=1e-5), msg=str(cutOff))
+
+        # One dimensional and very short inputs.
+        result = FrequencyDomainFilterBank.Filter(self.data[:, 0], 10.0, self.samplingFrequency)[10.0]
+        self.assertTrue(np.allclose(result, results[10.0][:, 0]))
+        self.assertEqual(FrequencyDomainFilterBank.Filter(self.data[:3], 10.0, self.samplingFrequency)[10.0].shape, (3, 3))
+
+
+    def testDataFrameFilterBank(self):
+        data               = pd.DataFrame(self.data, columns=["a", "b", "c"])
+        data, newNames, suffixes = DataFrameUtilities.LowPassFilterBank(data, ["a", "b"], [5.0, 20.0], self.samplingFrequency)
+
+        self.assertEqual(suffixes, ["5.0 Hz Lowpass Filtered", "20.0 Hz Lowpass Filtered"])
+        self.assertEqual(newNames, ["a 5.0 Hz Lowpass Filtered", "b 5.0 Hz Lowpass Filtered", "a 20.0 Hz Lowpass Filtered", "b 20.0 Hz Lowpass Filtered"])
+        self.assertTrue(set(newNames).issubset(data.columns))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+
+from   scipy.signal                                                  import sosfilt
+
+from   ddosi.signalprocessing.StreamingLowPassFilter                 import StreamingLowPassFilter
+
+import unittest
+
+
+class testStreamingLowPassFilter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.samplingFrequency = 1000.0
+        time                  = np.arange(20000) / cls.samplingFrequency
+        cls.data              = np.column_stack([5.0 + np.sin(2*np.pi*(1+i)*time) + 0.5*np.sin(2*np.pi*60*time) for i in range(3)])
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testChunkedMatchesWhole(self):
+        lowPassFilter = StreamingLowPassFilter(5.0, self.samplingFrequency, 4)
+        whole         = lowPassFilter.Filter(self.data)
+
+        # Arbitrary chunk sizes, including empty chunks and single samples.
+        lowPassFilter.Reset()
+        chunks = []
+        start  = 0
+        for size in [0, 1, 7, 1000, 1, 4096, 0, 333, 20000]:
+            chunks.append(lowPassFilter.Filter(self.data[start:start+size]))
+            start += size
+
+        self.assertTrue(np.array_equal(np.concatenate(chunks), whole))
+        self.assertEqual(lowPassFilter.samplesProcessed, len(self.data))
+
+
+    def testZeroInitialState(self):
+        lowPassFilter = StreamingLowPassFilter(5.0, self.samplingFrequency, 4, initialState="zero")
+        filtered      = lowPassFilter.Filter(self.data[:, 0])
+        self.assertTrue(np.allclose(filtered, sosfilt(lowPassFilter.sos, self.data[:, 0])))
+
+        # The number of channels cannot change between chunks.
+        self.assertRaises(Exception, lowPassFilter.Filter, self.data[:10])
+
+
+    def testGroupDelay(self):
+        # A steady sine in the pass band is delayed by the group delay.
+        lowPassFilter = StreamingLowPassFilter(20.0, self.samplingFrequency, 2)
+        delay         = lowPassFilter.GroupDelay(0.5)
+        time          = np.arange(20000) / self.samplingFrequency
+        filtered      = lowPassFilter.Filter(np.sin(2*np.pi*0.5*time))
+        shifted       = np.sin(2*np.pi*0.5*(time - delay/self.samplingFrequency))
+        self.assertTrue(np.allclose(filtered[5000:], shifted[5000:], atol=1e-3))
+        self.assertEqual(lowPassFilter.GroupDelay([0.0, 0.5]).shape, (2,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -110,6 +110,33 @@ class TestSegmentSignal(unittest.TestCase):
         plt.show()
 
 
+    def testCullToView(self):
+        figure, axis = plt.subplots()
+        x            = self.data["Depth"]
+        axis.plot(x, self.segmenter.results.SegmentedLog)
+        events       = x[self.segmenter.results.BinaryEventSequence[:self.segmenter.results.SignalLength] == 1]
+
+        # The depth decreases along the signal, so the limits are sorted for counting the events in the view.
+        def CountInView(first, last):
+            lowerLimit, upperLimit = sorted((x.iloc[first], x.iloc[last]))
+            return ((events >= lowerLimit) & (events <= upperLimit)).sum()
+
+        # Only the events in the view are drawn.
+        axis.set_xlim(x.iloc[0], x.iloc[50])
+        lines = self.segmenter.PlotBinaryEvents(axis)
+        self.assertEqual(len(lines.get_segments()), CountInView(0, 50))
+
+        # Panning to another part of the signal draws the events there.
+        axis.set_xlim(x.iloc[50], x.iloc[99])
+        self.assertEqual(len(lines.get_segments()), CountInView(50, 99))
+        self.assertGreater(CountInView(50, 99), 0)
+
+        # Zooming out draws all the events.
+        axis.set_xlim(x.min(), x.max())
+        self.assertEqual(len(lines.get_segments()), len(events))
+        plt.close(figure)
+
+
     def testFindSignificantZonesIndices(self):
         solution   = [[9, 28], [30, 40], [42, 54], [56, 99]]
         calculated =  self.significantZones.significantZonesIndices
@@ -0,0 +1,81 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.ComputationCache                       import ComputationCache
+from   ddosi.signalprocessing.SignalProcessing                       import SignalProcessing
+
+import unittest
+
+
+class testComputationCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.signal = pd.Series(np.sin(np.linspace(0, 100, 100000)))
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        ComputationCache.Clear()
+        ComputationCache.SetMemoryBudget(512 * 1024**2)
+
+
+    def testCacheHit(self):
+        first  = SignalProcessing.MovingAverage(self.signal, 50)
+        second = SignalProcessing.MovingAverage(self.signal, 50)
+
+        self.assertEqual(ComputationCache.misses, 1)
+        self.assertEqual(ComputationCache.hits, 1)
+        self.assertTrue(first.equals(second))
+
+        # Different parameters must not return the cached result.
+        SignalProcessing.MovingAverage(self.signal, 60)
+        self.assertEqual(ComputationCache.misses, 2)
+
+
+    def testCachedResultsAreWritable(self):
+        frequencies, fft = SignalProcessing.RealFFT(self.signal, 1000)
+        self.assertTrue(fft.flags.writeable)
+
+        # Modifying a returned result must not change the cached result.
+        solution = fft.copy()
+        fft[:]   = 0
+        frequencies, fft = SignalProcessing.RealFFT(self.signal, 1000)
+        self.assertEqual(ComputationCache.hits, 1)
+        self.assertTrue(np.array_equal(fft, solution))
+
+
+    def testInPlaceModification(self):
+        signal = self.signal.copy()
+        first  = SignalProcessing.MovingAverage(signal, 50).copy()
+
+        # A single value changed in the middle of the buffer must create a new key.
+        signal.iloc[len(signal)//2 + 7] += 1.0
+        second = SignalProcessing.MovingAverage(signal, 50)
+
+        self.assertEqual(ComputationCache.hits, 0)
+        self.assertEqual(ComputationCache.misses, 2)
+        self.assertFalse(first.equals(second))
+
+
+    def testEviction(self):
+        frequencies, fft = SignalProcessing.RealFFT(self.signal, 1000)
+        size = frequencies.nbytes + fft.nbytes
+
+        # Only one result fits in the budget, so the first result is evicted.
+        ComputationCache.SetMemoryBudget(size)
+        SignalProcessing.RealFFT(self.signal, 2000)
+        SignalProcessing.RealFFT(self.signal, 1000)
+
+        self.assertEqual(ComputationCache.hits, 0)
+        self.assertLessEqual(ComputationCache.GetMemoryUsed(), size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.Decimator                              import Decimator
+
+import unittest
+
+
+class testDecimator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Similar to data set 4: 1024 Hz with a 60 Hz tone on top of a slower signal.
+        np.random.seed(0)
+        cls.samplingFrequency = 1024
+        cls.time              = np.arange(10*cls.samplingFrequency) / cls.samplingFrequency
+        cls.slow              = 2.0*np.sin(2*np.pi*2.0*cls.time) + 5.0
+        cls.fast              = 10.0*np.sin(2*np.pi*60.0*cls.time)
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        self.decimator = Decimator(16)
+
+
+    def testAntiAlias(self):
+        # The new sampling rate is 64 Hz, so the 60 Hz tone is removed instead of aliased to 4 Hz.
+        data      = np.column_stack([self.slow + self.fast, self.slow])
+        decimated = self.decimator.Decimate(data)
+
+        self.assertEqual(decimated.shape, (640, 2))
+        self.assertEqual(self.decimator.originalLength, len(data))
+
+        expected  = self.slow[::16]
+        interior  = slice(20, -20)
+        np.testing.assert_allclose(decimated[interior, 0], expected[interior], atol=0.05)
+        np.testing.assert_allclose(decimated[interior, 1], expected[interior], atol=0.01)
+
+        # The ends of a signal with an offset do not droop.
+        np.testing.assert_allclose(decimated[[0, -1], 1], expected[[0, -1]], atol=0.2)
+
+
+    def testPandas(self):
+        data      = pd.DataFrame({"a" : self.slow, "b" : self.slow}, index=self.time)
+        decimated = self.decimator.Decimate(data)
+        self.assertListEqual(list(decimated.columns), ["a", "b"])
+        np.testing.assert_array_equal(decimated.index, self.time[::16])
+        np.testing.assert_array_equal(decimated.index, self.decimator.DecimateXData(self.time))
+
+        decimated = self.decimator.Decimate(data["a"])
+        self.assertEqual(decimated.name, "a")
+
+
+    def testMapping(self):
+        self.decimator.Decimate(np.zeros(1000))
+
+        np.testing.assert_array_equal(self.decimator.MapIndices([0, 10, 62]), [0, 160, 992])
+
+        sequence       = np.zeros(63, dtype=np.int32)
+        sequence[[10, 62]] = 1
+        mapped         = self.decimator.MapBinaryEventSequence(sequence)
+        self.assertEqual(len(mapped), 1000)
+        np.testing.assert_array_equal(np.flatnonzero(mapped), [160, 992])
+
+        self.assertRaises(Exception, Decimator, 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import unittest
+
+
+class testImportTime(unittest.TestCase):
+    """
+    Checks that compute only workers (e.g., process pool workers that segment data) do not import the plotting and other
+    heavy libraries.  Each import is done in a new interpreter so nothing is already loaded.
+    """
+    heavyModules = ["pandas", "scipy", "matplotlib", "lendres"]
+
+    # The import time allowed for the segmentation worker.  Numpy is imported before timing because the worker needs it to hold the data.
+    maximumTime  = 0.1
+
+
+    @classmethod
+    def setUpClass(cls):
+        cls.hasSegmentSignalPy = importlib.util.find_spec("SegmentSignalPy") is not None
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def Import(self, modules:list) -> dict:
+        """
+        Imports modules in a new interpreter.
+
+        Parameters
+        ----------
+        modules : list
+            The modules to import.
+
+        Returns
+        -------
+        : dict
+            The import time ("time") and the heavy modules that were imported ("loaded").
+        """
+        code = "\n".join([
+            "import json, sys, time",
+            "import numpy",
+            "start = time.perf_counter()",
+            *["import " + module for module in modules],
+            "elapsed = time.perf_counter() - start",
+            "print(json.dumps({'time' : elapsed, 'loaded' : [module for module in " + repr(self.heavyModules) + " if module in sys.modules]}))"
+        ])
+        environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output      = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=environment, check=True).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+
+    def testSignalProcessing(self):
+        result = self.Import(["ddosi.signalprocessing.SignalProcessing"])
+        for module in ["scipy", "matplotlib", "lendres"]:
+            self.assertNotIn(module, result["loaded"])
+
+
+    def testSegmentationWorker(self):
+        if not self.hasSegmentSignalPy:
+            self.skipTest("The SegmentSignalPy extension is not built.")
+
+        result = self.Import(["ddosi.signalprocessing.SegmentSignal", "ddosi.signalprocessing.SignificantZones"])
+        self.assertEqual(result["loaded"], [])
+        self.assertLess(result["time"], self.maximumTime)
+
+
+if __name__ == "__main__":
+    unittest.main()
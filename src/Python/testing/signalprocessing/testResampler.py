@@ -0,0 +1,86 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.Resampler                              import Resampler
+
+import unittest
+
+
+class testResampler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        numberOfPoints = 5000
+
+        # Jittered samples at about 100 Hz with a dropout.
+        time           = np.arange(numberOfPoints) / 100.0 + 0.002*np.random.randn(numberOfPoints)
+        time           = np.sort(time)
+        keep           = (time < 20.0) | (time > 20.5)
+        time           = time[keep]
+
+        cls.data       = pd.DataFrame({
+            "Time"         : time,
+            "Weight on Bit": np.sin(time),
+            "Rotary Speed" : 120.0 + time
+        })
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        self.chunkSize = Resampler.chunkSize
+
+
+    def tearDown(self):
+        Resampler.chunkSize = self.chunkSize
+
+
+    def testLinear(self):
+        resampled, gaps = Resampler.Resample(self.data, 50.0)
+
+        grid = self.data["Time"].iloc[0] + np.arange(len(resampled)) / 50.0
+        np.testing.assert_allclose(resampled["Time"], grid)
+        self.assertLessEqual(resampled["Time"].iloc[-1], self.data["Time"].iloc[-1])
+        for column in ["Weight on Bit", "Rotary Speed"]:
+            np.testing.assert_allclose(resampled[column], np.interp(grid, self.data["Time"], self.data[column]))
+
+        # The dropout is reported.
+        self.assertEqual(len(gaps), 1)
+        self.assertLess(gaps["Start Time"].iloc[0], 20.0)
+        self.assertGreater(gaps["End Time"].iloc[0], 20.5)
+        self.assertEqual(gaps["Grid Points"].iloc[0], np.sum((grid > gaps["Start Time"].iloc[0]) & (grid < gaps["End Time"].iloc[0])))
+
+        resampled, gaps = Resampler.Resample(self.data, 50.0, fillGaps=False)
+        self.assertEqual(resampled["Weight on Bit"].isna().sum(), gaps["Grid Points"].sum())
+
+
+    def testHoldAndDuplicates(self):
+        data = pd.DataFrame({
+            "Time"  : [0.0, 0.25, 0.25, 0.6, np.nan, 1.0],
+            "Value" : [1.0, 2.0, 4.0, np.nan, 7.0, 5.0]
+        })
+
+        resampled, gaps = Resampler.Resample(data, 10.0, method="hold", maximumGap=np.inf)
+        np.testing.assert_allclose(resampled["Time"], np.arange(11) / 10.0)
+        np.testing.assert_allclose(resampled["Value"], [1, 1, 1, 3, 3, 3, np.nan, np.nan, np.nan, np.nan, 5])
+        self.assertEqual(len(gaps), 0)
+
+        resampled, gaps = Resampler.Resample(data, 4.0)
+        np.testing.assert_allclose(resampled["Value"], [1.0, 3.0, np.nan, np.nan, 5.0])
+
+
+    def testChunks(self):
+        whole, gaps         = Resampler.Resample(self.data, 200.0)
+        Resampler.chunkSize = 777
+        chunked, gaps       = Resampler.Resample(self.data, 200.0)
+        pd.testing.assert_frame_equal(whole, chunked)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.RollingStatistics                      import RollingStatistics
+from   ddosi.signalprocessing.DataFrameUtilities                     import DataFrameUtilities
+
+import unittest
+
+
+class testRollingStatistics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        cls.data               = pd.DataFrame(100.0 + 5.0*np.random.randn(5000, 3), columns=["a", "b", "c"])
+        cls.data.loc[700, "b"] = np.nan
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testMatchesPandas(self):
+        windowSizes = [1, 2, 10, 333]
+        results     = RollingStatistics.Calculate(self.data, windowSizes, RollingStatistics.statistics)
+
+        for (statistic, windowSize), calculated in results.items():
+            rolling  = self.data.rolling(windowSize)
+            solution = {
+                "mean" : rolling.mean,
+                "std"  : rolling.std,
+                "min"  : rolling.min,
+                "max"  : rolling.max,
+                "rms"  : lambda : self.data.pow(2).rolling(windowSize).mean().pow(0.5)
+            }[statistic]().to_numpy()
+
+            self.assertTrue(np.allclose(calculated, solution, equal_nan=True, atol=1e-8), msg=statistic+" "+str(windowSize))
+
+
+    def testStandardDeviationOfTrend(self):
+        # A ramp with a large offset and little noise.  The reference is calculated in two passes over some of the windows (pandas has a
+        # relative error of about 1e-3 here).
+        generator   = np.random.default_rng(0)
+        values      = 5000.0 + np.linspace(0.0, 3000.0, 200000) + generator.normal(0.0, 1e-3, 200000)
+        windowSizes = [10, 5000]
+        results     = RollingStatistics.Calculate(values, windowSizes, "std")
+
+        for windowSize in windowSizes:
+            ends     = np.arange(windowSize-1, len(values), 997)
+            solution = [np.std(values[end-windowSize+1:end+1], ddof=1) for end in ends]
+            self.assertTrue(np.isnan(results[("std", windowSize)][:windowSize-1]).all())
+            np.testing.assert_allclose(results[("std", windowSize)][ends], solution, rtol=1e-8)
+
+
+    def testOneDimensionalFloat32(self):
+        results = RollingStatistics.Calculate(self.data["a"].to_numpy(), 10, "mean", dtype=np.float32)
+        result  = results[("mean", 10)]
+
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.shape, (len(self.data),))
+
+
+    def testOutputModes(self):
+        data                        = self.data.copy()
+        frame, newNames, suffixes   = DataFrameUtilities.RollingStatistics(self.data, ["a", "b", "c"], [2, 10], output="frame")
+        block, names, blockSuffixes = DataFrameUtilities.RollingStatistics(self.data, ["a", "b", "c"], [2, 10], output="block")
+        result, names, suffixes     = DataFrameUtilities.RollingStatistics(data, ["a", "b", "c"], [2, 10])
+
+        self.assertIs(result, data)
+        self.assertEqual(names, newNames)
+        self.assertEqual(list(block.columns), newNames)
+        self.assertEqual(list(self.data.columns), ["a", "b", "c"])
+        pd.testing.assert_frame_equal(data, frame)
+
+        # Running a function again replaces the columns where they are in every mode.
+        frame, names, suffixes      = DataFrameUtilities.MovingAverage(frame, ["a"], 2, output="frame")
+        frame, names, suffixes      = DataFrameUtilities.MovingAverage(frame, ["a"], 2, output="frame")
+        data, names, suffixes       = DataFrameUtilities.MovingAverage(data, ["a"], 2)
+        data, names, suffixes       = DataFrameUtilities.MovingAverage(data, ["a"], 2)
+        self.assertEqual(list(frame.columns), list(data.columns))
+        self.assertEqual(list(frame.columns), ["a", "b", "c"] + newNames)
+        pd.testing.assert_frame_equal(data, frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
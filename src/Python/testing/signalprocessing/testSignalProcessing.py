@@ -0,0 +1,64 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   ddosi.signalprocessing.SignalProcessing                       import SignalProcessing
+
+import unittest
+
+
+class testSignalProcessing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        cls.data = pd.DataFrame(np.random.randn(10007, 3), columns=["a", "b", "c"])
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testRealFFTBlock(self):
+        frequencies, amplitudes = SignalProcessing.RealFFTBlock(self.data, 1000, length="none")
+        self.assertEqual(amplitudes.shape, (len(frequencies), 3))
+
+        for i, column in enumerate(self.data.columns):
+            solutionFrequencies, solution = SignalProcessing.RealFFT(self.data[column], 1000)
+            self.assertTrue(np.allclose(amplitudes[:, i], solution))
+            self.assertTrue(np.allclose(frequencies[:-1], solutionFrequencies))
+
+        # Cropping and padding use lengths with only small prime factors.
+        frequencies, amplitudes = SignalProcessing.RealFFTBlock(self.data, 1000, length="crop")
+        self.assertEqual(amplitudes.shape, (10000//2+1, 3))
+        self.assertTrue(np.allclose(amplitudes[:, 0], np.abs(np.fft.rfft(self.data["a"].to_numpy()[:10000]))))
+
+        frequencies, amplitudes = SignalProcessing.RealFFTBlock(self.data["a"], 1000, length="pad", dtype=np.float32)
+        self.assertEqual(amplitudes.shape, (10125//2+1,))
+        self.assertEqual(amplitudes.dtype, np.float32)
+
+        # Numpy integers are accepted as the length.
+        frequencies, amplitudes = SignalProcessing.RealFFTBlock(self.data["a"], 1000, length=np.int64(4096))
+        self.assertEqual(amplitudes.shape, (4096//2+1,))
+
+
+    def testPreviousFastLength(self):
+        solution = 1
+        for n in range(1, 2000):
+            remainder = n
+            for prime in (2, 3, 5):
+                while remainder % prime == 0:
+                    remainder //= prime
+            if remainder == 1:
+                solution = n
+            self.assertEqual(SignalProcessing._PreviousFastLength(n), solution)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+from   matplotlib                                                    import mlab
+
+from   ddosi.signalprocessing.Spectrogram                            import Spectrogram
+from   ddosi.signalprocessing.ComputationCache                       import ComputationCache
+
+import unittest
+
+
+class testSpectrogram(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        cls.samplingFrequency = 1000.0
+        cls.signal            = np.random.randn(100000)
+        cls.solution, cls.solutionFrequencies, cls.solutionTimes = mlab.specgram(cls.signal, Fs=cls.samplingFrequency)
+
+        # Use small batches so the signal is split over several batches.
+        Spectrogram.batchLength = 100
+
+
+    @classmethod
+    def tearDownClass(cls):
+        Spectrogram.batchLength = 1024
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        ComputationCache.Clear()
+
+
+    def testMatchesSpecgram(self):
+        frequencies, times, spectrum = Spectrogram.Calculate(self.signal, self.samplingFrequency, numberOfTimeBins=None)
+
+        self.assertTrue(np.allclose(frequencies, self.solutionFrequencies))
+        self.assertTrue(np.allclose(times, self.solutionTimes))
+        self.assertTrue(np.allclose(spectrum, 10*np.log10(self.solution)))
+
+
+    def testPooling(self):
+        binEdges = np.linspace(0, self.solution.shape[1], 101).round().astype(np.int64)[:-1]
+
+        frequencies, times, spectrum = Spectrogram.Calculate(self.signal, self.samplingFrequency, numberOfTimeBins=100, pooling="max")
+        self.assertEqual(spectrum.shape, (len(frequencies), 100))
+        self.assertTrue(np.allclose(spectrum, 10*np.log10(np.maximum.reduceat(self.solution, binEdges, axis=1))))
+
+        frequencies, times, spectrum = Spectrogram.Calculate(self.signal, self.samplingFrequency, numberOfTimeBins=100, pooling="mean")
+        solution = np.add.reduceat(self.solution, binEdges, axis=1) / np.diff(np.append(binEdges, self.solution.shape[1]))
+        self.assertTrue(np.allclose(spectrum, 10*np.log10(solution)))
+
+        # The second call is served from the cache.
+        hits = ComputationCache.hits
+        Spectrogram.Calculate(self.signal, self.samplingFrequency, numberOfTimeBins=100, pooling="mean")
+        self.assertEqual(ComputationCache.hits, hits+1)
+
+
+if __name__ == "__main__":
+    unittest.main()
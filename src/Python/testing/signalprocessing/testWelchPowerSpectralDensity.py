@@ -0,0 +1,64 @@
+"""
+Created on October 19, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+from   matplotlib                                                    import mlab
+
+from   ddosi.signalprocessing.WelchPowerSpectralDensity              import WelchPowerSpectralDensity
+from   ddosi.signalprocessing.SignalProcessing                       import SignalProcessing
+
+import unittest
+
+
+class testWelchPowerSpectralDensity(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        cls.samplingFrequency = 1000.0
+        cls.data              = np.random.randn(20011, 3)
+
+
+    def setUp(self):
+        """
+        Set up function that runs before each test.
+        """
+        pass
+
+
+    def testMatchesMlab(self):
+        for segmentLength, overlap in [(256, 0), (512, 128)]:
+            frequencies, psd = WelchPowerSpectralDensity(self.samplingFrequency, segmentLength, overlap).Calculate(self.data)
+
+            for i in range(self.data.shape[1]):
+                solution, solutionFrequencies = mlab.psd(self.data[:, i], NFFT=segmentLength, Fs=self.samplingFrequency, noverlap=overlap)
+                self.assertTrue(np.allclose(frequencies, solutionFrequencies))
+                self.assertTrue(np.allclose(psd[:, i], solution, rtol=1e-10))
+
+        # Signals shorter than a segment are zero padded.
+        frequencies, psd = WelchPowerSpectralDensity(self.samplingFrequency).Calculate(self.data[:100, 0])
+        self.assertTrue(np.allclose(psd, mlab.psd(self.data[:100, 0], Fs=self.samplingFrequency)[0]))
+
+
+    def testIncrementalMatchesBatch(self):
+        engine       = WelchPowerSpectralDensity(self.samplingFrequency, 256, 64)
+        frequencies, solution = engine.Calculate(self.data)
+
+        engine.Reset()
+        for start in range(0, len(self.data), 1001):
+            engine.Update(self.data[start:start+1001])
+        frequencies, psd = engine.GetEstimate()
+
+        self.assertTrue(np.allclose(psd, solution))
+
+
+    def testSignalProcessingDecibels(self):
+        frequencies, psd = SignalProcessing.PowerSpectralDensity(pd.Series(self.data[:, 0]), self.samplingFrequency)
+        solution         = 10*np.log10(mlab.psd(self.data[:, 0], Fs=self.samplingFrequency)[0])
+        self.assertTrue(np.allclose(psd, solution))
+
+
+if __name__ == "__main__":
+    unittest.main()